@@ -0,0 +1,101 @@
+"""Benchmark writing the full aws-eb manifest: direct writes vs. a transaction.
+
+Reports staging and commit time separately for a new project (one
+directory rename) and for an update replacing every file (per-file
+renames with rollback links), with and without fsync.
+
+    python benchmarks/bench_commit.py [--dir PATH] [--repeat N]
+"""
+
+import argparse
+import shutil
+import stat
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from djsuite.manifest import Platform, get_manifest
+from djsuite.renderer import render_all
+from djsuite.writer import Transaction
+
+CONTEXT = {
+    "project_name": "benchproject",
+    "python_version": "3.12",
+    "django_version": "5.2",
+    "drf_version": "3.16",
+    "author": "Bench",
+    "description": "Benchmark project",
+    "platform": "aws-eb",
+}
+
+
+def direct_write(project_path, rendered):
+    """The pre-transaction write loop."""
+    for output_path, content in sorted(rendered.items()):
+        full_path = project_path / output_path
+        full_path.parent.mkdir(parents=True, exist_ok=True)
+        full_path.write_text(content, encoding="utf-8")
+        if output_path.endswith(".sh"):
+            full_path.chmod(full_path.stat().st_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
+
+
+def transactional(project_path, rendered, new_project, fsync):
+    txn = Transaction(project_path, new_project=new_project, fsync=fsync)
+    start = time.perf_counter()
+    for _ in txn.write_all(sorted(rendered.items())):
+        pass
+    staged = time.perf_counter()
+    txn.commit()
+    return staged - start, time.perf_counter() - staged
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--dir", default=None, help="Directory to write into (default: system temp dir)")
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args(argv)
+
+    rendered = render_all(get_manifest(Platform.AWS_EB), CONTEXT)
+    print(f"{len(rendered)} files, best of {args.repeat} (ms):")
+    print(f"  {'scenario':38s} {'stage':>8s} {'commit':>8s} {'total':>8s}")
+
+    with tempfile.TemporaryDirectory(dir=args.dir) as root:
+        root = Path(root)
+
+        def best(run):
+            results = []
+            for n in range(args.repeat):
+                project = root / f"p{n}"
+                results.append(run(project))
+                shutil.rmtree(project)
+            return min(results, key=lambda r: r[0] + r[1])
+
+        def direct(project):
+            start = time.perf_counter()
+            direct_write(project, rendered)
+            return 0.0, time.perf_counter() - start
+
+        def update(fsync):
+            def run(project):
+                direct_write(project, rendered)
+                return transactional(project, rendered, False, fsync)
+
+            return run
+
+        scenarios = [
+            ("generate: direct writes", direct),
+            ("generate: transaction, no fsync", lambda p: transactional(p, rendered, True, False)),
+            ("generate: transaction, fsync", lambda p: transactional(p, rendered, True, True)),
+            ("update all: direct writes", lambda p: (direct_write(p, rendered), direct(p))[1]),
+            ("update all: transaction, no fsync", update(False)),
+            ("update all: transaction, fsync", update(True)),
+        ]
+        for label, run in scenarios:
+            stage, commit = best(run)
+            print(f"  {label:38s} {stage * 1000:8.2f} {commit * 1000:8.2f} {(stage + commit) * 1000:8.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,78 @@
+"""Benchmark diff statistics on generated files of 1k to 100k lines.
+
+Compares the old difflib.unified_diff line counting against
+textdiff.change_counts on YAML/lockfile-like input (many repeated lines)
+with about 1% of lines edited.
+
+    python benchmarks/bench_diff.py [--sizes 1000 10000 100000] [--skip-difflib-over N]
+"""
+
+import argparse
+import difflib
+import random
+import sys
+import time
+
+from djsuite.textdiff import change_counts
+
+
+def difflib_counts(old_lines, new_lines):
+    """The previous diff_summary implementation."""
+    diff = list(difflib.unified_diff(old_lines, new_lines, lineterm=""))
+    added = sum(1 for line in diff if line.startswith("+") and not line.startswith("+++"))
+    removed = sum(1 for line in diff if line.startswith("-") and not line.startswith("---"))
+    return added, removed
+
+
+def make_files(size, seed=0):
+    """Build a lockfile-like file and a copy with ~1% of lines edited."""
+    rng = random.Random(seed)
+    old = []
+    for n in range(size // 5):
+        old += [
+            "[[package]]\n",
+            f'name = "pkg-{n % 400}"\n',
+            f'version = "{rng.randint(0, 9)}.{rng.randint(0, 20)}.0"\n',
+            'groups = ["default"]\n',
+            "\n",
+        ]
+    new = list(old)
+    for _ in range(max(1, size // 100)):
+        i = rng.randrange(len(new))
+        op = rng.random()
+        if op < 0.4:
+            new[i] = f'version = "{rng.randint(10, 99)}.0.0"\n'
+        elif op < 0.7:
+            new.insert(i, f'extra = "{rng.random()}"\n')
+        else:
+            del new[i]
+    return old, new
+
+
+def _time(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - start, result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    parser.add_argument("--skip-difflib-over", type=int, default=100_000, help="Skip difflib for larger inputs")
+    args = parser.parse_args(argv)
+
+    print(f"{'lines':>8s}  {'difflib':>12s}  {'change_counts':>14s}  counts")
+    for size in args.sizes:
+        old, new = make_files(size)
+        new_time, new_counts = _time(change_counts, old, new)
+        if size <= args.skip_difflib_over:
+            old_time, old_counts = _time(difflib_counts, old, new)
+            old_col = f"{old_time * 1000:10.1f}ms"
+        else:
+            old_col, old_counts = f"{'skipped':>12s}", None
+        print(f"{size:8d}  {old_col}  {new_time * 1000:12.1f}ms  {new_counts} (difflib: {old_counts})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,91 @@
+"""Benchmark render_all on the full aws-eb manifest.
+
+Compares the old per-template environment against the shared environment,
+and a cold process with and without the on-disk bytecode cache.
+
+    python benchmarks/bench_render.py [--repeat N]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from djsuite.manifest import Platform, get_manifest
+from djsuite.renderer import _get_template_dir, create_environment, get_environment, render_all
+
+CONTEXT = {
+    "project_name": "benchproject",
+    "python_version": "3.12",
+    "django_version": "5.2",
+    "drf_version": "3.16",
+    "author": "Bench",
+    "description": "Benchmark project",
+    "platform": "aws-eb",
+}
+
+COLD_RENDER = "import time; t = time.perf_counter(); {setup}; print(time.perf_counter() - t)"
+COLD_SETUP = (
+    "from djsuite.manifest import Platform, get_manifest; "
+    "from djsuite.renderer import render_all; "
+    "render_all(get_manifest(Platform.AWS_EB), {context!r})"
+)
+
+
+def render_all_per_template_env(manifest, context):
+    """The pre-shared-environment behaviour: a fresh Environment per template."""
+    results = {}
+    for (dir_prefix, template_path), (output_path, _group) in manifest.items():
+        full_template_path = f"{dir_prefix}/{template_path}"
+        if template_path.endswith(".j2"):
+            results[output_path] = create_environment().get_template(full_template_path).render(**context)
+        else:
+            results[output_path] = (_get_template_dir() / full_template_path).read_text(encoding="utf-8")
+    return results
+
+
+def _best_of(func, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def _cold_process(env):
+    code = COLD_RENDER.format(setup=COLD_SETUP.format(context=CONTEXT))
+    out = subprocess.run([sys.executable, "-c", code], env=env, capture_output=True, text=True, check=True)
+    return float(out.stdout.strip())
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    manifest = get_manifest(Platform.AWS_EB)
+    get_environment.cache_clear()
+
+    before = _best_of(lambda: render_all_per_template_env(manifest, CONTEXT), args.repeat)
+    after = _best_of(lambda: render_all(manifest, CONTEXT), args.repeat)
+    print(f"render_all, {len(manifest)} files (best of {args.repeat}):")
+    print(f"  environment per template   {before * 1000:8.2f} ms")
+    print(f"  shared environment         {after * 1000:8.2f} ms  ({before / after:.1f}x)")
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        env = dict(os.environ, DJSUITE_CACHE_DIR=cache_dir)
+        no_cache = min(_cold_process(env) for _ in range(3))
+        env["DJSUITE_BYTECODE_CACHE"] = "1"
+        _cold_process(env)  # populate the cache
+        warm_cache = min(_cold_process(env) for _ in range(3))
+    print("render_all, first call in a fresh process:")
+    print(f"  no bytecode cache          {no_cache * 1000:8.2f} ms")
+    print(f"  warm bytecode cache        {warm_cache * 1000:8.2f} ms  ({no_cache / warm_cache:.1f}x)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,265 @@
+"""Benchmark suite: render, diff, backup, generate and update end to end.
+
+Runs each benchmark on the real aws-eb manifest and on synthetic manifests
+scaled to N files (real templates copied under new names), in one or more
+target directories such as a tmpfs and a regular disk. Results are saved
+as JSON; ``compare`` flags benchmarks that got slower than a baseline by
+more than a threshold.
+
+    python benchmarks/suite.py run [-o results.json] [--scales aws-eb 1000 10000]
+                                   [--target tmpfs=/dev/shm --target disk=.] [--repeat N]
+    python benchmarks/suite.py compare BASELINE.json RESULTS.json [--threshold 0.10]
+
+``compare`` exits with status 1 if any benchmark regressed.
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform as platform_module
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from djsuite import __version__, manifest, renderer
+from djsuite.backup import BACKUP_DIR, backup_files
+from djsuite.diff import diff_summary
+from djsuite.generator import generate
+from djsuite.index import load_index
+from djsuite.manifest import Platform, UpdateGroup, get_manifest
+from djsuite.renderer import render_all
+from djsuite.updater import run_update
+
+CONTEXT = {
+    "project_name": "benchproject",
+    "python_version": "3.12",
+    "django_version": "5.2",
+    "drf_version": "3.16",
+    "author": "Bench",
+    "description": "Benchmark project",
+    "platform": "aws-eb",
+}
+ALL_GROUPS = {UpdateGroup.CI, UpdateGroup.DOCKER, UpdateGroup.INFRA, UpdateGroup.ROOT}
+# Share of files edited on disk before the diff and update benchmarks.
+EDIT_RATIO = 0.1
+FILES_PER_DIR = 100
+
+
+@contextlib.contextmanager
+def synthetic_manifest(size, work_dir):
+    """Scale the aws-eb manifest to ``size`` files.
+
+    Copies the shipped templates into ``work_dir`` and adds copies of the
+    real templates, cycled, under common/synthetic/ until the manifest has
+    ``size`` entries. The renderer and manifest are pointed at the copy for
+    the duration of the block.
+    """
+    real_dir = Path(str(renderer._get_template_dir()))
+    template_dir = Path(work_dir) / "templates"
+    shutil.copytree(real_dir, template_dir)
+    real = sorted(get_manifest(Platform.AWS_EB).items(), key=lambda item: item[1][0])
+    extra = {}
+    for n in range(max(0, size - len(real))):
+        (dir_prefix, template_path), _value = real[n % len(real)]
+        name = template_path.replace("/", "_")
+        synthetic_path = f"synthetic/d{n // FILES_PER_DIR:03d}/f{n:05d}_{name}"
+        target = template_dir / "common" / synthetic_path
+        target.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(real_dir / dir_prefix / template_path, target)
+        extra[synthetic_path] = (synthetic_path.removesuffix(".j2"), UpdateGroup.ROOT)
+
+    original_dir = renderer._get_template_dir
+    renderer._get_template_dir = lambda: template_dir
+    manifest.COMMON_MANIFEST.update(extra)
+    _reset_renderer()
+    try:
+        yield
+    finally:
+        for key in extra:
+            del manifest.COMMON_MANIFEST[key]
+        renderer._get_template_dir = original_dir
+        _reset_renderer()
+
+
+def _reset_renderer():
+    manifest.get_manifest.cache_clear()
+    renderer._load_bundle.cache_clear()
+    renderer.get_environment.cache_clear()
+    renderer.get_render_cache.cache_clear()
+
+
+def _edit_files(project_dir, ratio=EDIT_RATIO):
+    """Append a line to every 1/ratio-th tracked file, as a user edit would."""
+    paths = sorted(load_index(project_dir))
+    step = max(1, round(1 / ratio))
+    for output_path in paths[::step]:
+        with open(Path(project_dir) / output_path, "a", encoding="utf-8") as f:
+            f.write("# local edit\n")
+
+
+def _measure(func, repeat, setup=None):
+    """Run func() ``repeat`` times, calling setup() untimed before each run."""
+    timings = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            func()
+            timings.append(time.perf_counter() - start)
+    return timings
+
+
+def _generate(output_dir):
+    return generate(CONTEXT, str(output_dir), Platform.AWS_EB, offline=True)
+
+
+def run_scale(scale_label, targets, repeat):
+    """Run every benchmark for one manifest scale; return {benchmark name: timings}."""
+    results = {}
+    manifest_entries = get_manifest(Platform.AWS_EB)
+    render_all(manifest_entries, CONTEXT)  # warm the environment
+    results[f"render_all[{scale_label}]"] = _measure(lambda: render_all(manifest_entries, CONTEXT), repeat)
+    rendered = render_all(manifest_entries, CONTEXT)
+
+    for target_label, target_path in targets:
+        label = f"{scale_label},{target_label}"
+        with tempfile.TemporaryDirectory(dir=target_path, prefix="djsuite-bench-") as root:
+            root = Path(root)
+            out = root / "generate"
+            results[f"generate[{label}]"] = _measure(lambda: _generate(out), repeat, setup=lambda: shutil.rmtree(out, ignore_errors=True))
+
+            with contextlib.redirect_stdout(io.StringIO()):
+                _generate(root)
+            project = root / CONTEXT["project_name"]
+            _edit_files(project)
+            index = load_index(project)
+            results[f"diff_summary[{label}]"] = _measure(
+                lambda: [diff_summary(project, path, content, index.get(path)) for path, content in rendered.items()], repeat
+            )
+
+            paths = list(rendered)
+            results[f"backup_files[{label}]"] = _measure(
+                lambda: backup_files(project, paths, quiet=True),
+                repeat,
+                setup=lambda: shutil.rmtree(project / BACKUP_DIR, ignore_errors=True),
+            )
+
+            def edit_and_clear_backups():
+                _edit_files(project)
+                shutil.rmtree(project / BACKUP_DIR, ignore_errors=True)
+
+            results[f"run_update[{label}]"] = _measure(lambda: run_update(project, ALL_GROUPS), repeat, setup=edit_and_clear_backups)
+    return results
+
+
+def _parse_target(value):
+    label, sep, path = value.partition("=")
+    if not sep or not label or not path:
+        raise argparse.ArgumentTypeError(f"expected LABEL=PATH, got {value!r}")
+    return label, path
+
+
+def _default_targets():
+    targets = []
+    if os.path.isdir("/dev/shm"):
+        targets.append(("tmpfs", "/dev/shm"))
+    targets.append(("disk", os.getcwd()))
+    return targets
+
+
+def run(args):
+    os.environ["DJSUITE_NO_BUNDLE"] = "1"  # scaled manifests render from copied sources
+    targets = args.target or _default_targets()
+    results = {}
+    for scale in args.scales:
+        print(f"scale {scale}...", file=sys.stderr)
+        if scale == "aws-eb":
+            results.update(run_scale(scale, targets, args.repeat))
+        else:
+            with tempfile.TemporaryDirectory(prefix="djsuite-bench-templates-") as work_dir:
+                with synthetic_manifest(int(scale), work_dir):
+                    results.update(run_scale(scale, targets, args.repeat))
+
+    report = {
+        "meta": {
+            "djsuite_version": __version__,
+            "python": platform_module.python_version(),
+            "machine": platform_module.platform(),
+            "created_at": time.time(),
+            "repeat": args.repeat,
+            "targets": dict(targets),
+        },
+        "benchmarks": {
+            name: {"min": min(timings), "median": statistics.median(timings), "runs": len(timings)} for name, timings in results.items()
+        },
+    }
+    Path(args.output).write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+
+    print(f"{'benchmark':40s} {'min':>10s} {'median':>10s}")
+    for name, stats in report["benchmarks"].items():
+        print(f"{name:40s} {stats['min'] * 1000:8.2f}ms {stats['median'] * 1000:8.2f}ms")
+    print(f"\nSaved to {args.output}")
+    return 0
+
+
+def compare(args):
+    baseline = json.loads(Path(args.baseline).read_text(encoding="utf-8"))["benchmarks"]
+    current = json.loads(Path(args.results).read_text(encoding="utf-8"))["benchmarks"]
+    regressions = []
+    print(f"{'benchmark':40s} {'baseline':>10s} {'current':>10s} {'change':>8s}")
+    for name in sorted(baseline.keys() | current.keys()):
+        if name not in baseline or name not in current:
+            where = "baseline" if name not in baseline else "results"
+            print(f"{name:40s} (not in {where})")
+            continue
+        before, after = baseline[name][args.stat], current[name][args.stat]
+        change = after / before - 1
+        flag = ""
+        if change > args.threshold:
+            flag = "  REGRESSION"
+            regressions.append(name)
+        print(f"{name:40s} {before * 1000:8.2f}ms {after * 1000:8.2f}ms {change:+7.1%}{flag}")
+
+    if regressions:
+        print(f"\n{len(regressions)} benchmark(s) regressed by more than {args.threshold:.0%}.")
+        return 1
+    print(f"\nNo regressions beyond {args.threshold:.0%}.")
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="Run the benchmarks and save the results as JSON")
+    run_parser.add_argument("-o", "--output", default="bench-results.json", help="Results file (default: bench-results.json)")
+    run_parser.add_argument("--scales", nargs="+", default=["aws-eb", "1000", "10000"], help="'aws-eb' and/or file counts")
+    run_parser.add_argument(
+        "--target",
+        action="append",
+        type=_parse_target,
+        metavar="LABEL=PATH",
+        help="Directory to run file benchmarks in (repeatable; default: tmpfs=/dev/shm and disk=.)",
+    )
+    run_parser.add_argument("--repeat", type=int, default=5)
+    run_parser.set_defaults(func=run)
+
+    compare_parser = commands.add_parser("compare", help="Compare results against a baseline")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("results")
+    compare_parser.add_argument("--threshold", type=float, default=0.10, help="Allowed slowdown (default: 0.10)")
+    compare_parser.add_argument("--stat", choices=["min", "median"], default="min")
+    compare_parser.set_defaults(func=compare)
+
+    args = parser.parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,169 @@
+"""Streaming tar/zip output for generate --output-archive.
+
+Files are added one at a time as they are rendered, so memory stays
+bounded by the render pipeline's in-flight window rather than the whole
+project. The archive is reproducible: entries appear in the order they are
+added, with a fixed timestamp (SOURCE_DATE_EPOCH if set), root ownership
+and modes that depend only on the path.
+"""
+
+import gzip
+import io
+import os
+import sys
+import tarfile
+import tempfile
+import time
+import zipfile
+from pathlib import Path
+
+from djsuite.writer import _umask
+
+FORMATS = ("tar.gz", "tar", "zip")
+
+# 1980-01-01T00:00:00Z, the earliest time a zip entry can hold.
+DEFAULT_MTIME = 315532800
+
+FILE_MODE = 0o644
+EXEC_MODE = 0o755
+DIR_MODE = 0o755
+
+
+def format_for(target):
+    """Infer the archive format from a file name; stdout ("-") defaults to tar.gz."""
+    name = str(target).lower()
+    if name.endswith(".zip"):
+        return "zip"
+    if name.endswith(".tar"):
+        return "tar"
+    return "tar.gz"
+
+
+def archive_mtime():
+    """Timestamp for every entry: SOURCE_DATE_EPOCH, or DEFAULT_MTIME."""
+    value = os.environ.get("SOURCE_DATE_EPOCH")
+    return max(int(value), DEFAULT_MTIME) if value else DEFAULT_MTIME
+
+
+def file_mode(output_path):
+    return EXEC_MODE if output_path.endswith(".sh") else FILE_MODE
+
+
+class ArchiveWriter:
+    """Write files into a tar.gz, tar or zip stream.
+
+    Args:
+        fileobj: binary, write-only stream (need not be seekable)
+        fmt: one of FORMATS
+        root: directory name every entry is placed under
+        mtime: timestamp for every entry (default: archive_mtime())
+    """
+
+    def __init__(self, fileobj, fmt, root, mtime=None):
+        if fmt not in FORMATS:
+            raise ValueError(f"Unknown archive format: {fmt!r}. Choose from: {list(FORMATS)}")
+        self.fmt = fmt
+        self.root = root
+        self.mtime = archive_mtime() if mtime is None else mtime
+        self._dirs = set()
+        self._gzip = None
+        if fmt == "zip":
+            self._zip = zipfile.ZipFile(fileobj, "w", compression=zipfile.ZIP_DEFLATED)
+        else:
+            if fmt == "tar.gz":
+                # GzipFile rather than mode "w|gz": the tarfile stream stamps the
+                # gzip header with the current time.
+                fileobj = self._gzip = gzip.GzipFile(filename="", mode="wb", fileobj=fileobj, mtime=self.mtime)
+            self._tar = tarfile.open(fileobj=fileobj, mode="w|", format=tarfile.PAX_FORMAT)
+        self._add_dir(root)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+    def _add_dir(self, name):
+        if name in self._dirs:
+            return
+        parent = name.rpartition("/")[0]
+        if parent:
+            self._add_dir(parent)
+        self._dirs.add(name)
+        if self.fmt == "zip":
+            info = zipfile.ZipInfo(f"{name}/", date_time=time.gmtime(self.mtime)[:6])
+            info.create_system = 3
+            info.external_attr = ((0o040000 | DIR_MODE) << 16) | 0x10
+            self._zip.writestr(info, b"")
+        else:
+            self._tar.addfile(self._tarinfo(name, tarfile.DIRTYPE, DIR_MODE))
+
+    def _tarinfo(self, name, kind, mode, size=0):
+        info = tarfile.TarInfo(name)
+        info.type = kind
+        info.mode = mode
+        info.size = size
+        info.mtime = self.mtime
+        info.uid = info.gid = 0
+        info.uname = info.gname = ""
+        return info
+
+    def add(self, output_path, data, mode=None):
+        """Add one file (bytes) at root/output_path; its parent directories are added first."""
+        name = f"{self.root}/{output_path}"
+        mode = file_mode(output_path) if mode is None else mode
+        self._add_dir(name.rpartition("/")[0])
+        if self.fmt == "zip":
+            info = zipfile.ZipInfo(name, date_time=time.gmtime(self.mtime)[:6])
+            info.create_system = 3
+            info.external_attr = (0o100000 | mode) << 16
+            info.compress_type = zipfile.ZIP_DEFLATED
+            self._zip.writestr(info, data)
+        else:
+            self._tar.addfile(self._tarinfo(name, tarfile.REGTYPE, mode, len(data)), io.BytesIO(data))
+
+    def close(self):
+        if self.fmt == "zip":
+            self._zip.close()
+        else:
+            self._tar.close()
+            if self._gzip is not None:
+                self._gzip.close()
+
+
+class ArchiveTarget:
+    """Context manager yielding a binary stream for "-" (stdout) or a file path.
+
+    A file is written to a temporary name beside it and renamed into place
+    on success, so a failed run never leaves a truncated archive.
+    """
+
+    def __init__(self, target):
+        self.target = target
+        self._tmp = None
+        self._stream = None
+
+    def __enter__(self):
+        if self.target == "-":
+            self._stream = sys.stdout.buffer
+        else:
+            path = Path(self.target)
+            fd, self._tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+            self._stream = os.fdopen(fd, "wb")
+        return self._stream
+
+    def __exit__(self, exc_type, exc, tb):
+        try:
+            if self._tmp is None:
+                self._stream.flush()
+            else:
+                self._stream.close()
+        finally:
+            if self._tmp is not None:
+                if exc_type is None:
+                    os.chmod(self._tmp, 0o666 & ~_umask())
+                    os.replace(self._tmp, self.target)
+                else:
+                    os.unlink(self._tmp)
+        return False
@@ -1,35 +1,255 @@
-"""Timestamped backup before overwrite."""
+"""Content-addressed backups before overwrite.
 
+Layout under ``<project>/.djsuite-backup/``::
+
+    objects/ab/cdef...      one read-only copy per distinct content (sha256)
+    <run_id>/.djsuite-run.json
+                            which paths the run saved, with hash and mode
+    <run_id>/<path>         browsable copy, hard-linked to its object
+
+Objects are cloned from the source with a copy-on-write reflink where the
+filesystem supports it, and copied otherwise. Run directories written
+before the object store existed (plain copies, no run manifest) are still
+listed, restored and pruned.
+"""
+
+import hashlib
+import json
+import os
 import shutil
+import sys
+import tempfile
+import time
 from datetime import datetime
 from pathlib import Path
 
+BACKUP_DIR = ".djsuite-backup"
+RUN_MANIFEST = ".djsuite-run.json"
+TIMESTAMP_FORMAT = "%Y%m%d_%H%M%S"
+
+# Linux ioctl for a copy-on-write clone (btrfs, XFS, bcachefs, ...)
+FICLONE = 0x40049409
+
+
+def _reflink(src, dst):
+    """Clone src to dst copy-on-write; return False if the filesystem can't."""
+    if sys.platform != "linux":
+        return False
+    import fcntl
+
+    with open(src, "rb") as s, open(dst, "wb") as d:
+        try:
+            fcntl.ioctl(d.fileno(), FICLONE, s.fileno())
+        except OSError:
+            return False
+    return True
+
+
+def _store_object(backup_root, src, data):
+    """Store data (read from src) in the object store unless already present."""
+    digest = hashlib.sha256(data).hexdigest()
+    obj = backup_root / "objects" / digest[:2] / digest[2:]
+    if not obj.exists():
+        obj.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=obj.parent, prefix=".tmp-")
+        os.close(fd)
+        try:
+            if not _reflink(src, tmp):
+                Path(tmp).write_bytes(data)
+            os.chmod(tmp, 0o444)
+            os.replace(tmp, obj)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+    return digest, obj
+
+
+def _link_or_copy(obj, dst):
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        os.link(obj, dst)
+    except OSError:
+        shutil.copyfile(obj, dst)
+
 
-def backup_files(project_dir, files_to_update):
-    """Create timestamped backup of files that will be updated.
+def _new_run_dir(backup_root):
+    """Create a fresh run directory; never reuses one from the same second."""
+    backup_root.mkdir(parents=True, exist_ok=True)
+    timestamp = datetime.now().strftime(TIMESTAMP_FORMAT)
+    run_dir = backup_root / timestamp
+    suffix = 1
+    while True:
+        try:
+            run_dir.mkdir()
+            return run_dir
+        except FileExistsError:
+            suffix += 1
+            run_dir = backup_root / f"{timestamp}_{suffix}"
+
+
+def backup_files(project_dir, files_to_update, quiet=False):
+    """Back up files that will be updated into a new run.
 
     Args:
         project_dir: Path to the project root
         files_to_update: list of relative output paths that will be overwritten
+        quiet: if True, don't print where the backup went
 
     Returns:
-        Path to the backup directory, or None if no files were backed up
+        Path to the run directory, or None if no files were backed up
     """
     project_path = Path(project_dir)
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    backup_dir = project_path / ".djsuite-backup" / timestamp
+    backup_root = project_path / BACKUP_DIR
 
-    backed_up = []
+    entries = {}
+    stored = {}
     for rel_path in files_to_update:
         src = project_path / rel_path
-        if src.exists():
-            dst = backup_dir / rel_path
-            dst.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(src, dst)
-            backed_up.append(rel_path)
+        try:
+            data = src.read_bytes()
+            st = src.stat()
+        except FileNotFoundError:
+            continue
+        digest, obj = _store_object(backup_root, src, data)
+        entries[rel_path] = {"sha256": digest, "mode": st.st_mode & 0o7777}
+        stored[rel_path] = obj
+
+    if not entries:
+        return None
+
+    backup_dir = _new_run_dir(backup_root)
+    for rel_path, obj in stored.items():
+        _link_or_copy(obj, backup_dir / rel_path)
+    manifest = {"run_id": backup_dir.name, "created_at": time.time(), "files": dict(sorted(entries.items()))}
+    (backup_dir / RUN_MANIFEST).write_text(json.dumps(manifest, indent=2) + "\n", encoding="utf-8")
+
+    if not quiet:
+        print(f"Backed up {len(entries)} file(s) to {backup_dir}")
+    return backup_dir
+
+
+def _legacy_files(run_dir):
+    return {p.relative_to(run_dir).as_posix(): None for p in run_dir.rglob("*") if p.is_file()}
+
+
+def list_runs(project_dir):
+    """Return backup runs, oldest first.
+
+    Returns:
+        list of dicts with "run_id", "created_at", "path" and "files"
+        (path -> object entry, or None for pre-object-store runs)
+    """
+    backup_root = Path(project_dir) / BACKUP_DIR
+    if not backup_root.is_dir():
+        return []
+    runs = []
+    for run_dir in backup_root.iterdir():
+        if not run_dir.is_dir() or run_dir.name == "objects":
+            continue
+        manifest_path = run_dir / RUN_MANIFEST
+        if manifest_path.exists():
+            manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+            created_at, files = manifest["created_at"], manifest["files"]
+        else:
+            try:
+                created_at = datetime.strptime(run_dir.name[:15], TIMESTAMP_FORMAT).timestamp()
+            except ValueError:
+                created_at = run_dir.stat().st_mtime
+            files = _legacy_files(run_dir)
+        runs.append({"run_id": run_dir.name, "created_at": created_at, "path": run_dir, "files": files})
+    runs.sort(key=lambda run: (run["created_at"], run["run_id"]))
+    return runs
+
+
+def prune_backups(project_dir, keep_last=None, keep_days=None, quiet=False):
+    """Delete runs outside the retention policy, then unreferenced objects.
+
+    A run is kept if it is among the ``keep_last`` newest or younger than
+    ``keep_days`` days; with neither given, nothing is pruned.
+
+    Returns:
+        list of removed run ids
+    """
+    if keep_last is None and keep_days is None:
+        return []
+    runs = list_runs(project_dir)
+    keep = set()
+    if keep_last:
+        keep.update(run["run_id"] for run in runs[-keep_last:])
+    if keep_days is not None:
+        cutoff = time.time() - keep_days * 86400
+        keep.update(run["run_id"] for run in runs if run["created_at"] >= cutoff)
+
+    removed = []
+    for run in runs:
+        if run["run_id"] not in keep:
+            shutil.rmtree(run["path"])
+            removed.append(run["run_id"])
+
+    referenced = {entry["sha256"] for run in runs if run["run_id"] in keep for entry in run["files"].values() if entry}
+    objects_dir = Path(project_dir) / BACKUP_DIR / "objects"
+    freed = 0
+    if objects_dir.is_dir():
+        for obj in objects_dir.glob("*/*"):
+            if not obj.name.startswith(".tmp-") and obj.parent.name + obj.name not in referenced:
+                obj.unlink()
+                freed += 1
+
+    if removed and not quiet:
+        print(f"Pruned {len(removed)} backup run(s) and {freed} unreferenced object(s).")
+    return removed
+
+
+def print_runs(project_dir):
+    """Print the backup runs of a project, oldest first."""
+    runs = list_runs(project_dir)
+    if not runs:
+        print("No backups found.")
+        return 0
+    print(f"Backups in {Path(project_dir).resolve() / BACKUP_DIR}:\n")
+    for run in runs:
+        print(f"  {run['run_id']:20s} {len(run['files']):4d} file(s)")
+    return 0
+
+
+def restore_backup(project_dir, run_id="latest", paths=None):
+    """Restore files from a backup run into the project.
+
+    Args:
+        project_dir: Path to the project root
+        run_id: run to restore, or "latest"
+        paths: optional list of relative paths to restore (default: all)
+
+    Returns:
+        0 on success, 1 if the run or a requested path doesn't exist
+    """
+    project_path = Path(project_dir)
+    runs = list_runs(project_dir)
+    if run_id == "latest":
+        run = runs[-1] if runs else None
+    else:
+        run = next((r for r in runs if r["run_id"] == run_id), None)
+    if run is None:
+        print(f"Error: no backup run {run_id!r} in {project_path / BACKUP_DIR}")
+        return 1
+
+    selected = sorted(paths) if paths else sorted(run["files"])
+    missing = [p for p in selected if p not in run["files"]]
+    if missing:
+        print(f"Error: {', '.join(missing)} not in backup run {run['run_id']}")
+        return 1
 
-    if backed_up:
-        print(f"Backed up {len(backed_up)} file(s) to {backup_dir}")
-        return backup_dir
+    objects_dir = project_path / BACKUP_DIR / "objects"
+    for rel_path in selected:
+        entry = run["files"][rel_path]
+        src = objects_dir / entry["sha256"][:2] / entry["sha256"][2:] if entry else run["path"] / rel_path
+        dst = project_path / rel_path
+        dst.parent.mkdir(parents=True, exist_ok=True)
+        # Copy rather than link, so later edits never reach the store.
+        shutil.copyfile(src, dst)
+        if entry:
+            os.chmod(dst, entry["mode"])
+        print(f"  restored {rel_path}")
 
-    return None
+    print(f"\nRestored {len(selected)} file(s) from {run['run_id']}.")
+    return 0
@@ -0,0 +1,139 @@
+"""Build the precompiled template bundle.
+
+Compiles every ``.j2`` template to Python with Jinja's compile_templates()
+into the ``djsuite._bundle`` package, in the layout jinja2.ModuleLoader
+reads, and embeds the static files in its ``__init__.py``. With the bundle
+installed the renderer never walks the templates directory or parses a
+template, and djsuite also works from a zipapp or pex.
+
+Before anything is written, each platform's templates are rendered with
+StrictUndefined and a full context for each server, so a template referencing a missing
+variable fails the build instead of a user's run.
+
+    python -m djsuite.bundle [--output DIR]
+
+The bundle is a build artifact (git-ignored); the release workflow builds
+it before packaging. Set DJSUITE_NO_BUNDLE=1 to ignore an installed bundle.
+"""
+
+import argparse
+import hashlib
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+import jinja2
+import jinja2.meta
+
+from djsuite import __version__
+from djsuite.manifest import Platform, get_manifest
+
+BUNDLE_DIR = Path(__file__).parent / "_bundle"
+
+VALIDATION_CONTEXT = {
+    "project_name": "bundlecheck",
+    "python_version": "3.12",
+    "django_version": "5.2",
+    "drf_version": "3.16",
+    "author": "djsuite",
+    "description": "Bundle validation project",
+}
+
+# Every value of a context switch, so each template branch is rendered once.
+VALIDATION_SERVERS = ("wsgi", "asgi")
+
+
+def validate(env):
+    """Render every platform's templates with StrictUndefined, once per server.
+
+    Returns:
+        list of "template: error" strings, empty if all templates render
+    """
+    errors = []
+    for platform in Platform:
+        for server in VALIDATION_SERVERS:
+            context = {**VALIDATION_CONTEXT, "platform": platform.value, "server": server}
+            for dir_prefix, template_path in get_manifest(platform).jinja_keys():
+                name = f"{dir_prefix}/{template_path}"
+                try:
+                    env.get_template(name).render(**context)
+                except jinja2.TemplateError as e:
+                    errors.append(f"{name} ({platform.value}, {server}): {e}")
+    return errors
+
+
+def _init_module(env, template_dir):
+    """Source of the bundle's __init__.py: versions, template index and static files."""
+    templates = {}
+    static = {}
+    for name in env.list_templates():
+        source = (template_dir / name).read_text(encoding="utf-8")
+        if name.endswith(".j2"):
+            deps = sorted(jinja2.meta.find_referenced_templates(env.parse(source)), key=str)
+            templates[name] = (hashlib.sha256(source.encode("utf-8")).hexdigest(), tuple(deps))
+        else:
+            static[name] = source
+    lines = [
+        '"""Precompiled djsuite templates. Generated by `python -m djsuite.bundle`; do not edit."""',
+        "",
+        f"DJSUITE_VERSION = {__version__!r}",
+        f"JINJA2_VERSION = {jinja2.__version__!r}",
+        "",
+        "# template name -> (sha256 of its source, templates it references)",
+        "TEMPLATES = {",
+        *(f"    {name!r}: {entry!r}," for name, entry in sorted(templates.items())),
+        "}",
+        "",
+        "STATIC = {",
+        *(f"    {name!r}: {content!r}," for name, content in sorted(static.items())),
+        "}",
+        "",
+    ]
+    return "\n".join(lines)
+
+
+def build(output=BUNDLE_DIR, quiet=False):
+    """Validate the templates and write the bundle package to ``output``.
+
+    Returns:
+        0 on success, 1 if validation failed (nothing is written)
+    """
+    from djsuite.renderer import _get_template_dir, create_environment
+
+    template_dir = Path(str(_get_template_dir()))
+    env = create_environment(loader=jinja2.FileSystemLoader(str(template_dir)))
+    errors = validate(env)
+    if errors:
+        print("Error: templates failed StrictUndefined validation:")
+        for error in errors:
+            print(f"  {error}")
+        return 1
+
+    output = Path(output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    staging = Path(tempfile.mkdtemp(dir=output.parent, prefix=f".{output.name}-"))
+    try:
+        env.compile_templates(str(staging), filter_func=lambda name: name.endswith(".j2"), zip=None, ignore_errors=False)
+        (staging / "__init__.py").write_text(_init_module(env, template_dir), encoding="utf-8")
+        shutil.rmtree(output, ignore_errors=True)
+        staging.rename(output)
+    except BaseException:
+        shutil.rmtree(staging, ignore_errors=True)
+        raise
+
+    if not quiet:
+        count = sum(1 for _ in output.glob("tmpl_*.py"))
+        print(f"Compiled {count} template(s) into {output}")
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m djsuite.bundle", description="Build the precompiled template bundle.")
+    parser.add_argument("--output", default=str(BUNDLE_DIR), help=f"Bundle package directory (default: {BUNDLE_DIR})")
+    args = parser.parse_args(argv)
+    return build(args.output)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
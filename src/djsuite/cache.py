@@ -0,0 +1,29 @@
+"""Per-user cache directory resolution."""
+
+import os
+import sys
+from pathlib import Path
+
+
+def user_cache_dir(*parts):
+    """Return the djsuite cache directory, joined with the given parts.
+
+    Honours DJSUITE_CACHE_DIR first, then the platform convention
+    (XDG_CACHE_HOME, ~/Library/Caches or LOCALAPPDATA). The directory is
+    not created.
+    """
+    override = os.environ.get("DJSUITE_CACHE_DIR")
+    if override:
+        base = Path(override)
+    elif sys.platform == "win32":
+        base = Path(os.environ.get("LOCALAPPDATA") or Path.home() / "AppData" / "Local") / "djsuite" / "Cache"
+    elif sys.platform == "darwin":
+        base = Path.home() / "Library" / "Caches" / "djsuite"
+    else:
+        base = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "djsuite"
+    return base.joinpath(*parts)
+
+
+def env_flag(name):
+    """Return True if the environment variable is set to a truthy value."""
+    return os.environ.get(name, "").strip().lower() in ("1", "true", "yes", "on")
@@ -0,0 +1,143 @@
+"""Read-only drift check for --check.
+
+Renders the selected files and compares them by content hash with the
+files on disk, without writing anything. A file whose size and mtime still
+match its .djsuite.json index entry is never read. Projects that share a
+context share one render, as in fleet updates.
+"""
+
+import json
+from pathlib import Path
+
+from djsuite.fleet import group_by_context
+from djsuite.index import MISSING, UNTOUCHED, classify, content_hash, current_hash, load_index
+from djsuite.manifest import files_for_groups
+from djsuite.pipeline import ordered_map
+from djsuite.profiling import DIFF, RENDER, span
+from djsuite.renderer import render_template
+
+CHANGED = "changed"
+
+
+def iter_drift(project_dirs, manifest, context, max_workers=None):
+    """Render each file and compare it with every project's copy, on a thread pool.
+
+    Args:
+        project_dirs: project roots that all use ``context``
+        manifest: Manifest of (dir_prefix, template_path) -> (output_path, group)
+        context: template variables dict
+        max_workers: pool size (default: pipeline.default_workers())
+
+    Yields:
+        (output_path, {project_dir: CHANGED or MISSING}) tuples in
+        output-path order; the dict only holds projects that drifted.
+        Closing the generator early cancels the files still queued.
+    """
+    indexes = {project_dir: load_index(project_dir) for project_dir in project_dirs}
+    entries = manifest.sorted_items()
+
+    def check(entry):
+        (dir_prefix, template_path), (output_path, _group) = entry
+        with span(output_path, RENDER):
+            expected = content_hash(render_template(dir_prefix, template_path, context))
+        drift = {}
+        with span(output_path, DIFF):
+            for project_dir in project_dirs:
+                entry = indexes[project_dir].get(output_path)
+                try:
+                    state = classify(project_dir, output_path, entry)
+                    if state == UNTOUCHED:
+                        # As djsuite last wrote it: the template output, or an
+                        # up-to-date --merge of it (then recorded as the base).
+                        matches = expected in (entry["sha256"], entry.get("base"))
+                    else:
+                        # A modified file may still match, e.g. an unindexed one.
+                        matches = state != MISSING and current_hash(Path(project_dir) / output_path) == expected
+                except (OSError, UnicodeDecodeError):
+                    state, matches = CHANGED, False
+                if not matches:
+                    drift[project_dir] = MISSING if state == MISSING else CHANGED
+        return output_path, drift
+
+    return ordered_map(check, entries, max_workers)
+
+
+def _print_report(results):
+    width = max(len(r["project_dir"]) for r in results)
+    print(f"Checked {len(results)} project(s):\n")
+    for r in results:
+        if r["status"] == "error":
+            print(f"  {r['project_dir']:{width}s}  ERROR: {r['error']}")
+        elif r["status"] == "skipped":
+            print(f"  {r['project_dir']:{width}s}  SKIPPED")
+        elif r["status"] == "drift":
+            print(f"  {r['project_dir']:{width}s}  DRIFT ({len(r['files'])} of {r['checked']} file(s))")
+            for output_path, status in r["files"].items():
+                print(f"      [{status.upper()}] {output_path}")
+        else:
+            print(f"  {r['project_dir']:{width}s}  OK ({r['checked']} file(s))")
+
+    drifted = sum(1 for r in results if r["status"] == "drift")
+    errors = sum(1 for r in results if r["status"] == "error")
+    if drifted or errors:
+        print(f"\n{drifted} project(s) drifted from the templates, {errors} error(s).")
+        print("Run the same command without --check to update them.")
+    else:
+        print("\nAll files match the templates.")
+
+
+def run_check(project_dirs, groups, as_json=False, fail_fast=False, max_workers=None):
+    """Check that projects' files match what --update-* would write.
+
+    Args:
+        project_dirs: list of project root paths
+        groups: set of UpdateGroup values to check
+        as_json: if True, print the report as JSON
+        fail_fast: if True, stop at the first file that differs; projects
+            not reached are reported as "skipped"
+        max_workers: render pool size (default: pipeline.default_workers())
+
+    Returns:
+        0 if every file matches, 1 on drift or error
+    """
+    if not project_dirs:
+        print("Error: no project directories matched.")
+        return 1
+
+    with span("load contexts"):
+        by_context, errors = group_by_context(project_dirs)
+    results = {project_dir: {"project_dir": project_dir, "status": "skipped", "checked": 0, "files": {}} for project_dir in project_dirs}
+    results.update(errors)
+
+    with span("check"):
+        for (platform, _items), (context, dirs) in by_context.items():
+            if fail_fast and any(r["status"] == "drift" for r in results.values()):
+                break
+            try:
+                manifest = files_for_groups(groups, platform, context.get("packs", ()))
+            except ValueError as e:
+                for project_dir in dirs:
+                    results[project_dir] = {"project_dir": project_dir, "status": "error", "error": str(e)}
+                continue
+            for project_dir in dirs:
+                results[project_dir]["status"] = "ok"
+            drift_files = iter_drift(dirs, manifest, context, max_workers)
+            try:
+                for output_path, drift in drift_files:
+                    for project_dir in dirs:
+                        results[project_dir]["checked"] += 1
+                    for project_dir, status in drift.items():
+                        results[project_dir]["files"][output_path] = status
+                        results[project_dir]["status"] = "drift"
+                    if drift and fail_fast:
+                        break
+            finally:
+                drift_files.close()
+
+    report = [results[project_dir] for project_dir in project_dirs]
+    drifted = any(r["status"] == "drift" for r in report)
+    if as_json:
+        print(json.dumps({"drift": drifted, "projects": report}, indent=2))
+    else:
+        _print_report(report)
+    return 1 if drifted or any(r["status"] == "error" for r in report) else 0
@@ -1,7 +1,13 @@
-"""CLI entry point for djsuite."""
+"""CLI entry point for djsuite.
+
+Each mode imports only the modules it needs, inside main(): --version,
+--list-files and --dry-run never load Jinja2. tests/test_cli.py holds the
+cold-start budget.
+"""
 
 import argparse
-import getpass
+import functools
+import sys
 
 from djsuite import __version__
 from djsuite.manifest import Platform, UpdateGroup, get_manifest
@@ -16,6 +22,8 @@ def _valid_project_name(value):
 
 
 def build_parser():
+    import getpass
+
     parser = argparse.ArgumentParser(
         prog="djsuite",
         description="Production-ready Django project scaffolding in one command.",
@@ -39,17 +47,45 @@ def build_parser():
     )
     parser.add_argument("--description", default="", help="Project description")
     parser.add_argument("--output-dir", default=".", help="Output directory (default: current dir)")
+    parser.add_argument(
+        "--output-archive",
+        metavar="FILE",
+        help="Stream the project into a tar.gz, tar or zip archive instead of a directory ('-' for stdout)",
+    )
+    parser.add_argument(
+        "--archive-format",
+        choices=["tar.gz", "tar", "zip"],
+        help="Archive format (default: from the --output-archive suffix; tar.gz for stdout)",
+    )
     parser.add_argument(
         "--dry-run",
         action="store_true",
         help="Show what would be created without writing files",
     )
+    parser.add_argument(
+        "--offline",
+        action="store_true",
+        help="Never run pdm lock; only use a cached pdm.lock",
+    )
     parser.add_argument(
         "--platform",
         choices=[p.value for p in Platform],
         default="aws-eb",
         help="Deployment platform (default: aws-eb)",
     )
+    parser.add_argument(
+        "--server",
+        choices=["wsgi", "asgi"],
+        default="wsgi",
+        help="How the app is served: gunicorn WSGI workers, or gunicorn with uvicorn workers and async base views (default: wsgi)",
+    )
+    parser.add_argument(
+        "--pack",
+        action="append",
+        default=[],
+        metavar="NAME",
+        help="Add an installed template pack to the project (repeatable; see --list-packs)",
+    )
 
     # Update mode
     parser.add_argument("--update-ci", action="store_true", help="Update CI/CD files")
@@ -62,6 +98,46 @@ def build_parser():
         help="Project directory for updates (default: current dir)",
     )
     parser.add_argument("--no-backup", action="store_true", help="Skip backup before updating")
+    parser.add_argument("--diff", action="store_true", help="Show the full diff of each changed file")
+    parser.add_argument(
+        "--merge",
+        action="store_true",
+        help="Three-way merge template changes into files you edited instead of overwriting them",
+    )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Only check that files match the templates, writing nothing; exit 1 on drift (default groups: --update-all)",
+    )
+    parser.add_argument("--fail-fast", action="store_true", help="With --check, stop at the first file that differs")
+
+    # Backups
+    parser.add_argument("--list-backups", action="store_true", help="List backup runs in --project-dir")
+    parser.add_argument(
+        "--restore",
+        nargs="?",
+        const="latest",
+        metavar="RUN_ID",
+        help="Restore files from a backup run in --project-dir (default: latest)",
+    )
+    parser.add_argument("--prune-backups", action="store_true", help="Apply the --keep-* retention policy to --project-dir")
+    parser.add_argument("--keep-last", type=int, metavar="N", help="Keep only the N most recent backup runs")
+    parser.add_argument("--keep-days", type=float, metavar="N", help="Keep backup runs from the last N days")
+
+    # Fleet update mode
+    parser.add_argument(
+        "--project-dirs",
+        nargs="+",
+        metavar="DIR",
+        help="Update many projects at once; accepts directories and glob patterns (e.g. 'services/*')",
+    )
+    parser.add_argument(
+        "--project-dirs-from",
+        metavar="FILE",
+        help="Read project directories (or glob patterns) from FILE, one per line ('-' for stdin)",
+    )
+    parser.add_argument("--json", action="store_true", help="Print the fleet update or --check report as JSON")
+    parser.add_argument("--jobs", type=int, default=None, help="Worker threads for fleet updates (default: CPU count + 4)")
 
     # Info
     parser.add_argument(
@@ -69,14 +145,38 @@ def build_parser():
         action="store_true",
         help="List all files that would be generated",
     )
+    parser.add_argument("--list-packs", action="store_true", help="List installed template packs")
+
+    # Template authoring
+    parser.add_argument(
+        "--watch",
+        nargs="?",
+        const="",
+        metavar="PROJECT_DIR",
+        help="Re-render files in an existing project as templates change (default: --project-dir)",
+    )
+
+    # Profiling
+    parser.add_argument(
+        "--profile",
+        metavar="FILE",
+        help="Time each phase and file; print a summary and write a Chrome trace-event JSON to FILE",
+    )
+    parser.add_argument("--profile-top", type=int, default=10, metavar="N", help="Slowest files to list per phase (default: 10)")
+    parser.add_argument("--cprofile", metavar="FILE", help="Also dump cProfile stats for the main thread to FILE")
 
     return parser
 
 
+@functools.cache
+def _get_parser():
+    return build_parser()
+
+
 def _get_update_groups(args):
-    """Return the set of UpdateGroups to update based on CLI flags."""
+    """Return the set of UpdateGroups to update (or --check) based on CLI flags."""
     groups = set()
-    if args.update_all:
+    if args.update_all or (args.check and not (args.update_ci or args.update_docker or args.update_infra)):
         groups = {
             UpdateGroup.CI,
             UpdateGroup.DOCKER,
@@ -94,26 +194,104 @@ def _get_update_groups(args):
 
 
 def main(argv=None):
-    parser = build_parser()
+    if argv is None:
+        argv = sys.argv[1:]
+    if list(argv) == ["--version"]:
+        print(f"djsuite {__version__}")
+        return 0
+
+    parser = _get_parser()
     args = parser.parse_args(argv)
 
+    if args.profile or args.cprofile:
+        from djsuite.profiling import profile
+
+        with profile(args.profile, args.cprofile, args.profile_top):
+            return _run(args, parser)
+    return _run(args, parser)
+
+
+def _run(args, parser):
     platform = Platform.from_str(args.platform)
+    packs = tuple(dict.fromkeys(args.pack))
+
+    if args.list_packs:
+        from djsuite.packs import available_packs
+
+        names = available_packs()
+        if not names:
+            print("No template packs installed.")
+        for name in names:
+            print(f"  {name}")
+        return 0
+
+    if packs:
+        try:
+            get_manifest(platform, packs)
+        except ValueError as e:
+            print(f"Error: {e}")
+            return 1
 
     if args.list_files:
-        manifest = get_manifest(platform)
-        for (dir_prefix, template_path), (output_path, _group) in sorted(manifest.items(), key=lambda item: item[1][0]):
-            print(f"  {dir_prefix + '/' + template_path:60s} -> {output_path}")
+        for template_name, output_path in get_manifest(platform, packs).listing():
+            print(f"  {template_name:60s} -> {output_path}")
         return 0
 
+    if args.list_backups or args.restore or args.prune_backups:
+        from djsuite.backup import print_runs, prune_backups, restore_backup
+
+        if args.restore:
+            return restore_backup(args.project_dir, args.restore)
+        if args.prune_backups:
+            if args.keep_last is None and args.keep_days is None:
+                parser.error("--prune-backups requires --keep-last and/or --keep-days")
+            prune_backups(args.project_dir, args.keep_last, args.keep_days)
+            return 0
+        return print_runs(args.project_dir)
+
+    if args.watch is not None:
+        from djsuite.watch import run_watch
+
+        return run_watch(args.watch or args.project_dir)
+
     update_groups = _get_update_groups(args)
 
+    if args.check:
+        from djsuite.check import run_check
+
+        if args.project_dirs or args.project_dirs_from:
+            from djsuite.fleet import resolve_project_dirs
+
+            project_dirs = resolve_project_dirs(args.project_dirs, args.project_dirs_from)
+        else:
+            project_dirs = [args.project_dir]
+        return run_check(project_dirs, update_groups, as_json=args.json, fail_fast=args.fail_fast, max_workers=args.jobs)
+
     if update_groups:
+        if args.project_dirs or args.project_dirs_from:
+            from djsuite.fleet import resolve_project_dirs, run_fleet_update
+
+            return run_fleet_update(
+                resolve_project_dirs(args.project_dirs, args.project_dirs_from),
+                groups=update_groups,
+                no_backup=args.no_backup,
+                as_json=args.json,
+                max_workers=args.jobs,
+                keep_last=args.keep_last,
+                keep_days=args.keep_days,
+                merge=args.merge,
+            )
+
         from djsuite.updater import run_update
 
         return run_update(
             project_dir=args.project_dir,
             groups=update_groups,
             no_backup=args.no_backup,
+            show_diff=args.diff,
+            keep_last=args.keep_last,
+            keep_days=args.keep_days,
+            merge=args.merge,
         )
 
     if not args.project_name:
@@ -127,7 +305,10 @@ def main(argv=None):
         "author": args.author,
         "description": args.description,
         "platform": platform.value,
+        "server": args.server,
     }
+    if packs:
+        context["packs"] = packs
 
     if args.dry_run:
         from djsuite.generator import dry_run
@@ -135,7 +316,12 @@ def main(argv=None):
         dry_run(context, args.output_dir, platform)
         return 0
 
+    if args.output_archive:
+        from djsuite.generator import generate_archive
+
+        return generate_archive(context, args.output_archive, platform, fmt=args.archive_format, offline=args.offline)
+
     from djsuite.generator import generate
 
-    generate(context, args.output_dir, platform)
+    generate(context, args.output_dir, platform, offline=args.offline)
     return 0
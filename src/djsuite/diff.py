@@ -3,28 +3,52 @@
 import difflib
 from pathlib import Path
 
+from djsuite.index import content_hash, stat_matches
+from djsuite.textdiff import change_counts
 
-def diff_summary(project_dir, output_path, new_content):
+
+def diff_summary(project_dir, output_path, new_content, entry=None):
     """Show a summary of changes for a single file.
 
+    If ``entry`` (the file's index entry from .djsuite.json) still matches
+    the file's size and mtime, an unchanged file is recognised by hash alone
+    and never read; the full diff is only computed for files that changed.
+
     Returns a status string: [NEW], [UNCHANGED], or [CHANGED] (+N/-M lines)
     """
     full_path = Path(project_dir) / output_path
 
-    if not full_path.exists():
+    try:
+        st = full_path.stat()
+    except FileNotFoundError:
         return "[NEW]"
 
+    if stat_matches(st, entry) and entry["sha256"] == content_hash(new_content):
+        return "[UNCHANGED]"
+
     old_content = full_path.read_text(encoding="utf-8")
 
     if old_content == new_content:
         return "[UNCHANGED]"
 
-    old_lines = old_content.splitlines(keepends=True)
-    new_lines = new_content.splitlines(keepends=True)
+    # keepends, so a change to only the trailing newline counts as +1/-1.
+    added, removed = change_counts(old_content.splitlines(keepends=True), new_content.splitlines(keepends=True))
 
-    diff = list(difflib.unified_diff(old_lines, new_lines, lineterm=""))
+    return f"[CHANGED] (+{added}/-{removed} lines)"
 
-    added = sum(1 for line in diff if line.startswith("+") and not line.startswith("+++"))
-    removed = sum(1 for line in diff if line.startswith("-") and not line.startswith("---"))
 
-    return f"[CHANGED] (+{added}/-{removed} lines)"
+def unified_diff(project_dir, output_path, new_content):
+    """Lazily yield the unified diff between a file on disk and its new content.
+
+    Lines are yielded without trailing newlines. Nothing is computed until
+    the caller starts iterating, so it costs nothing unless shown.
+    """
+    full_path = Path(project_dir) / output_path
+    old_content = full_path.read_text(encoding="utf-8") if full_path.exists() else ""
+    yield from difflib.unified_diff(
+        old_content.splitlines(),
+        new_content.splitlines(),
+        fromfile=f"a/{output_path}",
+        tofile=f"b/{output_path}",
+        lineterm="",
+    )
@@ -0,0 +1,192 @@
+"""Apply --update-* to many existing projects in one run."""
+
+import glob
+import json
+import sys
+from pathlib import Path
+
+import jinja2
+
+from djsuite.manifest import files_for_groups
+from djsuite.pipeline import ordered_map
+from djsuite.profiling import span
+from djsuite.renderer import iter_render
+from djsuite.updater import _load_context, update_project
+
+
+def _read_patterns(stream):
+    for line in stream:
+        line = line.strip()
+        if line and not line.startswith("#"):
+            yield line
+
+
+def resolve_project_dirs(patterns, list_file=None):
+    """Expand project directory arguments into a sorted, de-duplicated list.
+
+    Args:
+        patterns: directories or glob patterns (e.g. "services/*")
+        list_file: optional path to a file with one directory or pattern per
+            line ("-" reads stdin); blank lines and "#" comments are ignored
+
+    Returns:
+        list of directory path strings
+    """
+    patterns = list(patterns or [])
+    if list_file:
+        if list_file == "-":
+            patterns.extend(_read_patterns(sys.stdin))
+        else:
+            with open(list_file, encoding="utf-8") as stream:
+                patterns.extend(_read_patterns(stream))
+
+    dirs = set()
+    for pattern in patterns:
+        matches = glob.glob(pattern) if glob.has_magic(pattern) else [pattern]
+        for match in matches:
+            if Path(match).is_dir():
+                dirs.add(str(Path(match)))
+    return sorted(dirs)
+
+
+def group_by_context(project_dirs):
+    """Group projects whose .djsuite.json resolve to the same context and platform.
+
+    Returns:
+        (by_context, errors): by_context maps (platform, context items) to
+        (context, [project_dir, ...]); errors maps each project without a
+        readable .djsuite.json (missing, invalid JSON or unknown platform) to
+        its error result
+    """
+    by_context = {}
+    errors = {}
+    for project_dir in project_dirs:
+        try:
+            context, platform = _load_context(project_dir, quiet=True)
+        except (OSError, ValueError) as e:
+            errors[project_dir] = {"project_dir": project_dir, "status": "error", "error": f".djsuite.json: {e}"}
+            continue
+        if context is None:
+            errors[project_dir] = {"project_dir": project_dir, "status": "error", "error": ".djsuite.json not found"}
+            continue
+        key = (platform, tuple(sorted(context.items())))
+        by_context.setdefault(key, (context, []))[1].append(project_dir)
+    return by_context, errors
+
+
+def _count_statuses(statuses, merge=False):
+    counts = {"new": 0, "changed": 0, "unchanged": 0}
+    if merge:
+        counts.update(kept=0, merged=0, conflict=0)
+    for status in statuses.values():
+        counts[status.split()[0].strip("[]").lower()] += 1
+    return counts
+
+
+def _update_one(project_dir, rendered, no_backup, keep_last=None, keep_days=None, merge=False):
+    """Diff, back up and write one project against an already-rendered file set."""
+    result = {"project_dir": project_dir, "status": "up-to-date", "written": 0, "backup_dir": None}
+    try:
+        update = update_project(
+            project_dir,
+            rendered.items(),
+            merge=merge,
+            no_backup=no_backup,
+            keep_last=keep_last,
+            keep_days=keep_days,
+            quiet=True,
+            max_workers=1,
+        )
+    except (OSError, ValueError) as exc:
+        # ValueError covers a .djsuite.json that stopped being valid JSON.
+        result["status"] = "error"
+        result["error"] = str(exc)
+        return result
+    result.update(_count_statuses(update["statuses"], merge))
+    result["written"] = update["written"]
+    result["backup_dir"] = update["backup_dir"]
+    if update["written"]:
+        result["status"] = "conflict" if update["conflicted"] else "updated"
+    return result
+
+
+def _print_report(results):
+    width = max(len(r["project_dir"]) for r in results)
+    print(f"Updated {len(results)} project(s):\n")
+    for r in results:
+        if r["status"] == "error":
+            print(f"  {r['project_dir']:{width}s}  ERROR: {r['error']}")
+            continue
+        line = f"  {r['project_dir']:{width}s}  NEW {r['new']:3d}  CHANGED {r['changed']:3d}  UNCHANGED {r['unchanged']:3d}"
+        if "merged" in r:
+            line += f"  KEPT {r['kept']:3d}  MERGED {r['merged']:3d}  CONFLICT {r['conflict']:3d}"
+        print(line)
+
+    totals = {key: sum(r.get(key, 0) for r in results) for key in ("new", "changed", "unchanged", "written", "merged", "conflict")}
+    errors = sum(1 for r in results if r["status"] == "error")
+    merges = f"{totals['merged']} merged, {totals['conflict']} with conflicts; " if any("merged" in r for r in results) else ""
+    print(
+        f"\nTotal: {totals['new']} new, {totals['changed']} changed, {totals['unchanged']} unchanged; "
+        f"{merges}wrote {totals['written']} file(s), {errors} error(s)."
+    )
+
+
+def run_fleet_update(project_dirs, groups, no_backup=False, as_json=False, max_workers=None, keep_last=None, keep_days=None, merge=False):
+    """Update many projects, rendering each distinct context only once.
+
+    Projects whose .djsuite.json resolve to the same context and platform
+    share one render; diffs, backups and writes then run per project on a
+    thread pool. Prints a combined report (human-readable or JSON).
+
+    Args:
+        project_dirs: list of project root paths
+        groups: set of UpdateGroup values to update
+        no_backup: if True, skip backups
+        as_json: if True, print the report as JSON
+        max_workers: project pool size (default: pipeline.default_workers())
+        keep_last, keep_days: backup retention (see backup.prune_backups)
+        merge: if True, three-way merge into edited files (see djsuite.merge)
+
+    Returns:
+        0 if every project was updated (or already up to date), 1 on an
+        error or merge conflict
+    """
+    if not project_dirs:
+        print("Error: no project directories matched.")
+        return 1
+
+    with span("load contexts"):
+        by_context, results = group_by_context(project_dirs)
+
+    jobs = []
+    for (platform, _items), (context, dirs) in by_context.items():
+        try:
+            manifest = files_for_groups(groups, platform, context.get("packs", ()))
+        except ValueError as e:
+            for project_dir in dirs:
+                results[project_dir] = {"project_dir": project_dir, "status": "error", "error": str(e)}
+            continue
+        try:
+            with span("render"):
+                rendered = dict(iter_render(manifest, context, max_workers))
+        except (OSError, ValueError, jinja2.TemplateError) as e:
+            # A broken render fails only the projects that share this context.
+            for project_dir in dirs:
+                results[project_dir] = {"project_dir": project_dir, "status": "error", "error": f"render: {e}"}
+            continue
+        jobs.extend((project_dir, rendered) for project_dir in dirs)
+
+    def update(job):
+        with span("update project", project_dir=str(job[0])):
+            return _update_one(job[0], job[1], no_backup, keep_last, keep_days, merge)
+
+    with span("update projects"):
+        for result in ordered_map(update, jobs, max_workers):
+            results[result["project_dir"]] = result
+
+    report = [results[project_dir] for project_dir in project_dirs]
+    if as_json:
+        print(json.dumps({"renders": len(by_context), "projects": report}, indent=2))
+    else:
+        _print_report(report)
+    return 1 if any(r["status"] in ("error", "conflict") for r in report) else 0
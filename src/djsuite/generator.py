@@ -1,18 +1,96 @@
-"""New project generation."""
+"""New project generation.
+
+The renderer (and with it Jinja2), writer and locking modules are imported
+inside generate(), so dry_run() stays cheap to import and call.
+"""
 
 import json
 import shutil
-import stat
-import subprocess
+import sys
 from pathlib import Path
 
-from djsuite.manifest import get_manifest
-from djsuite.renderer import render_all
+from djsuite.manifest import all_output_paths, get_manifest
+from djsuite.profiling import span
+
+
+def _render_pyproject(manifest, context):
+    """Render the manifest's pyproject.toml ahead of the other files."""
+    from djsuite.renderer import render_template
+
+    key = manifest.key_for_output("pyproject.toml")
+    if key is None:
+        return None
+    return render_template(*key, context)
+
+
+def _start_lock(pyproject, context, offline, out=None):
+    """Look up a cached pdm.lock, or start locking in the background.
+
+    Returns:
+        (lock_text, background_lock) — at most one of them is not None
+    """
+    from djsuite.locking import BackgroundLock, cached_lock, lock_key
+
+    if pyproject is None:
+        return None, None
+    cached = cached_lock(lock_key(pyproject, context))
+    if cached is not None:
+        return cached, None
+    if offline:
+        print("\nNote: no cached pdm.lock for these dependencies (offline) — run 'pdm lock' later.", file=out)
+        return None, None
+    if not shutil.which("pdm"):
+        print("\nNote: pdm not found — run 'pdm lock' after installing PDM to pin dependencies.", file=out)
+        return None, None
+    print("\nRunning pdm lock in the background to pin dependencies...", file=out)
+    return None, BackgroundLock(pyproject)
+
+
+def _finish_lock(lock_text, background_lock, pyproject, context, out=None):
+    """Wait for a background lock if one is running and cache its result.
+
+    Returns:
+        the pdm.lock text, or None if there is none
+    """
+    from djsuite.locking import lock_key, store_lock
+
+    if background_lock is None:
+        if lock_text is not None:
+            print("\n  pdm.lock restored from cache", file=out)
+        return lock_text
+    print("\nWaiting for pdm lock...", file=out)
+    with span("wait for pdm lock"):
+        lock_text, error = background_lock.wait(out=out)
+    if lock_text is None:
+        print(f"  pdm lock failed (you can run it manually): {error}", file=out)
+        return None
+    store_lock(lock_key(pyproject, context), lock_text)
+    print("  pdm.lock created", file=out)
+    return lock_text
+
+
+def _config(context, platform, index):
+    """Return the .djsuite.json text for a project."""
+    config = {
+        "djsuite_version": "0.1.0",
+        "platform": platform.value,
+        **context,
+        "files": dict(sorted(index.items())),
+    }
+    return json.dumps(config, indent=2) + "\n"
+
 
+def generate(context, output_dir=".", platform=None, offline=False):
+    """Generate a new Django project.
 
-def generate(context, output_dir=".", platform=None):
-    """Generate a new Django project."""
+    pdm.lock comes from the lock cache when the dependency set has been
+    locked before; otherwise ``pdm lock`` runs while the files are written.
+    With ``offline``, pdm is never run.
+    """
+    from djsuite.locking import LOCK_NAME
     from djsuite.manifest import Platform
+    from djsuite.renderer import iter_render
+    from djsuite.writer import Transaction
 
     if platform is None:
         platform = Platform.AWS_EB
@@ -24,43 +102,31 @@ def generate(context, output_dir=".", platform=None):
         print(f"Error: directory {project_path} already exists")
         return 1
 
-    manifest = get_manifest(platform)
-    rendered = render_all(manifest, context)
-
-    for output_path, content in sorted(rendered.items()):
-        full_path = project_path / output_path
-        full_path.parent.mkdir(parents=True, exist_ok=True)
-        full_path.write_text(content, encoding="utf-8")
-        # Set executable bit on .sh files
-        if output_path.endswith(".sh"):
-            full_path.chmod(full_path.stat().st_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
-        print(f"  created {output_path}")
-
-    # Write .djsuite.json config file
-    config = {
-        "djsuite_version": "0.1.0",
-        "platform": platform.value,
-        **context,
-    }
-    config_path = project_path / ".djsuite.json"
-    config_path.write_text(json.dumps(config, indent=2) + "\n", encoding="utf-8")
-    print("  created .djsuite.json")
-
-    # Run pdm lock to pin dependency versions
-    if shutil.which("pdm"):
-        print("\nRunning pdm lock to pin dependencies...")
-        result = subprocess.run(
-            ["pdm", "lock"],
-            cwd=project_path,
-            capture_output=True,
-            text=True,
-        )
-        if result.returncode == 0:
-            print("  pdm.lock created")
-        else:
-            print(f"  pdm lock failed (you can run it manually): {result.stderr.strip()}")
-    else:
-        print("\nNote: pdm not found — run 'pdm lock' after installing PDM to pin dependencies.")
+    manifest = get_manifest(platform, tuple(context.get("packs", ())))
+    with span("start pdm lock"):
+        pyproject = _render_pyproject(manifest, context)
+        lock_text, background_lock = _start_lock(pyproject, context, offline)
+
+    # Render and stage overlap; the project directory only appears, complete,
+    # when the transaction commits.
+    index = {}
+    try:
+        with Transaction(project_path, new_project=True) as txn:
+            with span("render + stage"):
+                for output_path in txn.write_all(iter_render(manifest, context), index=index):
+                    print(f"  created {output_path}")
+
+            # Write .djsuite.json config file
+            txn.write(".djsuite.json", _config(context, platform, index))
+            print("  created .djsuite.json")
+
+            lock_text = _finish_lock(lock_text, background_lock, pyproject, context)
+            background_lock = None
+            if lock_text is not None:
+                txn.write(LOCK_NAME, lock_text)
+    finally:
+        if background_lock is not None:
+            background_lock.cancel()
 
     print(f"\nProject {project_name} created at {project_path.resolve()}")
     print("\nNext steps:")
@@ -72,6 +138,77 @@ def generate(context, output_dir=".", platform=None):
     return 0
 
 
+def generate_archive(context, target, platform=None, fmt=None, offline=False):
+    """Generate a new Django project straight into a tar or zip archive.
+
+    Files are streamed into the archive as they are rendered, under a
+    top-level ``<project_name>/`` directory; nothing else is written to the
+    filesystem. Progress goes to stderr, so the archive can go to stdout.
+
+    Args:
+        context: template variables dict
+        target: archive path, or "-" for stdout
+        platform: Platform member (default: aws-eb)
+        fmt: "tar.gz", "tar" or "zip" (default: from target's suffix)
+        offline: if True, never run pdm lock (see generate())
+    """
+    import io
+    import zipfile
+
+    from djsuite.archive import ArchiveTarget, ArchiveWriter, format_for
+    from djsuite.index import content_hash
+    from djsuite.locking import LOCK_NAME
+    from djsuite.manifest import Platform
+    from djsuite.renderer import iter_render
+    from djsuite.snapshots import SNAPSHOT_NAME, add_member
+
+    if platform is None:
+        platform = Platform.AWS_EB
+    if target == "-" and sys.stdout.isatty():
+        print("Error: refusing to write an archive to a terminal; redirect stdout or give a file name", file=sys.stderr)
+        return 1
+
+    out = sys.stderr
+    project_name = context["project_name"]
+    manifest = get_manifest(platform, tuple(context.get("packs", ())))
+    with span("start pdm lock"):
+        pyproject = _render_pyproject(manifest, context)
+        lock_text, background_lock = _start_lock(pyproject, context, offline, out=out)
+
+    index = {}
+    snapshots = io.BytesIO()  # .djsuite-base.zip, added once every file is in
+    stored = set()
+    try:
+        with ArchiveTarget(target) as stream, ArchiveWriter(stream, fmt or format_for(target), project_name) as archive:
+            mtime_ns = archive.mtime * 10**9
+            with span("render + archive"), zipfile.ZipFile(snapshots, "w") as snapshot_zip:
+                for output_path, content in iter_render(manifest, context):
+                    data = content.encode("utf-8")
+                    archive.add(output_path, data)
+                    # Tar extraction restores size and mtime, so the index matches the extracted files.
+                    digest = content_hash(content)
+                    index[output_path] = {"sha256": digest, "size": len(data), "mtime_ns": mtime_ns}
+                    if digest not in stored:
+                        stored.add(digest)
+                        add_member(snapshot_zip, digest, content)
+                    print(f"  added {output_path}", file=out)
+            archive.add(SNAPSHOT_NAME, snapshots.getvalue())
+            archive.add(".djsuite.json", _config(context, platform, index).encode("utf-8"))
+            print("  added .djsuite.json", file=out)
+
+            lock_text = _finish_lock(lock_text, background_lock, pyproject, context, out=out)
+            background_lock = None
+            if lock_text is not None:
+                archive.add(LOCK_NAME, lock_text.encode("utf-8"))
+    finally:
+        if background_lock is not None:
+            background_lock.cancel()
+
+    where = "stdout" if target == "-" else Path(target).resolve()
+    print(f"\nProject {project_name} written to {where}", file=out)
+    return 0
+
+
 def dry_run(context, output_dir=".", platform=None):
     """Show what files would be generated without writing anything."""
     from djsuite.manifest import Platform
@@ -82,14 +219,14 @@ def dry_run(context, output_dir=".", platform=None):
     project_name = context["project_name"]
     project_path = Path(output_dir) / project_name
 
-    manifest = get_manifest(platform)
+    output_paths = all_output_paths(platform, context.get("packs", ()))
 
     print(f"Would create project at: {project_path.resolve()}\n")
     print("Files that would be generated:")
 
-    for _key, (output_path, _group) in sorted(manifest.items(), key=lambda item: item[1][0]):
+    for output_path in output_paths:
         print(f"  {output_path}")
 
     print("  .djsuite.json")
-    print(f"\nTotal: {len(manifest) + 1} files")
+    print(f"\nTotal: {len(output_paths) + 1} files")
     return 0
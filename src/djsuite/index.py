@@ -0,0 +1,105 @@
+"""Per-file content index stored in .djsuite.json.
+
+Each generated or updated file is recorded as
+``{"sha256": ..., "size": ..., "mtime_ns": ...}`` under the config's
+``"files"`` key. When a file's size and mtime still match its entry, its
+content hash is known without reading it.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+
+CONFIG_NAME = ".djsuite.json"
+
+# States returned by classify()
+UNTOUCHED = "untouched"
+MODIFIED = "modified"
+MISSING = "missing"
+
+
+def content_hash(content):
+    """Return the hex SHA-256 of rendered (text) content."""
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def file_entry(full_path, content):
+    """Build the index entry for a file just written with the given content."""
+    st = full_path.stat()
+    return {"sha256": content_hash(content), "size": st.st_size, "mtime_ns": st.st_mtime_ns}
+
+
+def stat_matches(st, entry):
+    """Return True if a stat result still matches the indexed size and mtime."""
+    return entry is not None and st.st_size == entry.get("size") and st.st_mtime_ns == entry.get("mtime_ns")
+
+
+def current_hash(full_path, entry=None):
+    """Return the content hash of a file on disk, or None if it is missing.
+
+    Uses the indexed hash when size and mtime are unchanged; otherwise reads
+    the file.
+    """
+    try:
+        st = full_path.stat()
+    except FileNotFoundError:
+        return None
+    if stat_matches(st, entry):
+        return entry["sha256"]
+    return content_hash(full_path.read_text(encoding="utf-8"))
+
+
+def classify(project_dir, output_path, entry):
+    """Classify a file against its index entry, by stat and hash alone.
+
+    Returns:
+        MISSING, UNTOUCHED (content equals what djsuite last wrote), or
+        MODIFIED (edited since, or never indexed)
+    """
+    disk_hash = current_hash(Path(project_dir) / output_path, entry)
+    if disk_hash is None:
+        return MISSING
+    if entry is not None and disk_hash == entry["sha256"]:
+        return UNTOUCHED
+    return MODIFIED
+
+
+def load_index(project_dir):
+    """Return the "files" index from .djsuite.json (empty if absent)."""
+    config_path = Path(project_dir) / CONFIG_NAME
+    if not config_path.exists():
+        return {}
+    with open(config_path) as f:
+        return json.load(f).get("files", {})
+
+
+def save_index(project_dir, entries):
+    """Merge entries into the "files" index of .djsuite.json."""
+    if not entries:
+        return
+    config_path = Path(project_dir) / CONFIG_NAME
+    with open(config_path) as f:
+        config = json.load(f)
+    files = config.setdefault("files", {})
+    files.update(entries)
+    config["files"] = dict(sorted(files.items()))
+    tmp_path = config_path.with_name(f"{CONFIG_NAME}.tmp")
+    tmp_path.write_text(json.dumps(config, indent=2) + "\n", encoding="utf-8")
+    os.replace(tmp_path, config_path)
+
+
+def refresh_entries(project_dir, unchanged, index):
+    """Return fresh entries for unchanged files whose index entry is stale or absent.
+
+    Args:
+        project_dir: Path to the project root
+        unchanged: dict of output_path -> content already known to match disk
+        index: the current "files" index
+    """
+    refreshed = {}
+    for output_path, content in unchanged.items():
+        full_path = Path(project_dir) / output_path
+        if not stat_matches(full_path.stat(), index.get(output_path)):
+            refreshed[output_path] = file_entry(full_path, content)
+    return refreshed
@@ -0,0 +1,126 @@
+"""pdm.lock caching and background locking for new projects.
+
+Most generated projects share the same dependency set, so a pdm.lock is
+cached under the user cache dir, keyed on the rendered pyproject.toml's
+dependency tables, the Python version and the djsuite platform. Project
+name, description and author are not part of the key (pdm's own lock
+content hash ignores them too), so a lock resolved for one project is
+reused for the next. A pre-seeded cache makes generation work offline.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+import tempfile
+import time
+from pathlib import Path
+
+from djsuite.cache import user_cache_dir
+
+LOCK_NAME = "pdm.lock"
+
+
+def _dependency_tables(pyproject_text):
+    """Return the parts of pyproject.toml that decide the lock, or None if unparseable."""
+    try:
+        import tomllib
+    except ImportError:  # Python 3.10
+        return None
+    data = tomllib.loads(pyproject_text)
+    project = data.get("project", {})
+    pdm = data.get("tool", {}).get("pdm", {})
+    return {
+        "dependencies": project.get("dependencies", []),
+        "optional-dependencies": project.get("optional-dependencies", {}),
+        "requires-python": project.get("requires-python", ""),
+        "dependency-groups": data.get("dependency-groups", {}),
+        "pdm-dev-dependencies": pdm.get("dev-dependencies", {}),
+        "pdm-resolution": pdm.get("resolution", {}),
+        "pdm-source": pdm.get("source", []),
+    }
+
+
+def lock_key(pyproject_text, context):
+    """Return the cache key for a rendered pyproject.toml and its context."""
+    tables = _dependency_tables(pyproject_text)
+    if tables is None:
+        # Without tomllib, fall back to the whole file: still correct, just fewer hits.
+        tables = {"pyproject": pyproject_text}
+    payload = {"python_version": context["python_version"], "platform": context["platform"], **tables}
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def _cache_path(key):
+    return user_cache_dir("locks") / f"{key}.lock"
+
+
+def cached_lock(key):
+    """Return the cached pdm.lock text for a key, or None."""
+    try:
+        return _cache_path(key).read_text(encoding="utf-8")
+    except FileNotFoundError:
+        return None
+
+
+def store_lock(key, lock_text):
+    """Add a pdm.lock to the cache."""
+    path = _cache_path(key)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    tmp_path.write_text(lock_text, encoding="utf-8")
+    os.replace(tmp_path, path)
+
+
+class BackgroundLock:
+    """Run ``pdm lock`` for a pyproject.toml in a scratch directory.
+
+    The lock starts as soon as the object is created, so it can run while
+    the rest of the project is being written.
+    """
+
+    def __init__(self, pyproject_text):
+        self.scratch = Path(tempfile.mkdtemp(prefix="djsuite-lock-"))
+        (self.scratch / "pyproject.toml").write_text(pyproject_text, encoding="utf-8")
+        self._log = open(self.scratch / "pdm-lock.log", "w+", encoding="utf-8")
+        self.started = time.monotonic()
+        self.process = subprocess.Popen(
+            ["pdm", "lock"],
+            cwd=self.scratch,
+            stdout=self._log,
+            stderr=subprocess.STDOUT,
+            text=True,
+        )
+
+    def wait(self, interval=5.0, out=None):
+        """Wait for the lock, printing elapsed time every ``interval`` seconds.
+
+        Args:
+            interval: seconds between progress lines
+            out: stream for progress lines (default: stdout)
+
+        Returns:
+            (lock_text, None) on success, or (None, error_output) on failure
+        """
+        try:
+            while True:
+                try:
+                    returncode = self.process.wait(timeout=interval)
+                    break
+                except subprocess.TimeoutExpired:
+                    print(f"  still locking... {time.monotonic() - self.started:.0f}s", file=out)
+            if returncode == 0 and (self.scratch / LOCK_NAME).exists():
+                return (self.scratch / LOCK_NAME).read_text(encoding="utf-8"), None
+            self._log.seek(0)
+            return None, self._log.read().strip()
+        finally:
+            self._log.close()
+            shutil.rmtree(self.scratch, ignore_errors=True)
+
+    def cancel(self):
+        """Stop the lock and clean up."""
+        self.process.kill()
+        self.process.wait()
+        self._log.close()
+        shutil.rmtree(self.scratch, ignore_errors=True)
@@ -1,6 +1,9 @@
 """File manifest mapping template paths to output paths and update groups."""
 
+import functools
+from collections.abc import Mapping
 from enum import Enum
+from types import MappingProxyType
 
 
 class UpdateGroup(Enum):
@@ -37,12 +40,14 @@ COMMON_MANIFEST = {
     "CHANGELOG.md": ("CHANGELOG.md", UpdateGroup.ROOT),
     "pyproject.toml.j2": ("pyproject.toml", UpdateGroup.ROOT),
     "docker-compose.yml.j2": ("docker-compose.yml", UpdateGroup.ROOT),
+    "gunicorn.conf.py.j2": ("gunicorn.conf.py", UpdateGroup.DOCKER),
     "pre-commit-config.yaml": (".pre-commit-config.yaml", UpdateGroup.ROOT),
     "manage.py": ("manage.py", UpdateGroup.ROOT),
     "conftest.py.j2": ("conftest.py", UpdateGroup.ROOT),
     "static/gitkeep": ("static/.gitkeep", UpdateGroup.ROOT),
     "tests/__init__.py": ("tests/__init__.py", UpdateGroup.ROOT),
-    "tests/test_health.py": ("tests/test_health.py", UpdateGroup.ROOT),
+    "tests/query_budget.py": ("tests/query_budget.py", UpdateGroup.ROOT),
+    "tests/test_query_budget.py": ("tests/test_query_budget.py", UpdateGroup.ROOT),
     # CI (.github/)
     "github/copilot-instructions.md.j2": (
         ".github/copilot-instructions.md",
@@ -69,10 +74,11 @@ COMMON_MANIFEST = {
     # base/ app
     "base/__init__.py": ("base/__init__.py", UpdateGroup.APP_BASE),
     "base/apps.py": ("base/apps.py", UpdateGroup.APP_BASE),
+    "base/async_views.py": ("base/async_views.py", UpdateGroup.APP_BASE),
     "base/containers.py": ("base/containers.py", UpdateGroup.APP_BASE),
     "base/models.py": ("base/models.py", UpdateGroup.APP_BASE),
     "base/pagination.py": ("base/pagination.py", UpdateGroup.APP_BASE),
-    "base/urls.py": ("base/urls.py", UpdateGroup.APP_BASE),
+    "base/urls.py.j2": ("base/urls.py", UpdateGroup.APP_BASE),
     "base/views.py": ("base/views.py", UpdateGroup.APP_BASE),
     "base/constants/__init__.py": ("base/constants/__init__.py", UpdateGroup.APP_BASE),
     "base/constants/celery_task_status.py": (
@@ -96,11 +102,27 @@ COMMON_MANIFEST = {
         UpdateGroup.APP_BASE,
     ),
     "base/services/__init__.py": ("base/services/__init__.py", UpdateGroup.APP_BASE),
+    "base/services/cache_service.py": (
+        "base/services/cache_service.py",
+        UpdateGroup.APP_BASE,
+    ),
+    "base/services/health_service.py": (
+        "base/services/health_service.py",
+        UpdateGroup.APP_BASE,
+    ),
     "base/services/orphan_service.py": (
         "base/services/orphan_service.py",
         UpdateGroup.APP_BASE,
     ),
+    "base/services/task_status_service.py": (
+        "base/services/task_status_service.py",
+        UpdateGroup.APP_BASE,
+    ),
     "base/tests/__init__.py": ("base/tests/__init__.py", UpdateGroup.APP_BASE),
+    "base/tests/test_cache_service.py": ("base/tests/test_cache_service.py", UpdateGroup.APP_BASE),
+    "base/tests/test_health.py": ("base/tests/test_health.py", UpdateGroup.APP_BASE),
+    "base/tests/test_pagination.py": ("base/tests/test_pagination.py", UpdateGroup.APP_BASE),
+    "base/tests/test_task_status.py": ("base/tests/test_task_status.py", UpdateGroup.APP_BASE),
 }
 
 PLATFORM_MANIFESTS = {
@@ -148,14 +170,137 @@ PLATFORM_MANIFESTS = {
 }
 
 
-def get_manifest(platform):
-    """Merge common and platform-specific manifests into a single dict.
+class Manifest(Mapping):
+    """An immutable manifest with precomputed indexes.
+
+    Maps (dir_prefix, template_path) -> (output_path, UpdateGroup), like
+    the dicts it is built from, and additionally indexes entries by
+    update group, output path, dir prefix and file kind. Orderings by
+    output path and the sub-manifest for every set of groups are computed
+    once, at construction.
+
+    Args:
+        entries: mapping of (dir_prefix, template_path) -> (output_path, UpdateGroup)
+        subsets: if False, skip building the per-group-set sub-manifests
+            (sub-manifests themselves are built this way)
+    """
+
+    __slots__ = (
+        "_entries",
+        "_by_group",
+        "_by_output",
+        "_by_prefix",
+        "_sorted_keys",
+        "_sorted_items",
+        "_output_paths",
+        "_jinja_keys",
+        "_static_keys",
+        "_subsets",
+    )
+
+    def __init__(self, entries, subsets=True):
+        entries = dict(entries)
+        self._entries = MappingProxyType(entries)
+        self._sorted_keys = tuple(sorted(entries, key=lambda key: entries[key][0]))
+        self._sorted_items = tuple((key, entries[key]) for key in self._sorted_keys)
+        by_output = {}
+        by_group = {}
+        by_prefix = {}
+        for key in self._sorted_keys:
+            output_path, group = entries[key]
+            if output_path in by_output:
+                other = "/".join(by_output[output_path])
+                raise ValueError(f"{output_path} is generated by both {other} and {'/'.join(key)}")
+            by_output[output_path] = key
+            by_group.setdefault(group, []).append(key)
+            by_prefix.setdefault(key[0], []).append(key)
+        self._by_output = MappingProxyType(by_output)
+        self._output_paths = tuple(by_output)
+        self._by_group = MappingProxyType({group: tuple(keys) for group, keys in by_group.items()})
+        self._by_prefix = MappingProxyType({prefix: tuple(keys) for prefix, keys in by_prefix.items()})
+        self._jinja_keys = tuple(key for key in self._sorted_keys if key[1].endswith(".j2"))
+        self._static_keys = tuple(key for key in self._sorted_keys if not key[1].endswith(".j2"))
+        self._subsets = MappingProxyType(self._build_subsets() if subsets else {})
+
+    def _build_subsets(self):
+        # One sub-manifest per combination of the groups present: 2**6 at most.
+        subsets = {frozenset(): Manifest({}, subsets=False)}
+        for group, keys in self._by_group.items():
+            for groups, subset in list(subsets.items()):
+                subsets[groups | {group}] = Manifest({**subset._entries, **{key: self._entries[key] for key in keys}}, subsets=False)
+        return subsets
+
+    def __getitem__(self, key):
+        return self._entries[key]
+
+    def __iter__(self):
+        return iter(self._entries)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __repr__(self):
+        return f"Manifest({len(self)} files)"
+
+    def sorted_items(self):
+        """Return (key, (output_path, group)) pairs sorted by output path."""
+        return self._sorted_items
+
+    def output_paths(self):
+        """Return all output paths, sorted."""
+        return self._output_paths
+
+    def key_for_output(self, output_path):
+        """Return the (dir_prefix, template_path) that generates output_path, or None."""
+        return self._by_output.get(output_path)
+
+    def keys_for_prefix(self, dir_prefix):
+        """Return the keys under one template directory, sorted by output path."""
+        return self._by_prefix.get(dir_prefix, ())
+
+    def jinja_keys(self):
+        """Return the keys of .j2 templates, sorted by output path."""
+        return self._jinja_keys
+
+    def static_keys(self):
+        """Return the keys of files copied verbatim, sorted by output path."""
+        return self._static_keys
+
+    def for_groups(self, groups):
+        """Return the sub-manifest for a set of UpdateGroups."""
+        groups = frozenset(groups).intersection(self._by_group)
+        subset = self._subsets.get(groups)
+        if subset is None:
+            # Only sub-manifests, built with subsets=False, get here.
+            subset = Manifest({key: self._entries[key] for group in groups for key in self._by_group[group]}, subsets=False)
+        return subset
+
+    def listing(self):
+        """Return (template_name, output_path) pairs sorted by output path."""
+        return tuple(
+            (f"{prefix}/{template_path}", self._entries[(prefix, template_path)][0]) for prefix, template_path in self._sorted_keys
+        )
+
+
+@functools.cache
+def get_manifest(platform, packs=()):
+    """Merge common, platform-specific and template-pack manifests.
 
     Keys are (dir_prefix, template_path) tuples so the renderer knows
-    which subdirectory to load from.
+    which subdirectory to load from. The result is built once per
+    (platform, packs) and shared.
+
+    Args:
+        platform: Platform member
+        packs: tuple of template pack names (see djsuite.packs); packs are
+            only looked up when named here
 
     Returns:
-        dict of (dir_prefix, template_path) -> (output_path, UpdateGroup)
+        Manifest of (dir_prefix, template_path) -> (output_path, UpdateGroup)
+
+    Raises:
+        ValueError: for an unknown pack, a pack that doesn't support the
+            platform, or two entries generating the same output path
     """
     merged = {}
     for tpl, value in COMMON_MANIFEST.items():
@@ -164,16 +309,23 @@ def get_manifest(platform):
     dir_prefix = f"platforms/{platform.value.replace('-', '_')}"
     for tpl, value in platform_manifest.items():
         merged[(dir_prefix, tpl)] = value
-    return merged
+    if packs:
+        from djsuite.packs import load_pack
+
+        for name in packs:
+            pack = load_pack(name)
+            if pack.platforms is not None and platform.value not in pack.platforms:
+                raise ValueError(f"Template pack {name!r} does not support platform {platform.value!r}")
+            for tpl, value in pack.manifest.items():
+                merged[(pack.dir_prefix, tpl)] = value
+    return Manifest(merged)
 
 
-def files_for_groups(groups, platform):
+def files_for_groups(groups, platform, packs=()):
     """Return manifest entries for the given set of UpdateGroups."""
-    manifest = get_manifest(platform)
-    return {key: (out, grp) for key, (out, grp) in manifest.items() if grp in groups}
+    return get_manifest(platform, tuple(packs)).for_groups(groups)
 
 
-def all_output_paths(platform):
+def all_output_paths(platform, packs=()):
     """Return all output paths in order."""
-    manifest = get_manifest(platform)
-    return [out for _key, (out, _grp) in sorted(manifest.items(), key=lambda item: item[1][0])]
+    return list(get_manifest(platform, tuple(packs)).output_paths())
@@ -0,0 +1,168 @@
+"""Three-way merge of template updates into customized files.
+
+merge3() lines up the base (what djsuite last rendered) with each side
+using the textdiff engine, then walks the base once: lines matched in all
+three versions are stable, and each stretch between them is taken from
+whichever side changed it. Only stretches both sides changed differently
+become conflicts, written with git-style markers. Both diffs are close to
+linear and the walk is linear, so large files and whole fleets merge
+quickly. Files with no stored base get a two-way merge2() instead, which
+leaves every difference to the user.
+"""
+
+from pathlib import Path
+
+from djsuite.index import content_hash, current_hash, file_entry
+from djsuite.snapshots import base_hash, load_snapshot
+from djsuite.textdiff import matching_pairs
+
+CURRENT_LABEL = "current"
+TEMPLATE_LABEL = "template"
+
+# Statuses returned by merge_file()
+OVERWRITE = "[CHANGED]"
+KEPT = "[KEPT]"
+MERGED = "[MERGED]"
+CONFLICT = "[CONFLICT]"
+
+
+def _with_newline(lines):
+    if lines and not lines[-1].endswith("\n"):
+        return lines[:-1] + [lines[-1] + "\n"]
+    return lines
+
+
+def merge3(base, current, template, labels=(CURRENT_LABEL, TEMPLATE_LABEL)):
+    """Merge the changes from base to template into current.
+
+    Args:
+        base: text both versions started from
+        current: the user's version
+        template: the newly rendered version
+        labels: names written after the <<<<<<< and >>>>>>> markers
+
+    Returns:
+        (merged text, number of conflicts)
+    """
+    base_lines = base.splitlines(keepends=True)
+    current_lines = current.splitlines(keepends=True)
+    template_lines = template.splitlines(keepends=True)
+    ids = {}
+    b = [ids.setdefault(line, len(ids)) for line in base_lines]
+    c = [ids.setdefault(line, len(ids)) for line in current_lines]
+    t = [ids.setdefault(line, len(ids)) for line in template_lines]
+    in_current = dict(matching_pairs(b, c))
+    in_template = dict(matching_pairs(b, t))
+
+    merged = []
+    conflicts = 0
+    i = jc = jt = 0
+    for k in range(len(b) + 1):
+        if k < len(b):
+            if k not in in_current or k not in in_template:
+                continue
+            kc, kt = in_current[k], in_template[k]
+        else:
+            kc, kt = len(c), len(t)
+        # base[i:k], current[jc:kc] and template[jt:kt] lie between two stable lines.
+        if c[jc:kc] == t[jt:kt] or b[i:k] == t[jt:kt]:
+            merged.extend(current_lines[jc:kc])
+        elif b[i:k] == c[jc:kc]:
+            merged.extend(template_lines[jt:kt])
+        else:
+            conflicts += 1
+            merged.append(f"<<<<<<< {labels[0]}\n")
+            merged.extend(_with_newline(current_lines[jc:kc]))
+            merged.append("=======\n")
+            merged.extend(_with_newline(template_lines[jt:kt]))
+            merged.append(f">>>>>>> {labels[1]}\n")
+        if k < len(b):
+            merged.append(base_lines[k])
+        i, jc, jt = k + 1, kc + 1, kt + 1
+    return "".join(merged), conflicts
+
+
+def merge2(current, template, labels=(CURRENT_LABEL, TEMPLATE_LABEL)):
+    """Mark every stretch where current and template differ as a conflict.
+
+    Used when no base is stored, so there is no telling which side made a
+    change; lines both versions share are kept as they are.
+
+    Returns:
+        (merged text, number of conflicts)
+    """
+    current_lines = current.splitlines(keepends=True)
+    template_lines = template.splitlines(keepends=True)
+    ids = {}
+    c = [ids.setdefault(line, len(ids)) for line in current_lines]
+    t = [ids.setdefault(line, len(ids)) for line in template_lines]
+
+    merged = []
+    conflicts = 0
+    jc = jt = 0
+    for kc, kt in [*matching_pairs(c, t), (len(c), len(t))]:
+        if jc < kc or jt < kt:
+            conflicts += 1
+            merged.append(f"<<<<<<< {labels[0]}\n")
+            merged.extend(_with_newline(current_lines[jc:kc]))
+            merged.append("=======\n")
+            merged.extend(_with_newline(template_lines[jt:kt]))
+            merged.append(f">>>>>>> {labels[1]}\n")
+        if kc < len(c):
+            merged.append(current_lines[kc])
+        jc, jt = kc + 1, kt + 1
+    return "".join(merged), conflicts
+
+
+def merge_file(project_dir, output_path, template, entry):
+    """Decide how to update a file that differs from the new template output.
+
+    Args:
+        project_dir: Path to the project root
+        output_path: the file, relative to the project
+        template: its newly rendered content
+        entry: its .djsuite.json index entry, or None
+
+    Returns:
+        (status, content, conflicts):
+
+        - OVERWRITE: the user didn't edit the file; content is the template
+          output
+        - KEPT: only the user changed the file (or their edits already
+          include the template change); content is None, nothing to write
+        - MERGED / CONFLICT: both changed it; content is the merge, with
+          ``conflicts`` marked regions for CONFLICT. Without a stored base
+          (projects generated before snapshots) every difference is a
+          conflict, see merge2()
+    """
+    full_path = Path(project_dir) / output_path
+    base_digest = base_hash(entry)
+    if current_hash(full_path, entry) in (None, base_digest):
+        return OVERWRITE, template, 0
+    if content_hash(template) == base_digest:
+        return KEPT, None, 0
+    base = load_snapshot(project_dir, base_digest)
+    current = full_path.read_text(encoding="utf-8")
+    if base is None:
+        merged, conflicts = merge2(current, template)
+        return (CONFLICT, merged, conflicts) if conflicts else (KEPT, None, 0)
+    merged, conflicts = merge3(base, current, template)
+    if merged == current:
+        return KEPT, None, 0
+    return (CONFLICT if conflicts else MERGED), merged, conflicts
+
+
+def kept_entry(project_dir, output_path, template):
+    """Index entry for a KEPT file: its current content, based on the new template output.
+
+    The caller stores ``template`` as a snapshot.
+    """
+    full_path = Path(project_dir) / output_path
+    entry = file_entry(full_path, full_path.read_text(encoding="utf-8"))
+    entry["base"] = content_hash(template)
+    return entry
+
+
+def describe(status, conflicts):
+    """Status text for a merge_file() result, as shown in update summaries."""
+    return f"{status} ({conflicts} region(s))" if conflicts else status
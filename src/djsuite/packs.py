@@ -0,0 +1,89 @@
+"""Third-party template packs, discovered through entry points.
+
+A pack is a distribution that registers a TemplatePack (or a callable
+returning one) under the ``djsuite.template_packs`` entry point group::
+
+    [project.entry-points."djsuite.template_packs"]
+    sentry = "djsuite_sentry:pack"
+
+Its templates render under ``packs/<name>/`` next to djsuite's own and its
+files join the project manifest. Installed distributions are only scanned
+when a pack is first used (``--pack`` or ``--list-packs``), so projects
+without packs never pay for the entry point lookup.
+"""
+
+import functools
+
+ENTRY_POINT_GROUP = "djsuite.template_packs"
+PACK_PREFIX = "packs/"
+
+
+class TemplatePack:
+    """A named set of templates with its own manifest.
+
+    Args:
+        name: pack name; the entry point name takes precedence
+        templates: directory holding the templates, as a path or an
+            importlib.resources Traversable
+            (e.g. ``importlib.resources.files("djsuite_sentry") / "templates"``)
+        manifest: dict of template_path -> (output_path, UpdateGroup),
+            like manifest.COMMON_MANIFEST
+        platforms: platform values the pack supports (default: all)
+    """
+
+    def __init__(self, name, templates, manifest, platforms=None):
+        self.name = name
+        self.templates = templates
+        self.manifest = dict(manifest)
+        self.platforms = tuple(platforms) if platforms is not None else None
+
+    @property
+    def dir_prefix(self):
+        return f"{PACK_PREFIX}{self.name}"
+
+    def __repr__(self):
+        return f"TemplatePack({self.name!r}, {len(self.manifest)} files)"
+
+
+def _entry_points():
+    from importlib.metadata import entry_points
+
+    return entry_points(group=ENTRY_POINT_GROUP)
+
+
+def available_packs():
+    """Return the names of all installed template packs, sorted."""
+    return sorted({ep.name for ep in _entry_points()})
+
+
+@functools.cache
+def load_pack(name):
+    """Import and return an installed template pack.
+
+    Raises:
+        ValueError: if no pack with that name is installed, or its entry
+            point doesn't provide a TemplatePack
+    """
+    matches = [ep for ep in _entry_points() if ep.name == name]
+    if not matches:
+        installed = ", ".join(available_packs()) or "none"
+        raise ValueError(f"Unknown template pack: {name!r} (installed: {installed})")
+    pack = matches[0].load()
+    if callable(pack) and not isinstance(pack, TemplatePack):
+        pack = pack()
+    if not isinstance(pack, TemplatePack):
+        raise ValueError(f"Entry point {matches[0].value!r} for template pack {name!r} is not a TemplatePack")
+    if pack.name != name:
+        pack = TemplatePack(name, pack.templates, pack.manifest, pack.platforms)
+    return pack
+
+
+def pack_resource(template_name):
+    """Return the Traversable for a ``packs/<name>/...`` template name, or None for other names."""
+    if not template_name.startswith(PACK_PREFIX):
+        return None
+    name, _, path = template_name[len(PACK_PREFIX) :].partition("/")
+    resource = load_pack(name).templates
+    for part in path.split("/"):
+        resource = resource / part
+    return resource
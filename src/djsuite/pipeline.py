@@ -0,0 +1,38 @@
+"""Bounded, order-preserving thread pool helpers."""
+
+import collections
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+
+def default_workers():
+    """Return the default pool size (same formula as ThreadPoolExecutor)."""
+    return min(32, (os.cpu_count() or 1) + 4)
+
+
+def ordered_map(func, iterable, max_workers=None):
+    """Lazily apply func to each item on a thread pool, yielding results in input order.
+
+    Unlike Executor.map, the input is consumed incrementally: at most
+    2 * max_workers calls are in flight, so memory stays bounded and the
+    caller can start on the first result while later ones are computed.
+    The first exception (in input order) is re-raised and the remaining
+    queued calls are cancelled.
+    """
+    workers = max_workers or default_workers()
+    items = iter(iterable)
+    pending = collections.deque()
+    executor = ThreadPoolExecutor(max_workers=workers)
+    try:
+        for item in items:
+            pending.append(executor.submit(func, item))
+            if len(pending) >= 2 * workers:
+                break
+        while pending:
+            result = pending.popleft().result()
+            for item in items:
+                pending.append(executor.submit(func, item))
+                break
+            yield result
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
@@ -0,0 +1,142 @@
+"""Phase and per-file timing for --profile.
+
+Code marks phases and per-file work with span(). Spans cost next to
+nothing until profile() activates a Profiler for a command. At the end
+the Profiler writes a Chrome trace-event file (open it in chrome://tracing
+or https://ui.perfetto.dev), optionally a cProfile dump, and prints a
+summary of phase totals and the slowest files to stderr.
+
+span() is imported at module level by the generator, updater, writer,
+renderer, fleet and check modules, so this module only imports what span()
+needs; the rest loads when profile() runs.
+"""
+
+import contextlib
+import os
+import sys
+import time
+
+PHASE = "phase"
+RENDER = "render"
+DIFF = "diff"
+WRITE = "write"
+
+_profiler = None
+
+
+class Profiler:
+    """Collects timed spans from any thread as Chrome trace "complete" events."""
+
+    def __init__(self):
+        import threading
+
+        self.origin = time.perf_counter()
+        self.events = []
+        self.threads = {}
+        self._lock = threading.Lock()
+        self._current_thread = threading.current_thread
+
+    def add(self, name, category, start, end, args=None):
+        thread = self._current_thread()
+        event = {
+            "name": name,
+            "cat": category,
+            "ph": "X",
+            "ts": round((start - self.origin) * 1e6, 1),
+            "dur": round((end - start) * 1e6, 1),
+            "pid": os.getpid(),
+            "tid": thread.ident,
+        }
+        if args:
+            event["args"] = args
+        with self._lock:
+            self.events.append(event)
+            self.threads.setdefault(thread.ident, thread.name)
+
+    def totals(self, category):
+        """Return (name, total seconds, count) per span name, slowest first."""
+        totals = {}
+        for event in self.events:
+            if event["cat"] == category:
+                total, count = totals.get(event["name"], (0.0, 0))
+                totals[event["name"]] = (total + event["dur"] / 1e6, count + 1)
+        return sorted(((name, total, count) for name, (total, count) in totals.items()), key=lambda row: -row[1])
+
+    def slowest(self, category, top):
+        """Return the ``top`` longest spans of a category as (name, seconds)."""
+        events = sorted((e for e in self.events if e["cat"] == category), key=lambda e: -e["dur"])
+        return [(e["name"], e["dur"] / 1e6) for e in events[:top]]
+
+    def trace(self):
+        """Return the Chrome trace-event document."""
+        metadata = [
+            {"name": "thread_name", "ph": "M", "pid": os.getpid(), "tid": tid, "args": {"name": name}}
+            for tid, name in sorted(self.threads.items())
+        ]
+        return {"traceEvents": metadata + sorted(self.events, key=lambda e: e["ts"]), "displayTimeUnit": "ms"}
+
+    def print_summary(self, top=10, file=None):
+        file = file or sys.stderr
+        print("\nProfile:", file=file)
+        for name, total, count in self.totals(PHASE):
+            runs = f" ({count}x)" if count > 1 else ""
+            print(f"  {total * 1000:10.2f}ms  {name}{runs}", file=file)
+        for category in (RENDER, DIFF, WRITE):
+            slowest = self.slowest(category, top)
+            if slowest:
+                print(f"\nSlowest {category}s:", file=file)
+                for name, seconds in slowest:
+                    print(f"  {seconds * 1000:10.2f}ms  {name}", file=file)
+
+
+@contextlib.contextmanager
+def span(name, category=PHASE, **args):
+    """Time the enclosed block as one span (a no-op unless profiling)."""
+    profiler = _profiler
+    if profiler is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        profiler.add(name, category, start, time.perf_counter(), args)
+
+
+@contextlib.contextmanager
+def profile(trace_path=None, cprofile_path=None, top=10, label="djsuite"):
+    """Profile the enclosed command.
+
+    Args:
+        trace_path: where to write the Chrome trace-event JSON, or None
+        cprofile_path: where to dump cProfile stats (main thread), or None
+        top: how many of the slowest files to list per category
+        label: name of the outermost span
+    """
+    global _profiler
+    profiler = Profiler()
+    cprofiler = None
+    if cprofile_path:
+        import cProfile
+
+        cprofiler = cProfile.Profile()
+    _profiler = profiler
+    if cprofiler is not None:
+        cprofiler.enable()
+    try:
+        with span(label):
+            yield profiler
+    finally:
+        if cprofiler is not None:
+            cprofiler.disable()
+        _profiler = None
+        profiler.print_summary(top)
+        if trace_path:
+            import json
+
+            with open(trace_path, "w", encoding="utf-8") as f:
+                json.dump(profiler.trace(), f)
+            print(f"\nTrace written to {trace_path} (open in chrome://tracing or https://ui.perfetto.dev)", file=sys.stderr)
+        if cprofiler is not None:
+            cprofiler.dump_stats(cprofile_path)
+            print(f"cProfile stats written to {cprofile_path} (python -m pstats {cprofile_path})", file=sys.stderr)
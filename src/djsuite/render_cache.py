@@ -0,0 +1,163 @@
+"""Content-addressed on-disk cache of rendered templates.
+
+A rendered file is stored under a key derived from the djsuite version,
+the template name, the hash of the template source and of every template
+it pulls in through {% include %}/{% extends %}/{% import %}, and a
+canonical hash of the context. A matching entry is returned without
+touching Jinja. Entries are evicted least-recently-used once the cache
+grows past its size budget.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from pathlib import Path
+
+from djsuite import __version__
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+
+def _sha256(text):
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def context_hash(context):
+    """Return a canonical hash of a template context."""
+    return _sha256(json.dumps(context, sort_keys=True, separators=(",", ":"), default=str))
+
+
+class RenderCache:
+    """Rendered-output cache rooted at ``directory``.
+
+    Args:
+        directory: cache root (created on first write)
+        load_source: callable(template_name) -> template source text
+        find_dependencies: callable(source) -> list of referenced template
+            names; a None item marks a dynamic include, which makes the
+            template uncacheable
+        max_bytes: size budget for stored renders
+    """
+
+    def __init__(self, directory, load_source, find_dependencies, max_bytes=DEFAULT_MAX_BYTES):
+        self.directory = Path(directory)
+        self.load_source = load_source
+        self.find_dependencies = find_dependencies
+        self.max_bytes = max_bytes
+        self._tree_hashes = {}
+        self._lock = threading.Lock()
+        self._total_bytes = None
+
+    def render(self, name, context, render):
+        """Return the cached render of ``name``, calling render(name, context) on a miss."""
+        tree_hash = self._tree_hash(name)
+        if tree_hash is None:
+            return render(name, context)
+        key = _sha256("\0".join([__version__, name, tree_hash, context_hash(context)]))
+        content = self.get(key)
+        if content is None:
+            content = render(name, context)
+            self.put(key, content)
+        return content
+
+    def _tree_hash(self, name, seen=()):
+        """Hash a template's source together with everything it references."""
+        if name in self._tree_hashes:
+            return self._tree_hashes[name]
+        if name in seen:
+            return _sha256(name)  # recursive include; the cycle is already covered
+        source_hash = _sha256(self.load_source(name))
+        deps = self._dependencies(source_hash, name)
+        if deps is None:
+            tree_hash = None
+        else:
+            parts = [source_hash]
+            for dep in deps:
+                dep_hash = self._tree_hash(dep, seen + (name,))
+                if dep_hash is None:
+                    parts = None
+                    break
+                parts.append(f"{dep}={dep_hash}")
+            tree_hash = _sha256("\0".join(parts)) if parts is not None else None
+        self._tree_hashes[name] = tree_hash
+        return tree_hash
+
+    def _dependencies(self, source_hash, name):
+        """Return the templates a source references, parsing it only the first time."""
+        deps_path = self.directory / "deps" / f"{source_hash}.json"
+        try:
+            return json.loads(deps_path.read_text(encoding="utf-8"))
+        except (FileNotFoundError, ValueError):
+            pass
+        deps = list(self.find_dependencies(self.load_source(name)))
+        if None in deps:
+            return None
+        deps = sorted(set(deps))
+        self._write_atomic(deps_path, json.dumps(deps))
+        return deps
+
+    def _entry_path(self, key):
+        return self.directory / "entries" / key[:2] / key
+
+    def get(self, key):
+        """Return a stored render, marking it recently used, or None."""
+        path = self._entry_path(key)
+        try:
+            content = path.read_text(encoding="utf-8")
+        except FileNotFoundError:
+            return None
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            pass
+        return content
+
+    def put(self, key, content):
+        """Store a render, evicting old entries if over budget."""
+        size = self._write_atomic(self._entry_path(key), content)
+        with self._lock:
+            if self._total_bytes is None:
+                self._total_bytes = sum(size for _mtime, size, _path in self._entries())
+            else:
+                self._total_bytes += size
+            if self._total_bytes > self.max_bytes:
+                self._evict()
+
+    def _entries(self):
+        for path in (self.directory / "entries").glob("*/*"):
+            try:
+                st = path.stat()
+            except FileNotFoundError:
+                continue
+            yield st.st_mtime_ns, st.st_size, path
+
+    def _evict(self):
+        """Drop least-recently-used entries until the cache is at 90% of its budget."""
+        entries = sorted(self._entries())
+        total = sum(size for _mtime, size, _path in entries)
+        target = self.max_bytes * 9 // 10
+        for _mtime, size, path in entries:
+            if total <= target:
+                break
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+            total -= size
+        self._total_bytes = total
+
+    @staticmethod
+    def _write_atomic(path, content):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = content.encode("utf-8")
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp, path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+        return len(data)
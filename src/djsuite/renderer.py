@@ -1,8 +1,22 @@
 """Jinja2 template rendering and path mapping."""
 
+import functools
+import importlib
 import importlib.resources
+import os
+from pathlib import Path
 
 import jinja2
+import jinja2.meta
+
+from djsuite import __version__
+from djsuite.cache import env_flag, user_cache_dir
+from djsuite.packs import pack_resource
+from djsuite.pipeline import ordered_map
+from djsuite.profiling import RENDER, span
+
+# Template variables that older projects' .djsuite.json and API callers may leave out.
+CONTEXT_DEFAULTS = {"server": "wsgi"}
 
 
 def _get_template_dir():
@@ -10,17 +24,144 @@ def _get_template_dir():
     return importlib.resources.files("djsuite") / "templates"
 
 
-def create_environment():
-    """Create a Jinja2 environment configured for our templates."""
+@functools.cache
+def _load_bundle():
+    """Return the precompiled template bundle (see djsuite.bundle), or None.
+
+    None means templates are loaded from the templates directory: no bundle
+    was built, DJSUITE_NO_BUNDLE is set, or the bundle was compiled for
+    another djsuite or Jinja2 version.
+    """
+    if env_flag("DJSUITE_NO_BUNDLE"):
+        return None
+    try:
+        bundle = importlib.import_module("djsuite._bundle")
+    except ImportError:
+        return None
+    if (bundle.DJSUITE_VERSION, bundle.JINJA2_VERSION) != (__version__, jinja2.__version__):
+        return None
+    return bundle
+
+
+def _read_source(name):
+    """Read a template or static file by name, from djsuite or a template pack."""
+    resource = pack_resource(name)
+    if resource is None:
+        resource = _get_template_dir() / name
+    return resource.read_text(encoding="utf-8")
+
+
+class _PackLoader(jinja2.BaseLoader):
+    """Loads ``packs/<name>/...`` templates from installed template packs."""
+
+    def get_source(self, environment, template):
+        try:
+            resource = pack_resource(template)
+            if resource is None:
+                raise jinja2.TemplateNotFound(template)
+            source = resource.read_text(encoding="utf-8")
+        except (ValueError, FileNotFoundError) as e:
+            raise jinja2.TemplateNotFound(template) from e
+        return source, str(resource) if isinstance(resource, Path) else None, None
+
+
+def _source_loader():
+    """Loader for the template sources, also inside a zipapp or pex."""
     template_dir = _get_template_dir()
+    if isinstance(template_dir, Path):
+        return jinja2.FileSystemLoader(str(template_dir))
+    return jinja2.FunctionLoader(lambda name: (template_dir / name).read_text(encoding="utf-8"))
+
+
+def _bytecode_cache():
+    """Return the on-disk bytecode cache, or None unless DJSUITE_BYTECODE_CACHE is set.
+
+    Entries live in a per-version directory so an upgrade never loads code
+    compiled from another release's templates.
+    """
+    if not env_flag("DJSUITE_BYTECODE_CACHE"):
+        return None
+    directory = user_cache_dir("bytecode", __version__)
+    directory.mkdir(parents=True, exist_ok=True)
+    return jinja2.FileSystemBytecodeCache(str(directory))
+
+
+def create_environment(bytecode_cache=None, auto_reload=True, loader=None):
+    """Create a Jinja2 environment configured for our templates.
+
+    The default loader reads the template sources, then template packs;
+    djsuite.bundle compiles templates with this same configuration.
+    """
     env = jinja2.Environment(
-        loader=jinja2.FileSystemLoader(str(template_dir)),
+        loader=loader or jinja2.ChoiceLoader([_source_loader(), _PackLoader()]),
         keep_trailing_newline=True,
         undefined=jinja2.StrictUndefined,
+        bytecode_cache=bytecode_cache,
+        auto_reload=auto_reload,
+        # Keep every compiled template: past Jinja's default of 400, large
+        # manifests would recompile on each render.
+        cache_size=-1,
     )
+    env.globals.update(CONTEXT_DEFAULTS)
     return env
 
 
+@functools.cache
+def get_environment():
+    """Return the process-wide environment, creating it on first use.
+
+    Templates come precompiled from the bundle when one is installed;
+    otherwise they are compiled once and kept in the environment's cache.
+    The shipped templates don't change while djsuite runs, so auto-reload
+    is off.
+    """
+    bundle = _load_bundle()
+    if bundle is not None:
+        loader = jinja2.ChoiceLoader([jinja2.ModuleLoader(list(bundle.__path__)), _PackLoader()])
+        return create_environment(auto_reload=False, loader=loader)
+    return create_environment(bytecode_cache=_bytecode_cache(), auto_reload=False)
+
+
+@functools.cache
+def get_render_cache():
+    """Return the process-wide render cache, or None unless DJSUITE_RENDER_CACHE is set.
+
+    The size budget defaults to 64 MB and can be changed with
+    DJSUITE_RENDER_CACHE_MAX_MB.
+    """
+    if not env_flag("DJSUITE_RENDER_CACHE"):
+        return None
+    from djsuite.render_cache import DEFAULT_MAX_BYTES, RenderCache
+
+    max_mb = os.environ.get("DJSUITE_RENDER_CACHE_MAX_MB")
+    max_bytes = int(float(max_mb) * 1024 * 1024) if max_mb else DEFAULT_MAX_BYTES
+    bundle = _load_bundle()
+    if bundle is not None:
+        # The bundle carries each template's source hash and references, so
+        # the cache keys on those instead of reading and parsing sources.
+        # Template pack sources aren't bundled and are read as usual.
+        dependencies = dict(bundle.TEMPLATES.values())
+        return RenderCache(
+            user_cache_dir("render"),
+            load_source=lambda name: bundle.TEMPLATES[name][0] if name in bundle.TEMPLATES else _read_source(name),
+            find_dependencies=lambda source: (
+                dependencies[source] if source in dependencies else jinja2.meta.find_referenced_templates(get_environment().parse(source))
+            ),
+            max_bytes=max_bytes,
+        )
+    return RenderCache(
+        user_cache_dir("render"),
+        load_source=_read_source,
+        find_dependencies=lambda source: jinja2.meta.find_referenced_templates(get_environment().parse(source)),
+        max_bytes=max_bytes,
+    )
+
+
+def _render_jinja(full_template_path, context):
+    template = get_environment().get_template(full_template_path)
+    return template.render(**context)
+
+
 def render_template(dir_prefix, template_path, context):
     """Render a single template with the given context.
 
@@ -30,17 +171,19 @@ def render_template(dir_prefix, template_path, context):
         context: template variables dict
 
     For .j2 templates, renders with Jinja2.
-    For static files (no .j2 suffix), reads the file content verbatim.
+    For static files (no .j2 suffix), returns the file content verbatim.
     """
     full_template_path = f"{dir_prefix}/{template_path}"
     if template_path.endswith(".j2"):
-        env = create_environment()
-        template = env.get_template(full_template_path)
-        return template.render(**context)
+        cache = get_render_cache()
+        if cache is not None:
+            return cache.render(full_template_path, context, _render_jinja)
+        return _render_jinja(full_template_path, context)
     else:
-        template_dir = _get_template_dir()
-        resource = template_dir / full_template_path
-        return resource.read_text(encoding="utf-8")
+        bundle = _load_bundle()
+        if bundle is not None and full_template_path in bundle.STATIC:
+            return bundle.STATIC[full_template_path]
+        return _read_source(full_template_path)
 
 
 def render_all(manifest, context):
@@ -55,5 +198,27 @@ def render_all(manifest, context):
     """
     results = {}
     for (dir_prefix, template_path), (output_path, _group) in manifest.items():
-        results[output_path] = render_template(dir_prefix, template_path, context)
+        with span(output_path, RENDER):
+            results[output_path] = render_template(dir_prefix, template_path, context)
     return results
+
+
+def iter_render(manifest, context, max_workers=None):
+    """Render the manifest on a thread pool, yielding files in output-path order.
+
+    Args:
+        manifest: Manifest of (dir_prefix, template_path) -> (output_path, group)
+        context: template variables dict
+        max_workers: render pool size (default: pipeline.default_workers())
+
+    Yields:
+        (output_path, rendered_content) tuples, sorted by output_path
+    """
+    entries = manifest.sorted_items()
+
+    def render(entry):
+        (dir_prefix, template_path), (output_path, _group) = entry
+        with span(output_path, RENDER):
+            return output_path, render_template(dir_prefix, template_path, context)
+
+    return ordered_map(render, entries, max_workers)
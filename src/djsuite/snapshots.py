@@ -0,0 +1,109 @@
+"""Store of the rendered content each project file was last written from.
+
+Three-way merges (see djsuite.merge) need the "base": the template output
+a file started from before the user edited it. Every rendered file djsuite
+writes is kept in one zip archive at the project root, deflated and stored
+once per content hash (the member name)::
+
+    <project>/.djsuite-base.zip
+
+A file's base is named by its .djsuite.json index entry: ``"base"`` when
+the file holds merged content, otherwise ``"sha256"``. Commit the archive
+along with .djsuite.json so merges work from any checkout. It is replaced
+atomically, never modified in place.
+"""
+
+import os
+import shutil
+import tempfile
+import zipfile
+from pathlib import Path
+
+from djsuite.index import content_hash
+
+SNAPSHOT_NAME = ".djsuite-base.zip"
+
+# Fixed member timestamp (the zip epoch), so the archive only changes with its content.
+_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+
+
+def base_hash(entry):
+    """Return the content hash of the rendered base an index entry points to, or None."""
+    if entry is None:
+        return None
+    return entry.get("base", entry["sha256"])
+
+
+def add_member(archive, digest, content):
+    """Add one snapshot to an open zipfile.ZipFile."""
+    info = zipfile.ZipInfo(digest, date_time=_DATE_TIME)
+    info.compress_type = zipfile.ZIP_DEFLATED
+    archive.writestr(info, content.encode("utf-8"), compresslevel=1)
+
+
+def save_snapshots(root, snapshots, keep=None):
+    """Add snapshots to the store under ``root`` (a project or staged project).
+
+    Args:
+        root: directory holding the store
+        snapshots: dict of content hash -> rendered content; hashes already
+            stored are skipped
+        keep: if given, only these hashes (and the added ones) stay stored
+
+    Returns:
+        number of snapshots added
+    """
+    path = Path(root) / SNAPSHOT_NAME
+    try:
+        with zipfile.ZipFile(path) as archive:
+            stored = set(archive.namelist())
+    except (FileNotFoundError, zipfile.BadZipFile):
+        stored = set()
+    new = {digest: content for digest, content in snapshots.items() if digest not in stored}
+    drop = stored - set(keep) - set(snapshots) if keep is not None else set()
+    if not new and not drop:
+        return 0
+
+    fd, tmp = tempfile.mkstemp(dir=root, prefix=f"{SNAPSHOT_NAME}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w+b") as f:
+            if stored and not drop:
+                with open(path, "rb") as old:
+                    shutil.copyfileobj(old, f)
+                mode = "a"
+            else:
+                mode = "w"
+            with zipfile.ZipFile(f, mode) as archive:
+                if drop:
+                    with zipfile.ZipFile(path) as old:
+                        for digest in sorted(stored - drop):
+                            add_member(archive, digest, old.read(digest).decode("utf-8"))
+                for digest, content in sorted(new.items()):
+                    add_member(archive, digest, content)
+        os.chmod(tmp, 0o644)
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+    return len(new)
+
+
+def store_snapshots(project_dir, contents):
+    """Store rendered content strings unless already stored (see save_snapshots())."""
+    return save_snapshots(project_dir, {content_hash(content): content for content in contents})
+
+
+def load_snapshot(project_dir, digest):
+    """Return the rendered content stored for a hash, or None if it isn't stored."""
+    if digest is None:
+        return None
+    try:
+        with zipfile.ZipFile(Path(project_dir) / SNAPSHOT_NAME) as archive:
+            return archive.read(digest).decode("utf-8")
+    except (FileNotFoundError, KeyError, zipfile.BadZipFile):
+        return None
+
+
+def prune_snapshots(project_dir, index):
+    """Drop snapshots no index entry refers to as its base."""
+    save_snapshots(project_dir, {}, keep={base_hash(entry) for entry in index.values()})
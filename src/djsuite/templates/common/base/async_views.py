@@ -0,0 +1,169 @@
+"""Async counterparts of the base views, routed when the project is served over ASGI.
+
+Under uvicorn workers these run on the event loop, so a request waiting on
+the database or the result backend holds a coroutine rather than a worker
+thread. Database and Celery result lookups have no usable async API here
+and go through sync_to_async in thread-sensitive mode, as Django requires
+for ORM access; readiness checks run on base.services.health_service's
+own threads. Responses match base.views.
+"""
+
+import asyncio
+import json
+
+from asgiref.sync import sync_to_async
+from celery.result import AsyncResult
+from django.http import JsonResponse, StreamingHttpResponse
+from django.views import View
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework.request import Request
+from rest_framework.settings import api_settings
+from rest_framework.status import (
+    HTTP_200_OK,
+    HTTP_400_BAD_REQUEST,
+    HTTP_401_UNAUTHORIZED,
+    HTTP_500_INTERNAL_SERVER_ERROR,
+    HTTP_503_SERVICE_UNAVAILABLE,
+)
+
+from base.services.health_service import health_service
+from base.services.task_status_service import StatusStream, parse_task_ids, task_status_service
+
+
+def _error(status, error_type, code, detail, attr=None):
+    """An error response in drf-standardized-errors format."""
+    return JsonResponse(
+        {"type": error_type, "errors": [{"code": code, "detail": detail, "attr": attr}]},
+        status=status,
+    )
+
+
+def _authenticate(request):
+    """Return the user authenticated by REST_FRAMEWORK's authentication classes, or None."""
+    drf_request = Request(request, authenticators=[auth() for auth in api_settings.DEFAULT_AUTHENTICATION_CLASSES])
+    try:
+        user = drf_request.user
+    except AuthenticationFailed:
+        return None
+    return user if user.is_authenticated else None
+
+
+def _not_authenticated():
+    return _error(
+        HTTP_401_UNAUTHORIZED,
+        "client_error",
+        "not_authenticated",
+        "Authentication credentials were not provided.",
+    )
+
+
+def _task_state(task_id):
+    """Return (state, result) for a Celery task; result is None until the task finishes."""
+    result = AsyncResult(task_id)
+    state = result.state
+    return state, (result.result if state in ("SUCCESS", "FAILURE") else None)
+
+
+class AsyncLivenessView(View):
+    """Liveness check: the process is up and serving requests. Does no I/O."""
+
+    async def get(self, request, *args, **kwargs):
+        return JsonResponse({"status": "alive"}, status=HTTP_200_OK)
+
+
+class AsyncHealthCheckView(View):
+    """Readiness check of the database, cache and Celery broker (see base.services.health_service)."""
+
+    async def get(self, request, *args, **kwargs):
+        # The checks run on the health service's own threads; this only waits for them.
+        report = await sync_to_async(health_service.report, thread_sensitive=False)()
+        status = HTTP_200_OK if report["status"] == "healthy" else HTTP_503_SERVICE_UNAVAILABLE
+        return JsonResponse(report, status=status)
+
+
+class AsyncTaskStatusView(View):
+    """
+    View to check the status of a Celery task.
+    """
+
+    async def get(self, request, *args, **kwargs):
+        """
+        Retrieve the status of a Celery task by its ID.
+        """
+        if await sync_to_async(_authenticate, thread_sensitive=True)(request) is None:
+            return _not_authenticated()
+
+        task_id = request.GET.get("task_id")
+        if not task_id:
+            return _error(
+                HTTP_400_BAD_REQUEST,
+                "validation_error",
+                "required",
+                "This query parameter is required.",
+                attr="task_id",
+            )
+
+        state, result = await sync_to_async(_task_state, thread_sensitive=True)(task_id)
+
+        if state == "SUCCESS":
+            return JsonResponse({"status": state, "result": result}, status=HTTP_200_OK)
+
+        if state == "FAILURE":
+            return _error(HTTP_500_INTERNAL_SERVER_ERROR, "server_error", "error", str(result))
+
+        return JsonResponse({"status": state}, status=HTTP_200_OK)
+
+
+class AsyncTaskStatusBatchView(View):
+    """
+    View to check the status of many Celery tasks in one request.
+    """
+
+    @classmethod
+    def as_view(cls, **initkwargs):
+        # Authenticated by token like DRF views, so exempt from CSRF like them.
+        view = super().as_view(**initkwargs)
+        view.csrf_exempt = True
+        return view
+
+    async def post(self, request, *args, **kwargs):
+        if await sync_to_async(_authenticate, thread_sensitive=True)(request) is None:
+            return _not_authenticated()
+        try:
+            task_ids = parse_task_ids(json.loads(request.body or b"{}").get("task_ids"))
+        except (ValueError, AttributeError) as e:
+            return _error(HTTP_400_BAD_REQUEST, "validation_error", "invalid", str(e), attr="task_ids")
+        statuses = await sync_to_async(task_status_service.statuses, thread_sensitive=True)(task_ids)
+        return JsonResponse({"tasks": statuses}, status=HTTP_200_OK)
+
+
+async def _stream(task_ids):
+    status_stream = StatusStream(task_ids)
+    yield status_stream.opening()
+    while True:
+        statuses = await sync_to_async(task_status_service.statuses, thread_sensitive=True)(status_stream.pending)
+        for event in status_stream.update(statuses):
+            yield event
+        if status_stream.closed:
+            return
+        await asyncio.sleep(status_stream.interval)
+
+
+class AsyncTaskStatusStreamView(View):
+    """
+    Server-Sent Events stream of Celery task status changes.
+
+    Waiting streams sleep on the event loop, so one worker can hold many.
+    """
+
+    async def get(self, request, *args, **kwargs):
+        if await sync_to_async(_authenticate, thread_sensitive=True)(request) is None:
+            return _not_authenticated()
+        try:
+            task_ids = parse_task_ids(request.GET.get("task_ids", ""))
+        except ValueError as e:
+            return _error(HTTP_400_BAD_REQUEST, "validation_error", "invalid", str(e), attr="task_ids")
+        response = StreamingHttpResponse(_stream(task_ids), content_type="text/event-stream")
+        response["Cache-Control"] = "no-cache"
+        response["X-Accel-Buffering"] = "no"  # stop nginx from buffering events
+        return response
@@ -14,6 +14,8 @@ Wire the container in your app's configuration to enable injection.
 
 from dependency_injector import containers, providers
 
+from base.services.cache_service import cache_service
+
 
 class Container(containers.DeclarativeContainer):
     """
@@ -21,3 +23,5 @@ class Container(containers.DeclarativeContainer):
     Add providers here, e.g.:
         my_service = providers.Singleton(MyService)
     """
+
+    cache_service = providers.Object(cache_service)
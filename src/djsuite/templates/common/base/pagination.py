@@ -1,20 +1,202 @@
-from rest_framework.pagination import PageNumberPagination
+import base64
+import binascii
+import json
+from functools import cached_property
+
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.core.paginator import InvalidPage, Page, PageNotAnInteger, Paginator
+from django.db import connections
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import CursorPagination, PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
 
 
 class StandardResultsSetPagination(PageNumberPagination):
     page_size = 10
     page_size_query_param = "page_size"
     max_page_size = 100
+    # Most rows returned when the client asks for no page at all.
+    max_unpaginated_results = 1000
 
     def paginate_queryset(self, queryset, request, view=None):
         """
-        Override pagination to bypass it if pagination query parameters are missing.
-        This method checks if the request contains either a "page" parameter or the custom
-        page size query parameter. If neither is present, pagination is bypassed and all results
-        are returned.
+        Paginate when the request has a "page" or page size parameter.
+
+        Without either, the results are returned as a plain list, as before, but
+        capped at max_unpaginated_results; the X-Truncated header tells the client
+        the list was cut short.
         """
 
         qp = request.query_params
         if "page" not in qp and self.page_size_query_param not in qp:
-            return None  # bypass pagination for this request
+            self.page = None
+            results = list(queryset[: self.max_unpaginated_results + 1])
+            self.truncated = len(results) > self.max_unpaginated_results
+            return results[: self.max_unpaginated_results]
         return super().paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        if self.page is None:
+            return Response(data, headers={"X-Truncated": "true"} if self.truncated else None)
+        return super().get_paginated_response(data)
+
+
+class EstimatedCountPage(Page):
+    """A page whose has_next() comes from fetching one row past it, not from the count."""
+
+    has_more = False
+
+    def has_next(self):
+        return self.has_more
+
+    def end_index(self):
+        return (self.number - 1) * self.paginator.per_page + len(self)
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Paginator that estimates large counts instead of running COUNT(*).
+
+    On PostgreSQL, an unfiltered queryset's count comes from pg_class.reltuples
+    (maintained by ANALYZE/autovacuum) and a filtered one's from the planner's
+    row estimate. Estimates below exact_count_below are replaced by an exact
+    COUNT, which is cheap for small results. Pages are sliced without clamping
+    to the count, so rows past an estimate that runs low stay reachable; each
+    page fetches one extra row to know whether another page follows.
+    """
+
+    exact_count_below = 10_000
+    count_is_estimate = False
+
+    @cached_property
+    def count(self):
+        estimate = self.estimate_count()
+        if estimate is None or estimate < self.exact_count_below:
+            return super().count
+        self.count_is_estimate = True
+        return estimate
+
+    def estimate_count(self):
+        """Estimated row count of object_list, or None if it can't be estimated."""
+        queryset = self.object_list
+        if not hasattr(queryset, "query") or connections[queryset.db].vendor != "postgresql":
+            return None
+        if not queryset.query.where and not queryset.query.distinct and not queryset.query.is_sliced:
+            with connections[queryset.db].cursor() as cursor:
+                cursor.execute("SELECT reltuples FROM pg_class WHERE oid = %s::regclass", [queryset.model._meta.db_table])
+                row = cursor.fetchone()
+            # reltuples is -1 until the table has been analyzed.
+            return int(row[0]) if row and row[0] >= 0 else None
+        plan = json.loads(queryset.explain(format="json"))
+        return int(plan[0]["Plan"]["Plan Rows"])
+
+    def validate_number(self, number):
+        try:
+            number = int(number)
+        except (TypeError, ValueError) as e:
+            raise PageNotAnInteger("That page number is not an integer") from e
+        if number < 1:
+            raise InvalidPage("That page number is less than 1")
+        return number
+
+    def page(self, number):
+        number = self.validate_number(number)
+        bottom = (number - 1) * self.per_page
+        rows = list(self.object_list[bottom : bottom + self.per_page + 1])
+        page = EstimatedCountPage(rows[: self.per_page], number, self)
+        page.has_more = len(rows) > self.per_page
+        return page
+
+
+class EstimatedCountPagination(StandardResultsSetPagination):
+    """Page-number pagination whose "count" is estimated for large tables (see EstimatedCountPaginator)."""
+
+    django_paginator_class = EstimatedCountPaginator
+
+    def get_paginated_response(self, data):
+        response = super().get_paginated_response(data)
+        if self.page is not None:
+            response.data["count_is_estimate"] = self.page.paginator.count_is_estimate
+        return response
+
+
+class KeysetPagination(CursorPagination):
+    """
+    Keyset pagination on (created_at, id), newest first, for TimeStampMixin models.
+
+    DRF's CursorPagination positions on a single field and skips ties with an
+    OFFSET; this filters on the full (created_at, id) key instead, so every page
+    is one indexed range query whatever its depth, with no COUNT and no OFFSET.
+    Clients follow the opaque "next"/"previous" links. Add a composite index on
+    ("created_at", "id") to models paginated this way; a view whose model names
+    its timestamp differently can set ``keyset_ordering``.
+    """
+
+    page_size = 10
+    page_size_query_param = "page_size"
+    max_page_size = 100
+    # Fields must all sort in the same direction.
+    ordering = ("-created_at", "-id")
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.base_url = request.build_absolute_uri()
+        self.page_size = self.get_page_size(request)
+        ordering = getattr(view, "keyset_ordering", None) or self.ordering
+        self.fields = [field.lstrip("-") for field in ordering]
+        self.descending = ordering[0].startswith("-")
+        cursor = self._decode(request, queryset.model)
+        reverse = cursor is not None and cursor["reverse"]
+
+        if cursor is not None:
+            queryset = queryset.filter(self._beyond(cursor["values"], reverse))
+        # Walking backwards, fetch in the opposite order and flip the page afterwards.
+        order = [f"-{field}" if self.descending != reverse else field for field in self.fields]
+        rows = list(queryset.order_by(*order)[: self.page_size + 1])
+        has_more = len(rows) > self.page_size
+        rows = rows[: self.page_size]
+        if reverse:
+            rows.reverse()
+
+        self.next_values = self._values(rows[-1]) if rows and (has_more or reverse) else None
+        self.previous_values = self._values(rows[0]) if rows and cursor is not None and (has_more or not reverse) else None
+        self.display_page_controls = self.template is not None
+        return rows
+
+    def _beyond(self, values, reverse):
+        """Rows past ``values`` in the direction of travel, e.g. (created_at, id) < values going forward."""
+        lookup = "lt" if self.descending != reverse else "gt"
+        condition = Q()
+        for i, field in enumerate(self.fields):
+            equal = {prior: values[j] for j, prior in enumerate(self.fields[:i])}
+            condition |= Q(**equal, **{f"{field}__{lookup}": values[i]})
+        return condition
+
+    def _values(self, obj):
+        return [getattr(obj, field) for field in self.fields]
+
+    def _decode(self, request, model):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if encoded is None:
+            return None
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(encoded.encode()))
+            values = [model._meta.get_field(field).to_python(value) for field, value in zip(self.fields, payload["v"], strict=True)]
+            return {"values": values, "reverse": bool(payload.get("r"))}
+        except (binascii.Error, ValueError, TypeError, KeyError, DjangoValidationError) as e:
+            raise NotFound(self.invalid_cursor_message) from e
+
+    def _link(self, values, reverse):
+        # Full-precision isoformat: DjangoJSONEncoder would cut microseconds and skip rows.
+        values = [value.isoformat() if hasattr(value, "isoformat") else value for value in values]
+        payload = json.dumps({"v": values, "r": int(reverse)})
+        encoded = base64.urlsafe_b64encode(payload.encode()).decode()
+        return replace_query_param(self.base_url, self.cursor_query_param, encoded)
+
+    def get_next_link(self):
+        return self._link(self.next_values, reverse=False) if self.next_values else None
+
+    def get_previous_link(self):
+        return self._link(self.previous_values, reverse=True) if self.previous_values else None
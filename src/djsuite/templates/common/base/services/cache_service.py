@@ -0,0 +1,184 @@
+"""
+Cache-aside helper on top of Django's cache framework.
+
+Values are computed on a miss, stored with a TTL and served from the cache
+until they expire or one of their tags is invalidated:
+
+    @cached(ttl=60, tags=lambda org_id: [f"org:{org_id}"])
+    def org_dashboard(org_id):
+        ...
+
+    invalidate_on_save(Invoice, lambda invoice: [f"org:{invoice.org_id}"])
+
+Stampedes are avoided two ways. A value close to expiry is recomputed
+early by a single, randomly chosen reader (probabilistic early expiration,
+"XFetch"), while everyone else keeps getting the cached copy. On a cold
+miss (first read, eviction, invalidated tag) one process takes a short
+lock and computes; the others wait for its result instead of all hitting
+the database at once.
+
+Tags are versioned rather than deleted: each tag has a version stored in
+the cache and every key embeds the versions of its tags, so invalidating a
+tag is a single write and stale entries simply age out.
+"""
+
+import functools
+import hashlib
+import math
+import random
+import time
+import uuid
+
+from django.core.cache import caches
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+
+LOCK_TIMEOUT = 10  # seconds a recompute may hold the lock
+LOCK_WAIT = 2  # seconds other readers wait for it before computing themselves
+LOCK_POLL = 0.05
+
+
+def model_tag(model):
+    """The tag invalidate_on_save() expires whenever an instance of ``model`` changes."""
+    return f"model:{model._meta.label_lower}"
+
+
+class CacheService:
+    """Cache-aside reads with tag invalidation and stampede protection."""
+
+    def __init__(self, alias="default", beta=1.0):
+        """
+        Args:
+            alias: name of the cache in settings.CACHES
+            beta: eagerness of early recomputation; above 1 recomputes
+                earlier, 0 disables it
+        """
+        self.alias = alias
+        self.beta = beta
+
+    @property
+    def cache(self):
+        return caches[self.alias]
+
+    def _tag_versions(self, tags):
+        keys = [f"tag:{tag}" for tag in sorted(set(tags))]
+        versions = self.cache.get_many(keys)
+        for key in keys:
+            if key not in versions:
+                self.cache.add(key, uuid.uuid4().hex, None)
+                versions[key] = self.cache.get(key) or ""
+        return [versions[key] for key in keys]
+
+    def _key(self, key, tags):
+        if not tags:
+            return key
+        digest = hashlib.sha1(".".join(self._tag_versions(tags)).encode()).hexdigest()[:12]
+        return f"{key}:{digest}"
+
+    def _is_fresh(self, delta, expiry):
+        # XFetch: recompute early with a probability that grows as expiry
+        # nears and with how long the value took to compute (delta).
+        return time.time() - delta * self.beta * math.log(1.0 - random.random()) < expiry
+
+    def get_or_set(self, key, compute, ttl, tags=()):
+        """Return the cached value for ``key``, computing and storing it if needed.
+
+        Args:
+            key: cache key (the cache's KEY_PREFIX is added by Django)
+            compute: zero-argument callable producing the value
+            ttl: seconds the value stays cached
+            tags: names that invalidate_tags() can later expire it by
+        """
+        cache = self.cache
+        full_key = self._key(key, tags)
+        entry = cache.get(full_key)
+        if entry is not None:
+            value, delta, expiry = entry
+            if self._is_fresh(delta, expiry):
+                return value
+            return self._compute(full_key, compute, ttl)
+
+        lock_key = f"lock:{full_key}"
+        if cache.add(lock_key, 1, LOCK_TIMEOUT):
+            try:
+                return self._compute(full_key, compute, ttl)
+            finally:
+                cache.delete(lock_key)
+        deadline = time.monotonic() + LOCK_WAIT
+        while time.monotonic() < deadline:
+            time.sleep(LOCK_POLL)
+            entry = cache.get(full_key)
+            if entry is not None:
+                return entry[0]
+        return self._compute(full_key, compute, ttl)
+
+    def _compute(self, full_key, compute, ttl):
+        start = time.monotonic()
+        value = compute()
+        delta = time.monotonic() - start
+        self.cache.set(full_key, (value, delta, time.time() + ttl), ttl)
+        return value
+
+    def invalidate_tags(self, *tags):
+        """Expire every value cached under any of ``tags``."""
+        if tags:
+            self.cache.set_many({f"tag:{tag}": uuid.uuid4().hex for tag in tags}, None)
+
+    def invalidate_on_save(self, model, tags=None):
+        """Invalidate tags whenever an instance of ``model`` is saved or deleted.
+
+        The model's own tag (see model_tag()) is always invalidated. Tags
+        are expired once the surrounding transaction commits, so no reader
+        can cache data from before the write.
+
+        Args:
+            model: a Django model class
+            tags: extra tags, or a callable taking the instance and
+                returning them
+        """
+
+        def handler(sender, instance, **kwargs):
+            names = [model_tag(model)]
+            if callable(tags):
+                names.extend(tags(instance))
+            elif tags:
+                names.extend(tags)
+            transaction.on_commit(lambda: self.invalidate_tags(*names))
+
+        uid = f"cache_service:{self.alias}:{model_tag(model)}:{id(tags)}"
+        post_save.connect(handler, sender=model, weak=False, dispatch_uid=f"{uid}:save")
+        post_delete.connect(handler, sender=model, weak=False, dispatch_uid=f"{uid}:delete")
+
+    def cached(self, ttl, key=None, tags=()):
+        """Decorator caching a function's result per arguments (see get_or_set()).
+
+        Args:
+            ttl: seconds results stay cached
+            key: callable building the cache key from the call's arguments;
+                defaults to the function's name plus a hash of its arguments
+            tags: tags, or a callable taking the call's arguments and
+                returning them
+        """
+
+        def decorator(func):
+            name = f"{func.__module__}.{func.__qualname__}"
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                if key is not None:
+                    cache_key = key(*args, **kwargs)
+                else:
+                    digest = hashlib.sha1(repr((args, sorted(kwargs.items()))).encode()).hexdigest()
+                    cache_key = f"{name}:{digest}"
+                call_tags = tags(*args, **kwargs) if callable(tags) else tags
+                return self.get_or_set(cache_key, lambda: func(*args, **kwargs), ttl, tags=call_tags)
+
+            return wrapper
+
+        return decorator
+
+
+cache_service = CacheService()
+cached = cache_service.cached
+invalidate_tags = cache_service.invalidate_tags
+invalidate_on_save = cache_service.invalidate_on_save
@@ -0,0 +1,122 @@
+"""
+Readiness checks for the database, the cache and the Celery broker.
+
+The checks run concurrently on a small per-process thread pool, each with
+its own timeout, and the combined report is kept for
+HEALTH_CHECK_CACHE_SECONDS: however many probes arrive, each process
+touches every dependency at most once per interval. A check is never
+started twice at once: probes arriving while it runs wait for the same
+run, so a check that hangs past its timeout holds one thread and is
+reported as timed out, without queueing the other checks behind it.
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import connections
+
+from main.celery import app as celery_app
+
+OK = "ok"
+ERROR = "error"
+
+
+def check_database():
+    # Runs on a pool thread, outside any request cycle that would recycle
+    # its connection, so connect afresh each time (at most once per interval).
+    connection = connections["default"]
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT 1")
+    finally:
+        connection.close()
+
+
+def check_cache():
+    cache = caches["default"]
+    cache.set("health:ready", 1, 10)
+    if cache.get("health:ready") != 1:
+        raise RuntimeError("cache did not return the value just written")
+
+
+def check_broker():
+    timeout = getattr(settings, "HEALTH_CHECK_TIMEOUT", 2)
+    with celery_app.connection_for_write(connect_timeout=timeout) as connection:
+        connection.ensure_connection(max_retries=1, timeout=timeout)
+
+
+CHECKS = {
+    "database": check_database,
+    "cache": check_cache,
+    "broker": check_broker,
+}
+
+
+class HealthService:
+    """Runs CHECKS concurrently and caches the combined report."""
+
+    def __init__(self, checks=None):
+        self.checks = dict(checks or CHECKS)
+        self._executor = ThreadPoolExecutor(max_workers=len(self.checks), thread_name_prefix="health")
+        self._lock = threading.Lock()
+        self._running = {}
+        self._report = None
+        self._expires = 0.0
+
+    @staticmethod
+    def _run(check):
+        start = time.perf_counter()
+        try:
+            check()
+            result = {"status": OK}
+        except Exception as exc:
+            result = {"status": ERROR, "error": f"{type(exc).__name__}: {exc}"}
+        result["latency_ms"] = round((time.perf_counter() - start) * 1000, 1)
+        return result
+
+    def _submit_all(self):
+        """Start every check that isn't still running from an earlier probe."""
+        with self._lock:
+            for name, check in self.checks.items():
+                future = self._running.get(name)
+                if future is None or future.done():
+                    self._running[name] = self._executor.submit(self._run, check)
+            return {name: self._running[name] for name in self.checks}
+
+    def _run_all(self):
+        timeout = getattr(settings, "HEALTH_CHECK_TIMEOUT", 2)
+        start = time.perf_counter()
+        futures = self._submit_all()
+        results = {}
+        for name, future in futures.items():
+            try:
+                results[name] = future.result(timeout=max(0.0, start + timeout - time.perf_counter()))
+            except FutureTimeoutError:
+                elapsed = round((time.perf_counter() - start) * 1000, 1)
+                results[name] = {"status": ERROR, "error": f"timed out after {timeout}s", "latency_ms": elapsed}
+        healthy = all(result["status"] == OK for result in results.values())
+        return {"status": "healthy" if healthy else "unhealthy", "checks": results}
+
+    def report(self):
+        """Return the readiness report, running the checks if the cached one expired.
+
+        Returns:
+            {"status": "healthy" | "unhealthy",
+             "checks": {name: {"status", "latency_ms"[, "error"]}}}
+        """
+        with self._lock:
+            if self._report is not None and time.monotonic() < self._expires:
+                return self._report
+        # Wait for the checks without the lock, so a slow check can't hold up cached reports.
+        report = self._run_all()
+        with self._lock:
+            self._report = report
+            self._expires = time.monotonic() + getattr(settings, "HEALTH_CHECK_CACHE_SECONDS", 5)
+        return report
+
+
+health_service = HealthService()
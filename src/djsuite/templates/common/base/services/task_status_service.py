@@ -0,0 +1,130 @@
+"""
+Celery task statuses for many tasks at once, read from the django-db result backend.
+
+statuses() resolves any number of task IDs with a single TaskResult query.
+Tasks in a terminal state (SUCCESS, FAILURE, REVOKED) never change again,
+so their statuses are cached and later lookups skip the database. stream()
+builds on it to push Server-Sent Events as statuses change.
+"""
+
+import json
+import time
+
+from celery import states
+from django.conf import settings
+from django.core.cache import cache
+from django_celery_results.models import TaskResult
+
+MAX_TASK_IDS = 100
+TERMINAL_CACHE_SECONDS = 24 * 60 * 60
+
+
+def _cache_key(task_id):
+    return f"task-status:{task_id}"
+
+
+def parse_task_ids(value):
+    """Task IDs from a JSON list or a comma-separated string.
+
+    Raises:
+        ValueError: no IDs, more than MAX_TASK_IDS, or not strings
+    """
+    if isinstance(value, str):
+        value = [task_id.strip() for task_id in value.split(",") if task_id.strip()]
+    if not isinstance(value, list) or not value or not all(isinstance(task_id, str) for task_id in value):
+        raise ValueError("Provide one or more task IDs.")
+    if len(value) > MAX_TASK_IDS:
+        raise ValueError(f"At most {MAX_TASK_IDS} task IDs per request.")
+    return value
+
+
+def _decode(row):
+    """The status dict for a TaskResult row."""
+    status = {"status": row.status}
+    if row.status not in states.READY_STATES or row.result is None:
+        return status
+    result = json.loads(row.result) if row.content_type == "application/json" else row.result
+    if row.status == states.SUCCESS:
+        status["result"] = result
+    elif isinstance(result, dict) and "exc_type" in result:
+        status["error"] = f"{result['exc_type']}: {result.get('exc_message')}"
+    else:
+        status["error"] = str(result)
+    return status
+
+
+class TaskStatusService:
+    """Batched, cached task status lookups."""
+
+    def statuses(self, task_ids):
+        """Return {task_id: {"status"[, "result" | "error"]}} for every ID.
+
+        Tasks with no stored result are PENDING, as with AsyncResult.
+        """
+        task_ids = list(dict.fromkeys(task_ids))
+        cached = cache.get_many([_cache_key(task_id) for task_id in task_ids])
+        found = {task_id: cached[_cache_key(task_id)] for task_id in task_ids if _cache_key(task_id) in cached}
+        missing = [task_id for task_id in task_ids if task_id not in found]
+        if missing:
+            rows = TaskResult.objects.filter(task_id__in=missing).only("task_id", "status", "result", "content_type")
+            terminal = {}
+            for row in rows:
+                found[row.task_id] = _decode(row)
+                if row.status in states.READY_STATES:
+                    terminal[_cache_key(row.task_id)] = found[row.task_id]
+            if terminal:
+                cache.set_many(terminal, TERMINAL_CACHE_SECONDS)
+        return {task_id: found.get(task_id, {"status": states.PENDING}) for task_id in task_ids}
+
+    def stream(self, task_ids):
+        """Yield Server-Sent Events as the tasks' statuses change (see StatusStream)."""
+        status_stream = StatusStream(task_ids)
+        yield status_stream.opening()
+        while True:
+            yield from status_stream.update(self.statuses(status_stream.pending))
+            if status_stream.closed:
+                return
+            time.sleep(status_stream.interval)
+
+
+class StatusStream:
+    """State of one Server-Sent Events stream, shared by the sync and async views.
+
+    Each status change is sent as a ``status`` event whose data is
+    {"task_id", "status"[, "result" | "error"]}. A ``done`` event follows
+    once every task has finished; otherwise the stream closes after
+    TASK_STATUS_STREAM_TIMEOUT seconds and EventSource clients reconnect.
+    Callers poll statuses of ``pending`` tasks every ``interval`` seconds
+    (TASK_STATUS_STREAM_INTERVAL).
+    """
+
+    def __init__(self, task_ids):
+        self.pending = list(dict.fromkeys(task_ids))
+        self.interval = getattr(settings, "TASK_STATUS_STREAM_INTERVAL", 1)
+        self.deadline = time.monotonic() + getattr(settings, "TASK_STATUS_STREAM_TIMEOUT", 25)
+        self.sent = {}
+        self.finished = False
+
+    def opening(self):
+        """The first event: how long EventSource waits before reconnecting."""
+        return f"retry: {int(self.interval * 1000)}\n\n"
+
+    def update(self, statuses):
+        """Return the events for a poll's statuses, and drop finished tasks from ``pending``."""
+        events = []
+        for task_id, status in statuses.items():
+            if self.sent.get(task_id) != status:
+                self.sent[task_id] = status
+                events.append(f"event: status\ndata: {json.dumps({'task_id': task_id, **status})}\n\n")
+        self.pending = [task_id for task_id in self.pending if self.sent[task_id]["status"] not in states.READY_STATES]
+        if not self.pending:
+            self.finished = True
+            events.append("event: done\ndata: {}\n\n")
+        return events
+
+    @property
+    def closed(self):
+        return self.finished or time.monotonic() >= self.deadline
+
+
+task_status_service = TaskStatusService()
@@ -0,0 +1,55 @@
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+
+from base.services.cache_service import CacheService, model_tag
+
+
+@pytest.fixture
+def service():
+    cache.clear()
+    return CacheService()
+
+
+def test_get_or_set_when_cached_then_does_not_recompute(service: CacheService) -> None:
+    """Verify a cached value is served without calling compute again."""
+    calls = []
+    for _ in range(3):
+        value = service.get_or_set("answer", lambda: calls.append(1) or 42, ttl=60)
+    assert value == 42
+    assert len(calls) == 1
+
+
+def test_invalidate_tags_when_tag_expired_then_recomputes(service: CacheService) -> None:
+    """Verify invalidating a tag expires every value cached under it."""
+    counter = iter(range(10))
+    first = service.get_or_set("tagged", lambda: next(counter), ttl=60, tags=["org:1"])
+    service.invalidate_tags("org:2")
+    assert service.get_or_set("tagged", lambda: next(counter), ttl=60, tags=["org:1"]) == first
+    service.invalidate_tags("org:1")
+    assert service.get_or_set("tagged", lambda: next(counter), ttl=60, tags=["org:1"]) != first
+
+
+def test_cached_decorator_when_called_with_same_args_then_caches_per_args(service: CacheService) -> None:
+    """Verify the decorator caches results separately per argument list."""
+    calls = []
+
+    @service.cached(ttl=60)
+    def square(n):
+        calls.append(n)
+        return n * n
+
+    assert [square(2), square(2), square(3)] == [4, 4, 9]
+    assert calls == [2, 3]
+
+
+@pytest.mark.django_db
+def test_invalidate_on_save_when_model_saved_then_tag_expires(service: CacheService, django_capture_on_commit_callbacks) -> None:
+    """Verify saving a model instance invalidates its model tag after commit."""
+    user_model = get_user_model()
+    service.invalidate_on_save(user_model)
+    counter = iter(range(10))
+    first = service.get_or_set("users", lambda: next(counter), ttl=60, tags=[model_tag(user_model)])
+    with django_capture_on_commit_callbacks(execute=True):
+        user_model.objects.create(username="cache-test")
+    assert service.get_or_set("users", lambda: next(counter), ttl=60, tags=[model_tag(user_model)]) != first
@@ -0,0 +1,69 @@
+import threading
+
+import pytest
+from django.urls import reverse
+from rest_framework.status import HTTP_200_OK, HTTP_503_SERVICE_UNAVAILABLE
+from rest_framework.test import APIClient
+
+from base.services.health_service import HealthService, check_database, health_service
+
+
+@pytest.fixture
+def database_only(settings, monkeypatch):
+    """Check only the database, without reusing earlier reports."""
+    settings.HEALTH_CHECK_CACHE_SECONDS = 0
+    monkeypatch.setattr(health_service, "checks", {"database": check_database})
+
+
+def test_liveness_when_called_then_returns_200(api_client: APIClient) -> None:
+    """Verify the liveness endpoint answers without touching any dependency."""
+    response = api_client.get(reverse("base:health-live"))
+    assert response.status_code == HTTP_200_OK
+    assert response.json()["status"] == "alive"
+
+
+@pytest.mark.django_db
+def test_health_check_when_db_reachable_then_returns_200(api_client: APIClient, database_only) -> None:
+    """Verify the health endpoint returns 200 with status 'healthy' when the database is reachable."""
+    url = reverse("base:health-check")
+    response = api_client.get(url)
+    assert response.status_code == HTTP_200_OK
+    assert response.json()["status"] == "healthy"
+    assert response.json()["checks"]["database"]["status"] == "ok"
+    assert "latency_ms" in response.json()["checks"]["database"]
+
+
+@pytest.mark.django_db
+def test_readiness_when_check_fails_then_returns_503(api_client: APIClient, settings, monkeypatch) -> None:
+    """Verify a failing dependency makes readiness return 503 with the error."""
+
+    def broken():
+        raise ConnectionError("refused")
+
+    settings.HEALTH_CHECK_CACHE_SECONDS = 0
+    monkeypatch.setattr(health_service, "checks", {"broker": broken})
+    response = api_client.get(reverse("base:health-ready"))
+    assert response.status_code == HTTP_503_SERVICE_UNAVAILABLE
+    assert response.json()["checks"]["broker"]["error"] == "ConnectionError: refused"
+
+
+def test_hung_check_does_not_hold_up_later_probes(settings) -> None:
+    """Verify a check stuck past its timeout isn't restarted and doesn't delay the other checks."""
+    release = threading.Event()
+    calls = []
+
+    def hung():
+        calls.append(1)
+        release.wait(5)
+
+    settings.HEALTH_CHECK_TIMEOUT = 0.2
+    settings.HEALTH_CHECK_CACHE_SECONDS = 0
+    service = HealthService({"hung": hung, "fast": lambda: None})
+    try:
+        for _ in range(3):
+            report = service.report()
+            assert report["checks"]["hung"]["error"] == "timed out after 0.2s"
+            assert report["checks"]["fast"]["status"] == "ok"
+        assert len(calls) == 1
+    finally:
+        release.set()
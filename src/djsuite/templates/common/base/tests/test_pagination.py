@@ -0,0 +1,98 @@
+from datetime import timedelta
+
+import pytest
+from django.utils import timezone
+from django_celery_results.models import TaskResult
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from base.pagination import EstimatedCountPagination, EstimatedCountPaginator, KeysetPagination, StandardResultsSetPagination
+
+
+class TaskResultView:
+    # TaskResult has no created_at; any (timestamp, id) key works the same way.
+    keyset_ordering = ("-date_created", "-id")
+
+
+def _request(url):
+    return Request(APIRequestFactory().get(url))
+
+
+def _create_tasks(count):
+    now = timezone.now()
+    created = [TaskResult.objects.create(task_id=f"task-{n}") for n in range(count)]
+    # Pairs of rows share a timestamp, so the id must break the tie.
+    for n, task in enumerate(created):
+        TaskResult.objects.filter(pk=task.pk).update(date_created=now - timedelta(seconds=n // 2))
+    return TaskResult.objects.all()
+
+
+@pytest.fixture
+def tasks():
+    return _create_tasks(5)
+
+
+@pytest.mark.django_db
+def test_keyset_when_following_links_then_visits_every_row_once(tasks) -> None:
+    """Verify next links walk all rows newest first and previous links walk back."""
+    paginator = KeysetPagination()
+    seen = []
+    url = "/items/?page_size=2"
+    while url:
+        page = paginator.paginate_queryset(tasks, _request(url), TaskResultView())
+        seen.extend(task.task_id for task in page)
+        url = paginator.get_next_link()
+    expected = list(tasks.order_by("-date_created", "-id").values_list("task_id", flat=True))
+    assert seen == expected
+
+    page = paginator.paginate_queryset(tasks, _request(paginator.get_previous_link()), TaskResultView())
+    assert [task.task_id for task in page] == expected[2:4]
+
+
+@pytest.mark.django_db
+def test_keyset_when_no_page_size_then_pages_by_default() -> None:
+    """Verify KeysetPagination is bounded without a page_size setting or parameter."""
+    tasks = _create_tasks(12)
+    paginator = KeysetPagination()
+    assert len(paginator.paginate_queryset(tasks, _request("/items/"), TaskResultView())) == 10
+    assert paginator.get_next_link() is not None
+    assert paginator.get_page_size(_request("/items/?page_size=1000")) == 100
+
+
+@pytest.mark.django_db
+def test_standard_when_no_page_param_then_caps_results(tasks) -> None:
+    """Verify unpaginated requests are capped and flagged as truncated."""
+    paginator = StandardResultsSetPagination()
+    paginator.max_unpaginated_results = 3
+    results = paginator.paginate_queryset(tasks, _request("/items/"))
+    response = paginator.get_paginated_response([task.task_id for task in results])
+    assert len(response.data) == 3
+    assert response["X-Truncated"] == "true"
+
+
+@pytest.mark.django_db
+def test_estimated_count_when_small_table_then_counts_exactly(tasks) -> None:
+    """Verify small results fall back to an exact count."""
+    paginator = EstimatedCountPagination()
+    results = paginator.paginate_queryset(tasks, _request("/items/?page=1&page_size=2"))
+    response = paginator.get_paginated_response([task.task_id for task in results])
+    assert response.data["count"] == 5
+    assert response.data["count_is_estimate"] is False
+
+
+@pytest.mark.django_db
+def test_estimated_count_when_estimate_too_low_then_later_rows_still_served(tasks, monkeypatch) -> None:
+    """Verify rows past a low estimate are reachable and has_next follows the rows, not the estimate."""
+    monkeypatch.setattr(EstimatedCountPaginator, "exact_count_below", 0)
+    monkeypatch.setattr(EstimatedCountPaginator, "estimate_count", lambda self: 3)
+    ordered = tasks.order_by("id")
+    paginator = EstimatedCountPagination()
+
+    pages = []
+    for number in (2, 3):
+        results = paginator.paginate_queryset(ordered, _request(f"/items/?page={number}&page_size=2"))
+        pages.append(([task.task_id for task in results], paginator.get_next_link() is not None))
+    assert pages == [(["task-2", "task-3"], True), (["task-4"], False)]
+    response = paginator.get_paginated_response([])
+    assert response.data["count"] == 3
+    assert response.data["count_is_estimate"] is True
@@ -0,0 +1,71 @@
+import json
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.urls import reverse
+from django_celery_results.models import TaskResult
+from rest_framework.status import HTTP_200_OK, HTTP_400_BAD_REQUEST
+from rest_framework.test import APIClient
+
+from base.services.task_status_service import StatusStream, task_status_service
+
+
+@pytest.fixture
+def user_client(api_client: APIClient) -> APIClient:
+    cache.clear()
+    api_client.force_authenticate(user=get_user_model().objects.create(username="tasks"))
+    return api_client
+
+
+@pytest.fixture
+def results():
+    TaskResult.objects.create(task_id="done", status="SUCCESS", result=json.dumps({"rows": 3}), content_type="application/json")
+    TaskResult.objects.create(
+        task_id="failed",
+        status="FAILURE",
+        result=json.dumps({"exc_type": "ValueError", "exc_message": ["bad input"]}),
+        content_type="application/json",
+    )
+    TaskResult.objects.create(task_id="running", status="STARTED", content_type="application/json")
+
+
+@pytest.mark.django_db
+def test_batch_when_many_ids_then_resolves_all_in_one_query(user_client: APIClient, results, django_assert_num_queries) -> None:
+    """Verify the batch endpoint answers for every ID, including unknown ones, with one query."""
+    with django_assert_num_queries(1):
+        tasks = task_status_service.statuses(["done", "failed", "running", "unknown"])
+    assert tasks["done"] == {"status": "SUCCESS", "result": {"rows": 3}}
+    assert tasks["failed"]["error"].startswith("ValueError")
+    assert tasks["running"] == {"status": "STARTED"}
+    assert tasks["unknown"] == {"status": "PENDING"}
+
+    response = user_client.post(reverse("base:task-status-batch"), {"task_ids": ["done", "unknown"]}, format="json")
+    assert response.status_code == HTTP_200_OK
+    assert response.json()["tasks"]["done"]["result"] == {"rows": 3}
+
+
+@pytest.mark.django_db
+def test_batch_when_finished_then_cached(results, django_assert_num_queries) -> None:
+    """Verify finished tasks are served from the cache afterwards."""
+    cache.clear()
+    task_status_service.statuses(["done", "failed"])
+    with django_assert_num_queries(0):
+        task_status_service.statuses(["done", "failed"])
+
+
+@pytest.mark.django_db
+def test_batch_when_no_ids_then_returns_400(user_client: APIClient) -> None:
+    """Verify the batch endpoint rejects requests without task IDs."""
+    response = user_client.post(reverse("base:task-status-batch"), {"task_ids": []}, format="json")
+    assert response.status_code == HTTP_400_BAD_REQUEST
+
+
+def test_stream_when_status_changes_then_sends_events() -> None:
+    """Verify the event stream sends changes only and ends once every task finished."""
+    stream = StatusStream(["a", "b"])
+    assert len(stream.update({"a": {"status": "STARTED"}, "b": {"status": "PENDING"}})) == 2
+    assert stream.update({"a": {"status": "STARTED"}, "b": {"status": "PENDING"}}) == []
+    events = stream.update({"a": {"status": "SUCCESS", "result": 1}, "b": {"status": "FAILURE"}})
+    assert events[-1].startswith("event: done")
+    assert stream.closed
@@ -1,7 +1,9 @@
 """Base views module."""
 
-from django.db import connection
+import json
+
 from celery.result import AsyncResult
+from django.http import StreamingHttpResponse
 from drf_spectacular.utils import (
     OpenApiExample,
     OpenApiParameter,
@@ -10,20 +12,41 @@ from drf_spectacular.utils import (
 )
 from rest_framework.exceptions import APIException, ValidationError
 from rest_framework.permissions import AllowAny, IsAuthenticated
+from rest_framework.renderers import BaseRenderer, JSONRenderer
 from rest_framework.response import Response
 from rest_framework.status import HTTP_200_OK, HTTP_503_SERVICE_UNAVAILABLE
 from rest_framework.views import APIView
 
+from base.services.health_service import health_service
+from base.services.task_status_service import MAX_TASK_IDS, parse_task_ids, task_status_service
+
+
+class LivenessView(APIView):
+    """Liveness check: the process is up and serving requests. Does no I/O."""
+
+    permission_classes = [AllowAny]
+    authentication_classes = []
+
+    @extend_schema(
+        summary="Liveness Check",
+        description="Always returns 200 while the process can serve requests; touches no dependency.",
+        responses={HTTP_200_OK: OpenApiResponse(description="Process is alive.")},
+    )
+    def get(self, request, *args, **kwargs):
+        return Response({"status": "alive"}, status=HTTP_200_OK)
+
 
 class HealthCheckView(APIView):
-    """Readiness check that verifies database connectivity."""
+    """Readiness check of the database, cache and Celery broker (see base.services.health_service)."""
 
     permission_classes = [AllowAny]
     authentication_classes = []
 
     @extend_schema(
-        summary="Health Check",
-        description="Returns 200 if the service and database are healthy, 503 otherwise.",
+        summary="Readiness Check",
+        description="Checks the database, cache and Celery broker concurrently and reports each "
+        "one's status and latency. Results are cached for HEALTH_CHECK_CACHE_SECONDS. "
+        "Returns 200 if every check passes, 503 otherwise.",
         responses={
             HTTP_200_OK: OpenApiResponse(description="Service is healthy."),
             HTTP_503_SERVICE_UNAVAILABLE: OpenApiResponse(
@@ -32,14 +55,9 @@ class HealthCheckView(APIView):
         },
     )
     def get(self, request, *args, **kwargs):
-        try:
-            connection.ensure_connection()
-        except Exception:
-            return Response(
-                {"status": "unhealthy", "db": "unreachable"},
-                status=HTTP_503_SERVICE_UNAVAILABLE,
-            )
-        return Response({"status": "healthy"}, status=HTTP_200_OK)
+        report = health_service.report()
+        status = HTTP_200_OK if report["status"] == "healthy" else HTTP_503_SERVICE_UNAVAILABLE
+        return Response(report, status=status)
 
 
 class TaskStatusView(APIView):
@@ -108,3 +126,94 @@ class TaskStatusView(APIView):
             raise APIException(detail=result.result)
 
         return Response({"status": result.state}, status=HTTP_200_OK)
+
+
+class TaskStatusBatchView(APIView):
+    """
+    View to check the status of many Celery tasks in one request.
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    @extend_schema(
+        summary="Check Task Statuses",
+        description=f"Resolve the statuses of up to {MAX_TASK_IDS} Celery tasks with a single "
+        "database query. Finished tasks (SUCCESS, FAILURE, REVOKED) are cached and not looked up again.",
+        request={
+            "application/json": {
+                "type": "object",
+                "properties": {"task_ids": {"type": "array", "items": {"type": "string"}}},
+                "required": ["task_ids"],
+            }
+        },
+        responses={
+            HTTP_200_OK: OpenApiResponse(
+                description="Status of every requested task, keyed by task ID.",
+                response={
+                    "type": "object",
+                    "properties": {
+                        "tasks": {
+                            "type": "object",
+                            "example": {
+                                "123e4567-e89b-12d3-a456-426614174000": {"status": "SUCCESS", "result": "Your result data here"},
+                                "9b2f7c1e-0d4a-4c8e-a1b2-3c4d5e6f7a8b": {"status": "STARTED"},
+                            },
+                        }
+                    },
+                },
+            ),
+        },
+    )
+    def post(self, request, *args, **kwargs):
+        try:
+            task_ids = parse_task_ids(request.data.get("task_ids"))
+        except ValueError as e:
+            raise ValidationError({"task_ids": str(e)}) from e
+        return Response({"tasks": task_status_service.statuses(task_ids)}, status=HTTP_200_OK)
+
+
+class EventStreamRenderer(BaseRenderer):
+    """Lets clients send ``Accept: text/event-stream``; only error bodies are rendered here."""
+
+    media_type = "text/event-stream"
+    format = "event-stream"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        return json.dumps(data).encode()
+
+
+class TaskStatusStreamView(APIView):
+    """
+    Server-Sent Events stream of Celery task status changes.
+
+    Each open stream holds a worker thread; serve the project with
+    ``--server asgi`` when many clients stream at once.
+    """
+
+    permission_classes = [IsAuthenticated]
+    renderer_classes = [JSONRenderer, EventStreamRenderer]
+
+    @extend_schema(
+        summary="Stream Task Statuses",
+        description="Server-Sent Events: a `status` event whenever a task's status changes, then a "
+        "`done` event once all tasks have finished. The stream closes after TASK_STATUS_STREAM_TIMEOUT "
+        "seconds and EventSource clients reconnect.",
+        parameters=[
+            OpenApiParameter(
+                name="task_ids",
+                description=f"Comma-separated IDs of up to {MAX_TASK_IDS} Celery tasks.",
+                required=True,
+                type=str,
+            )
+        ],
+        responses={HTTP_200_OK: OpenApiResponse(description="text/event-stream of status events.")},
+    )
+    def get(self, request, *args, **kwargs):
+        try:
+            task_ids = parse_task_ids(request.GET.get("task_ids", ""))
+        except ValueError as e:
+            raise ValidationError({"task_ids": str(e)}) from e
+        response = StreamingHttpResponse(task_status_service.stream(task_ids), content_type="text/event-stream")
+        response["Cache-Control"] = "no-cache"
+        response["X-Accel-Buffering"] = "no"  # stop nginx from buffering events
+        return response
@@ -0,0 +1,206 @@
+"""
+Query budgets and N+1 detection for the test suite (a pytest plugin, loaded by conftest.py).
+
+The database queries each test runs are recorded, along with the request they ran in:
+
+- ``@pytest.mark.max_queries(5)`` fails a test whose body runs more than 5
+  queries; ``max_queries(5, per_request=True)`` applies the budget to each
+  request instead. Fixture setup doesn't count.
+- A SELECT repeated with the same shape (same SQL, any parameters) at least
+  ``query_budget_n_plus_one_threshold`` times (ini option, default 5) within
+  one request fails the test as an N+1, naming the line of project code that
+  issued it. ``@pytest.mark.allow_n_plus_one`` opts a test out.
+- ``--query-report=PATH`` writes per-endpoint query counts, per-test totals
+  and N+1s as JSON; CI uploads it as an artifact.
+"""
+
+import json
+import os
+import re
+import traceback
+from collections import Counter
+from contextlib import ExitStack
+from pathlib import Path
+
+import pytest
+from django.conf import settings
+from django.core.signals import request_finished, request_started
+from django.db import connections
+from django.urls import Resolver404, resolve
+
+DEFAULT_N_PLUS_ONE_THRESHOLD = 5
+
+_IN_LIST = re.compile(r"IN \((?:%s, )*%s\)")
+_THIS_FILE = os.path.abspath(__file__)
+_IGNORED_PATHS = (os.sep + "site-packages" + os.sep, os.sep + ".venv" + os.sep)
+
+
+def query_shape(sql):
+    """The SQL with IN lists of any length made alike; parameters are already %s placeholders."""
+    return _IN_LIST.sub("IN (...)", sql)
+
+
+def _caller():
+    """The innermost frame of project code on the stack, as "path:line in function"."""
+    base_dir = os.path.abspath(settings.BASE_DIR)
+    for frame in reversed(traceback.extract_stack()):
+        filename = os.path.abspath(frame.filename)
+        if filename.startswith(base_dir) and filename != _THIS_FILE and not any(part in filename for part in _IGNORED_PATHS):
+            return f"{os.path.relpath(filename, base_dir)}:{frame.lineno} in {frame.name}"
+    return "unknown"
+
+
+class QueryRecorder:
+    """Database execute wrapper counting one test's queries per test and per request."""
+
+    def __init__(self, n_plus_one_threshold):
+        self.n_plus_one_threshold = n_plus_one_threshold
+        self.active = False
+        self.total = 0
+        self.endpoint = None
+        self.request_queries = 0
+        self.requests = []  # (endpoint, queries) per finished request
+        self.n_plus_one = []  # {"endpoint", "shape", "count", "location"}
+        self._shapes = Counter()
+
+    def __call__(self, execute, sql, params, many, context):
+        if self.active:
+            self.total += 1
+            if self.endpoint is not None:
+                self.request_queries += 1
+                if sql.lstrip()[:6].upper() == "SELECT":
+                    self._count_shape(query_shape(sql))
+        return execute(sql, params, many, context)
+
+    def _count_shape(self, shape):
+        self._shapes[shape] += 1
+        count = self._shapes[shape]
+        if count == self.n_plus_one_threshold:
+            # The stack is only inspected once a shape repeats, to keep recording cheap.
+            self.n_plus_one.append({"endpoint": self.endpoint, "shape": shape, "count": count, "location": _caller()})
+        elif count > self.n_plus_one_threshold:
+            for found in self.n_plus_one:
+                if found["endpoint"] == self.endpoint and found["shape"] == shape:
+                    found["count"] = max(found["count"], count)
+
+    def request_started(self, sender, environ=None, scope=None, **kwargs):
+        if environ is not None:
+            method, path = environ["REQUEST_METHOD"], environ["PATH_INFO"]
+        else:
+            method, path = scope["method"], scope["path"]
+        try:
+            route = "/" + resolve(path).route
+        except Resolver404:
+            route = path
+        self.endpoint = f"{method} {route}"
+        self.request_queries = 0
+        self._shapes = Counter()
+
+    def request_finished(self, sender, **kwargs):
+        if self.endpoint is not None and self.active:
+            self.requests.append((self.endpoint, self.request_queries))
+        self.endpoint = None
+
+
+class QueryReport:
+    """Query counts collected over the whole session."""
+
+    def __init__(self):
+        self.endpoints = {}
+        self.tests = {}
+        self.n_plus_one = []
+
+    def add(self, nodeid, recorder):
+        self.tests[nodeid] = recorder.total
+        for endpoint, queries in recorder.requests:
+            stats = self.endpoints.setdefault(endpoint, {"requests": 0, "queries": 0, "max_queries": 0})
+            stats["requests"] += 1
+            stats["queries"] += queries
+            stats["max_queries"] = max(stats["max_queries"], queries)
+        self.n_plus_one.extend({"test": nodeid, **found} for found in recorder.n_plus_one)
+
+    def write(self, path):
+        endpoints = {
+            endpoint: {**stats, "mean_queries": round(stats["queries"] / stats["requests"], 1)}
+            for endpoint, stats in sorted(self.endpoints.items())
+        }
+        report = {"endpoints": endpoints, "tests": self.tests, "n_plus_one": self.n_plus_one}
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        Path(path).write_text(json.dumps(report, indent=2) + "\n")
+
+
+_REPORT = pytest.StashKey[QueryReport]()
+_RECORDER = pytest.StashKey[QueryRecorder]()
+
+
+def pytest_addoption(parser):
+    parser.addoption("--query-report", metavar="PATH", help="Write per-endpoint database query counts to PATH as JSON")
+    parser.addini(
+        "query_budget_n_plus_one_threshold",
+        "Repetitions of one SELECT shape within a request that count as an N+1",
+        default=str(DEFAULT_N_PLUS_ONE_THRESHOLD),
+    )
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "max_queries(n, per_request=False): fail if the test (or any request) runs more than n queries")
+    config.addinivalue_line("markers", "allow_n_plus_one: don't fail the test on repeated identical queries")
+    config.stash[_REPORT] = QueryReport()
+
+
+@pytest.fixture(autouse=True)
+def query_recorder(request):
+    """Attach a QueryRecorder to every database connection for the duration of the test."""
+    recorder = QueryRecorder(int(request.config.getini("query_budget_n_plus_one_threshold")))
+    request.node.stash[_RECORDER] = recorder
+    request_started.connect(recorder.request_started)
+    request_finished.connect(recorder.request_finished)
+    try:
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(recorder))
+            yield recorder
+    finally:
+        request_started.disconnect(recorder.request_started)
+        request_finished.disconnect(recorder.request_finished)
+
+
+def _budget_errors(item, recorder):
+    errors = []
+    marker = item.get_closest_marker("max_queries")
+    if marker is not None:
+        budget = marker.args[0] if marker.args else marker.kwargs["n"]
+        if marker.kwargs.get("per_request"):
+            errors.extend(
+                f"{endpoint} ran {queries} queries (budget {budget})" for endpoint, queries in recorder.requests if queries > budget
+            )
+        elif recorder.total > budget:
+            errors.append(f"test ran {recorder.total} queries (budget {budget})")
+    if item.get_closest_marker("allow_n_plus_one") is None:
+        errors.extend(
+            f"N+1 in {found['endpoint']}: {found['count']}x {found['shape']!r} from {found['location']}" for found in recorder.n_plus_one
+        )
+    return errors
+
+
+@pytest.hookimpl(wrapper=True)
+def pytest_runtest_call(item):
+    recorder = item.stash.get(_RECORDER, None)
+    if recorder is None:
+        return (yield)
+    recorder.active = True
+    try:
+        result = yield
+    finally:
+        recorder.active = False
+        item.config.stash[_REPORT].add(item.nodeid, recorder)
+    errors = _budget_errors(item, recorder)
+    if errors:
+        pytest.fail("Query budget exceeded:\n  " + "\n  ".join(errors), pytrace=False)
+    return result
+
+
+def pytest_sessionfinish(session):
+    path = session.config.getoption("--query-report")
+    if path:
+        session.config.stash[_REPORT].write(path)
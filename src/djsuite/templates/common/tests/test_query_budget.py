@@ -0,0 +1,87 @@
+import json
+
+import pytest
+from django.db import connection
+from django_celery_results.models import TaskResult
+from rest_framework.test import APIClient
+
+from tests.query_budget import QueryRecorder, QueryReport, _budget_errors, query_shape
+
+
+class FakeItem:
+    """Just enough of a pytest item for _budget_errors."""
+
+    def __init__(self, *markers):
+        self.markers = {marker.mark.name: marker.mark for marker in markers}
+
+    def get_closest_marker(self, name):
+        return self.markers.get(name)
+
+
+def _start_request(recorder, path="/missing/"):
+    recorder.request_started(sender=None, environ={"REQUEST_METHOD": "GET", "PATH_INFO": path})
+
+
+def test_query_shape_ignores_in_list_length() -> None:
+    """Verify IN lists of different lengths have the same shape."""
+    assert query_shape('SELECT 1 FROM "t" WHERE "id" IN (%s, %s, %s)') == query_shape('SELECT 1 FROM "t" WHERE "id" IN (%s)')
+
+
+@pytest.mark.max_queries(0, per_request=True)
+def test_requests_are_recorded_per_endpoint(api_client: APIClient, query_recorder: QueryRecorder) -> None:
+    """Verify each request is recorded under its path, when no route matches, with its query count."""
+    # An unrouted path keeps this test independent of the app's URLs.
+    api_client.get("/query-budget/missing/")
+    assert query_recorder.requests == [("GET /query-budget/missing/", 0)]
+
+
+@pytest.mark.django_db
+def test_repeated_select_in_a_request_is_an_n_plus_one() -> None:
+    """Verify one query shape repeated within a request is reported with the code that ran it."""
+    tasks = [TaskResult.objects.create(task_id=f"task-{n}") for n in range(5)]
+    recorder = QueryRecorder(n_plus_one_threshold=5)
+    recorder.active = True
+    with connection.execute_wrapper(recorder):
+        _start_request(recorder)
+        for task in tasks:
+            TaskResult.objects.get(pk=task.pk)
+        recorder.request_finished(sender=None)
+
+    assert recorder.requests == [("GET /missing/", 5)]
+    [found] = recorder.n_plus_one
+    assert found["count"] == 5
+    assert "django_celery_results_taskresult" in found["shape"]
+    assert found["location"].startswith("tests/test_query_budget.py:")
+
+    errors = _budget_errors(FakeItem(), recorder)
+    assert len(errors) == 1 and errors[0].startswith("N+1 in GET /missing/: 5x")
+    assert _budget_errors(FakeItem(pytest.mark.allow_n_plus_one), recorder) == []
+
+
+def test_budget_errors_for_test_and_request_budgets() -> None:
+    """Verify max_queries applies to the whole test, or to each request with per_request=True."""
+    recorder = QueryRecorder(n_plus_one_threshold=5)
+    recorder.total = 4
+    recorder.requests = [("GET /a/", 1), ("GET /b/", 3)]
+
+    assert _budget_errors(FakeItem(pytest.mark.max_queries(4)), recorder) == []
+    assert _budget_errors(FakeItem(pytest.mark.max_queries(3)), recorder) == ["test ran 4 queries (budget 3)"]
+    assert _budget_errors(FakeItem(pytest.mark.max_queries(2, per_request=True)), recorder) == ["GET /b/ ran 3 queries (budget 2)"]
+
+
+def test_report_aggregates_endpoints(tmp_path) -> None:
+    """Verify the JSON report sums requests per endpoint and lists N+1s with their test."""
+    recorder = QueryRecorder(n_plus_one_threshold=5)
+    recorder.total = 9
+    recorder.requests = [("GET /a/", 2), ("GET /a/", 6)]
+    recorder.n_plus_one = [{"endpoint": "GET /a/", "shape": "SELECT", "count": 5, "location": "base/views.py:1 in get"}]
+    report = QueryReport()
+    report.add("tests/test_a.py::test_a", recorder)
+
+    path = tmp_path / "reports" / "queries.json"
+    report.write(path)
+    written = json.loads(path.read_text())
+
+    assert written["endpoints"] == {"GET /a/": {"requests": 2, "queries": 8, "max_queries": 6, "mean_queries": 4.0}}
+    assert written["tests"] == {"tests/test_a.py::test_a": 9}
+    assert written["n_plus_one"][0]["test"] == "tests/test_a.py::test_a"
@@ -0,0 +1,183 @@
+"""Line diff engine: patience anchoring with a bounded Myers fallback.
+
+Lines are interned to integers once, so every comparison afterwards is an
+int compare. Matching works range by range: the common prefix and suffix
+are trimmed, lines that occur exactly once on both sides become anchors
+(the longest increasing run of them, as in patience diff; failing that,
+the rarest shared lines), and the gaps between anchors are handled the
+same way. Only gaps without any such line fall back to Myers' O(ND)
+algorithm, and a gap whose edit
+distance exceeds ``max_d`` is treated as a full replacement rather than
+searched exhaustively. The result is not always the minimal diff, but it
+stays close to linear on large files full of repeated lines, where
+difflib degrades badly.
+"""
+
+import bisect
+
+DEFAULT_MAX_D = 512
+
+
+def intern_lines(a, b):
+    """Map two lists of lines to lists of small integers (equal lines, equal ids)."""
+    ids = {}
+    return [ids.setdefault(line, len(ids)) for line in a], [ids.setdefault(line, len(ids)) for line in b]
+
+
+def _positions(seq, lo, hi):
+    positions = {}
+    for i in range(lo, hi):
+        positions.setdefault(seq[i], []).append(i)
+    return positions
+
+
+def _patience_anchors(a, alo, ahi, b, blo, bhi):
+    """Return (i, j) anchor pairs, longest increasing in j.
+
+    Anchors are lines unique to both ranges. When there are none (as in
+    lockfiles, where every line repeats), the rarest lines that occur the
+    same number of times on both sides are paired occurrence by occurrence
+    instead, as histogram diff does.
+    """
+    positions_a = _positions(a, alo, ahi)
+    positions_b = _positions(b, blo, bhi)
+    rarest = None
+    for value, found_a in positions_a.items():
+        found_b = positions_b.get(value)
+        if found_b is not None and len(found_a) == len(found_b) and (rarest is None or len(found_a) < rarest):
+            rarest = len(found_a)
+            if rarest == 1:
+                break
+    if rarest is None:
+        return []
+    pairs = []
+    for value, found_a in positions_a.items():
+        found_b = positions_b.get(value)
+        if found_b is not None and len(found_a) == rarest == len(found_b):
+            pairs.extend(zip(found_a, found_b))
+    pairs.sort()
+
+    # Longest increasing subsequence on j (patience sorting).
+    tails = []
+    tail_index = []
+    back = [None] * len(pairs)
+    for n, (_i, j) in enumerate(pairs):
+        pos = bisect.bisect_left(tails, j)
+        if pos == len(tails):
+            tails.append(j)
+            tail_index.append(n)
+        else:
+            tails[pos] = j
+            tail_index[pos] = n
+        back[n] = tail_index[pos - 1] if pos else None
+
+    anchors = []
+    n = tail_index[-1]
+    while n is not None:
+        anchors.append(pairs[n])
+        n = back[n]
+    anchors.reverse()
+    return anchors
+
+
+def _myers(a, alo, ahi, b, blo, bhi, max_d):
+    """Return matched (i, j) pairs of a shortest edit script, or None if D > max_d."""
+    n = ahi - alo
+    m = bhi - blo
+    v = {1: 0}
+    trace = []
+    for d in range(min(n + m, max_d) + 1):
+        trace.append(v.copy())
+        for k in range(-d, d + 1, 2):
+            if k == -d or (k != d and v[k - 1] < v[k + 1]):
+                x = v[k + 1]
+            else:
+                x = v[k - 1] + 1
+            y = x - k
+            while x < n and y < m and a[alo + x] == b[blo + y]:
+                x += 1
+                y += 1
+            v[k] = x
+            if x >= n and y >= m:
+                return _myers_backtrack(trace, x, y, alo, blo)
+    return None
+
+
+def _myers_backtrack(trace, x, y, alo, blo):
+    """Recover the matched pairs of the edit path ending at (x, y)."""
+    matches = []
+    for d in range(len(trace) - 1, -1, -1):
+        v = trace[d]
+        k = x - y
+        if d == 0:
+            start_x = prev_x = prev_y = 0
+        else:
+            down = k == -d or (k != d and v[k - 1] < v[k + 1])
+            prev_k = k + 1 if down else k - 1
+            prev_x = v[prev_k]
+            prev_y = prev_x - prev_k
+            start_x = prev_x if down else prev_x + 1
+        # Walk back along the diagonal (matching) part of this step.
+        while x > start_x:
+            x -= 1
+            y -= 1
+            matches.append((alo + x, blo + y))
+        x, y = prev_x, prev_y
+    matches.reverse()
+    return matches
+
+
+def matching_pairs(a, b, max_d=DEFAULT_MAX_D):
+    """Return the list of matched (i, j) line index pairs between two int sequences."""
+    matches = []
+    stack = [(0, len(a), 0, len(b))]
+    while stack:
+        alo, ahi, blo, bhi = stack.pop()
+
+        while alo < ahi and blo < bhi and a[alo] == b[blo]:
+            matches.append((alo, blo))
+            alo += 1
+            blo += 1
+        while alo < ahi and blo < bhi and a[ahi - 1] == b[bhi - 1]:
+            ahi -= 1
+            bhi -= 1
+            matches.append((ahi, bhi))
+        if alo == ahi or blo == bhi:
+            continue
+
+        anchors = _patience_anchors(a, alo, ahi, b, blo, bhi)
+        if anchors:
+            i0, j0 = alo, blo
+            for i, j in anchors:
+                matches.append((i, j))
+                stack.append((i0, i, j0, j))
+                i0, j0 = i + 1, j + 1
+            stack.append((i0, ahi, j0, bhi))
+            continue
+
+        snake = _myers(a, alo, ahi, b, blo, bhi, max_d)
+        if snake:
+            matches.extend(snake)
+
+    matches.sort()
+    return matches
+
+
+def matching_blocks(a, b, max_d=DEFAULT_MAX_D):
+    """Return difflib-style (i, j, size) blocks, ending with the (len(a), len(b), 0) sentinel."""
+    blocks = []
+    for i, j in matching_pairs(a, b, max_d):
+        if blocks and blocks[-1][0] + blocks[-1][2] == i and blocks[-1][1] + blocks[-1][2] == j:
+            blocks[-1][2] += 1
+        else:
+            blocks.append([i, j, 1])
+    blocks = [tuple(block) for block in blocks]
+    blocks.append((len(a), len(b), 0))
+    return blocks
+
+
+def change_counts(old_lines, new_lines, max_d=DEFAULT_MAX_D):
+    """Return (added, removed) line counts between two lists of lines."""
+    a, b = intern_lines(old_lines, new_lines)
+    matched = len(matching_pairs(a, b, max_d))
+    return len(b) - matched, len(a) - matched
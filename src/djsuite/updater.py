@@ -1,25 +1,34 @@
 """Selective update of files in existing projects."""
 
 import json
-import stat
 from pathlib import Path
 
-from djsuite.backup import backup_files
-from djsuite.diff import diff_summary
+from djsuite.backup import backup_files, prune_backups
+from djsuite.diff import diff_summary, unified_diff
+from djsuite.index import load_index, refresh_entries, save_index
 from djsuite.manifest import Platform, files_for_groups
-from djsuite.renderer import render_all
+from djsuite.merge import OVERWRITE, describe, kept_entry, merge_file
+from djsuite.profiling import DIFF, span
+from djsuite.renderer import iter_render
+from djsuite.snapshots import prune_snapshots, store_snapshots
+from djsuite.writer import write_files
 
 
-def _load_context(project_dir):
+def _load_context(project_dir, quiet=False):
     """Load project context and platform from .djsuite.json.
 
+    Args:
+        project_dir: Path to the project root
+        quiet: if True, don't print an error when .djsuite.json is missing
+
     Returns:
         (context_dict, Platform) tuple, or (None, None) on error.
     """
     config_path = Path(project_dir) / ".djsuite.json"
     if not config_path.exists():
-        print(f"Error: {config_path} not found. Is this a djsuite project?")
-        print("Run 'djsuite <project_name>' first to create a project.")
+        if not quiet:
+            print(f"Error: {config_path} not found. Is this a djsuite project?")
+            print("Run 'djsuite <project_name>' first to create a project.")
         return None, None
 
     with open(config_path) as f:
@@ -35,61 +44,160 @@ def _load_context(project_dir):
         "description",
     ]
     context = {k: config.get(k, "") for k in context_keys}
+    if config.get("packs"):
+        context["packs"] = tuple(config["packs"])
 
     # Read platform, defaulting to aws-eb for backwards compatibility
     platform_str = config.get("platform", "aws-eb")
     platform = Platform.from_str(platform_str)
     context["platform"] = platform.value
+    context["server"] = config.get("server", "wsgi")
 
     return context, platform
 
 
-def run_update(project_dir, groups, no_backup=False):
+def update_project(
+    project_dir,
+    rendered,
+    merge=False,
+    no_backup=False,
+    keep_last=None,
+    keep_days=None,
+    show_diff=False,
+    quiet=False,
+    max_workers=None,
+    on_status=None,
+):
+    """Diff, merge, back up and write one project's rendered files.
+
+    This is the per-project step of both run_update() and the fleet update.
+
+    Args:
+        project_dir: Path to the project root
+        rendered: iterable of (output_path, content); each file is diffed as
+            soon as it is produced, so a lazy render overlaps with diffing
+        merge, no_backup, keep_last, keep_days: as for run_update()
+        show_diff: if True, print the unified diff of each file before writing it
+        quiet: if True, don't print backup messages
+        max_workers: writer pool size (see writer.write_files)
+        on_status: called with (output_path, status) as each file is diffed
+
+    Returns:
+        dict with "statuses" (output_path -> status text), "conflicted"
+        (files left with conflict markers), "written" (number of files
+        written) and "backup_dir" (the backup run, or None)
+    """
+    index = load_index(project_dir)
+    contents = {}
+    statuses = {}
+    merged = {}
+    conflicted = []
+    with span("diff"):
+        for output_path, content in rendered:
+            contents[output_path] = content
+            with span(output_path, DIFF):
+                status = diff_summary(project_dir, output_path, content, index.get(output_path))
+                if merge and status.startswith("[CHANGED]"):
+                    merge_status, merged_content, conflicts = merge_file(project_dir, output_path, content, index.get(output_path))
+                    if merge_status != OVERWRITE:
+                        status = describe(merge_status, conflicts)
+                        merged[output_path] = merged_content
+                    if conflicts:
+                        conflicted.append(output_path)
+            statuses[output_path] = status
+            if on_status is not None:
+                on_status(output_path, status)
+    result = {"statuses": statuses, "conflicted": conflicted, "written": 0, "backup_dir": None}
+
+    # Filter out unchanged files, and files whose edits were kept as they are
+    files_to_write = {
+        path: merged.get(path, content)
+        for path, content in contents.items()
+        if statuses[path] != "[UNCHANGED]" and merged.get(path, content) is not None
+    }
+    unchanged = {path: content for path, content in contents.items() if statuses[path] == "[UNCHANGED]"}
+    with span("refresh index"):
+        entries = refresh_entries(project_dir, unchanged, index)
+        kept = {path: contents[path] for path, content in merged.items() if content is None}
+        for path, template in kept.items():
+            entries[path] = kept_entry(project_dir, path, template)
+        store_snapshots(project_dir, [*unchanged.values(), *kept.values()])
+
+    if not files_to_write:
+        save_index(project_dir, entries)
+        return result
+
+    if show_diff:
+        for output_path, content in sorted(files_to_write.items()):
+            print()
+            for line in unified_diff(project_dir, output_path, content):
+                print(line)
+
+    if not no_backup:
+        with span("backup"):
+            backup_dir = backup_files(project_dir, list(files_to_write), quiet=quiet)
+            result["backup_dir"] = str(backup_dir) if backup_dir else None
+            prune_backups(project_dir, keep_last, keep_days, quiet=quiet)
+
+    # Write files; merged files record the template output as their base
+    items = [(path, content, contents[path]) if path in merged else (path, content) for path, content in sorted(files_to_write.items())]
+    with span("write"):
+        result["written"] = len(list(write_files(project_dir, items, max_workers=max_workers, index=entries)))
+    with span("save index"):
+        save_index(project_dir, entries)
+        prune_snapshots(project_dir, load_index(project_dir))
+    return result
+
+
+def run_update(project_dir, groups, no_backup=False, show_diff=False, keep_last=None, keep_days=None, merge=False):
     """Update files in an existing project.
 
     Args:
         project_dir: Path to the project root
         groups: set of UpdateGroup values to update
         no_backup: if True, skip backup
+        show_diff: if True, print the unified diff of each changed file
+        keep_last, keep_days: backup retention applied after backing up
+            (see backup.prune_backups)
+        merge: if True, three-way merge template changes into files the
+            user edited instead of overwriting them (see djsuite.merge)
+
+    Returns:
+        0 on success, 1 on error or if a merge left conflicts
     """
     context, platform = _load_context(project_dir)
     if context is None:
         return 1
 
-    manifest = files_for_groups(groups, platform)
+    try:
+        manifest = files_for_groups(groups, platform, context.get("packs", ()))
+    except ValueError as e:
+        print(f"Error: {e}")
+        return 1
     if not manifest:
         print("No files to update for the selected groups.")
         return 0
 
-    rendered = render_all(manifest, context)
-
-    # Show diff summary
-    print(f"Updating {len(rendered)} file(s) in {Path(project_dir).resolve()}:\n")
-    statuses = {}
-    for output_path, content in sorted(rendered.items()):
-        status = diff_summary(project_dir, output_path, content)
-        statuses[output_path] = status
-        print(f"  {status:30s} {output_path}")
-
-    # Filter out unchanged files
-    files_to_write = {path: content for path, content in rendered.items() if statuses[path] != "[UNCHANGED]"}
-
-    if not files_to_write:
+    # Show diff summary, diffing each file as soon as it is rendered
+    print(f"Updating {len(manifest)} file(s) in {Path(project_dir).resolve()}:\n")
+    result = update_project(
+        project_dir,
+        iter_render(manifest, context),
+        merge=merge,
+        no_backup=no_backup,
+        keep_last=keep_last,
+        keep_days=keep_days,
+        show_diff=show_diff,
+        on_status=lambda output_path, status: print(f"  {status:30s} {output_path}"),
+    )
+
+    if not result["written"]:
         print("\nAll files are up to date.")
         return 0
-
-    # Backup
-    if not no_backup:
-        backup_files(project_dir, list(files_to_write.keys()))
-
-    # Write files
-    project_path = Path(project_dir)
-    for output_path, content in sorted(files_to_write.items()):
-        full_path = project_path / output_path
-        full_path.parent.mkdir(parents=True, exist_ok=True)
-        full_path.write_text(content, encoding="utf-8")
-        if output_path.endswith(".sh"):
-            full_path.chmod(full_path.stat().st_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
-
-    print(f"\nUpdated {len(files_to_write)} file(s).")
+    print(f"\nUpdated {result['written']} file(s).")
+    if result["conflicted"]:
+        print(f"{len(result['conflicted'])} file(s) have merge conflicts; resolve the <<<<<<< markers in:")
+        for output_path in result["conflicted"]:
+            print(f"  {output_path}")
+        return 1
     return 0
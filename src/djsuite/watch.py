@@ -0,0 +1,217 @@
+"""--watch: keep a sample project in sync while editing templates.
+
+The template tree is polled for changes (stat only, no extra
+dependencies); a burst of saves is debounced into one batch. Each changed
+template is mapped to the manifest entries that use it, directly or through
+{% include %}/{% extends %}/{% import %}, and only those files are
+re-rendered and, if their content changed, written. Rendering goes through
+a private auto-reloading environment, never the precompiled bundle, the
+render cache or the process-wide environment, so edits show up at once.
+pdm.lock is not re-locked.
+"""
+
+import os
+import time
+from pathlib import Path
+
+import jinja2
+import jinja2.meta
+
+from djsuite.index import content_hash, current_hash, load_index, save_index
+from djsuite.manifest import get_manifest
+from djsuite.pipeline import ordered_map
+from djsuite.renderer import _get_template_dir, _read_source, create_environment
+from djsuite.updater import _load_context
+from djsuite.writer import write_files
+
+POLL_INTERVAL = 0.2
+DEBOUNCE = 0.1
+
+
+def snapshot(root):
+    """Return {template name: (mtime_ns, size)} for every file under root."""
+    files = {}
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if d != "__pycache__"]
+        for filename in filenames:
+            full_path = os.path.join(dirpath, filename)
+            try:
+                st = os.stat(full_path)
+            except FileNotFoundError:
+                continue
+            files[os.path.relpath(full_path, root).replace(os.sep, "/")] = (st.st_mtime_ns, st.st_size)
+    return files
+
+
+def wait_for_changes(root, previous, interval=POLL_INTERVAL, debounce=DEBOUNCE):
+    """Block until files under root change, then until they stay quiet for ``debounce`` seconds.
+
+    Returns:
+        (changed template names, new snapshot)
+    """
+    current = previous
+    while current == previous:
+        time.sleep(interval)
+        current = snapshot(root)
+    while True:
+        time.sleep(debounce)
+        latest = snapshot(root)
+        if latest == current:
+            break
+        current = latest
+    changed = {name for name in previous.keys() | current.keys() if previous.get(name) != current.get(name)}
+    return changed, current
+
+
+class DependencyGraph:
+    """The templates each template references, followed transitively.
+
+    Args:
+        env: environment whose loader provides the template sources
+        names: the templates to start from (the manifest's Jinja2 templates)
+    """
+
+    def __init__(self, env, names):
+        self.env = env
+        self.roots = list(names)
+        # name -> set of referenced names, or None for a dynamic reference
+        self._refs = {}
+        for name in self.roots:
+            self.refresh(name)
+
+    def refresh(self, name):
+        """Re-read one template's references (after it changed)."""
+        try:
+            source = self.env.loader.get_source(self.env, name)[0]
+            refs = list(jinja2.meta.find_referenced_templates(self.env.parse(source)))
+        except (jinja2.TemplateNotFound, jinja2.TemplateSyntaxError):
+            refs = []
+        self._refs[name] = None if None in refs else set(refs)
+        for ref in self._refs[name] or ():
+            if ref not in self._refs:
+                self.refresh(ref)
+
+    def reaches(self, root, names):
+        """Return True if ``root`` is, or pulls in, any of ``names``."""
+        seen = set()
+        stack = [root]
+        while stack:
+            name = stack.pop()
+            if name in names:
+                return True
+            if name in seen:
+                continue
+            seen.add(name)
+            refs = self._refs.get(name, set())
+            if refs is None:
+                return True  # a dynamic include could load anything
+            stack.extend(refs)
+        return False
+
+
+class Watcher:
+    """Re-renders a project's files affected by template changes.
+
+    Args:
+        project_dir: an existing project (with .djsuite.json)
+        context, platform: as loaded from its .djsuite.json
+    """
+
+    def __init__(self, project_dir, context, platform):
+        self.project_dir = project_dir
+        self.context = context
+        self.manifest = get_manifest(platform, tuple(context.get("packs", ())))
+        self.env = create_environment(auto_reload=True)
+        self.graph = DependencyGraph(
+            self.env, [f"{dir_prefix}/{template_path}" for dir_prefix, template_path in self.manifest.jinja_keys()]
+        )
+
+    def affected(self, changed):
+        """Return the manifest keys whose output depends on any changed template name."""
+        changed = set(changed)
+        for name in changed:
+            if name.endswith(".j2"):
+                self.graph.refresh(name)
+        keys = [key for key in self.manifest.static_keys() if "/".join(key) in changed]
+        keys.extend(key for key in self.manifest.jinja_keys() if self.graph.reaches("/".join(key), changed))
+        return sorted(keys, key=lambda key: self.manifest[key][0])
+
+    def render(self, key):
+        dir_prefix, template_path = key
+        name = f"{dir_prefix}/{template_path}"
+        if template_path.endswith(".j2"):
+            return self.env.get_template(name).render(**self.context)
+        return _read_source(name)
+
+    def sync(self, changed):
+        """Re-render the files affected by ``changed`` and write those that differ.
+
+        Returns:
+            (written output paths, {output_path: error message})
+        """
+        keys = self.affected(changed)
+        if not keys:
+            return [], {}
+        index = load_index(self.project_dir)
+
+        def render(key):
+            output_path = self.manifest[key][0]
+            try:
+                return output_path, self.render(key), None
+            except (jinja2.TemplateError, OSError) as e:
+                return output_path, None, f"{type(e).__name__}: {e}"
+
+        to_write = []
+        errors = {}
+        for output_path, content, error in ordered_map(render, keys):
+            if error is not None:
+                errors[output_path] = error
+                continue
+            try:
+                disk_hash = current_hash(Path(self.project_dir) / output_path, index.get(output_path))
+            except (OSError, UnicodeDecodeError):
+                disk_hash = None
+            if disk_hash != content_hash(content):
+                to_write.append((output_path, content))
+
+        entries = {}
+        written = list(write_files(self.project_dir, to_write, index=entries)) if to_write else []
+        save_index(self.project_dir, entries)
+        return written, errors
+
+
+def run_watch(project_dir, interval=POLL_INTERVAL, debounce=DEBOUNCE):
+    """Watch the template tree and keep ``project_dir`` in sync until interrupted.
+
+    Returns:
+        0 when stopped with Ctrl-C, 1 if the project or templates can't be watched
+    """
+    context, platform = _load_context(project_dir)
+    if context is None:
+        return 1
+    template_dir = _get_template_dir()
+    if not isinstance(template_dir, Path):
+        print(f"Error: templates at {template_dir} are not a directory and can't be watched.")
+        return 1
+    try:
+        watcher = Watcher(project_dir, context, platform)
+    except ValueError as e:
+        print(f"Error: {e}")
+        return 1
+
+    print(f"Watching {template_dir} -> {Path(project_dir).resolve()} (Ctrl-C to stop)")
+    state = snapshot(template_dir)
+    try:
+        while True:
+            changed, state = wait_for_changes(template_dir, state, interval, debounce)
+            start = time.perf_counter()
+            written, errors = watcher.sync(changed)
+            elapsed = (time.perf_counter() - start) * 1000
+            for output_path in written:
+                print(f"  [UPDATED] {output_path}")
+            for output_path, error in errors.items():
+                print(f"  [ERROR]   {output_path}: {error}")
+            print(f"{len(changed)} template(s) changed; wrote {len(written)} file(s) in {elapsed:.0f}ms.")
+    except KeyboardInterrupt:
+        print("\nStopped watching.")
+        return 0
@@ -0,0 +1,300 @@
+"""Transactional writing of rendered files into a project directory.
+
+Files are first written to a staging directory on the same filesystem;
+only then are they moved into place with atomic renames. A new project is
+staged as a whole and appears with a single directory rename. For updates,
+each file that replaces an existing one is hard-linked aside before its
+rename so a failure part-way through the commit can be rolled back.
+Readers such as file watchers or a running dev server see either the old
+or the new file, never a torn one.
+
+With fsync on, each touched directory is fsynced once, rather than every
+file on its own, so a large update costs one flush per directory. File
+contents are left to the filesystem: ext4, XFS and btrfs flush a file's
+data when it is renamed over an existing one, and new files follow with
+normal writeback.
+
+Staging directories carry the writing process's PID; ones left behind by
+a process that died mid-run are removed by the next transaction.
+"""
+
+import os
+import re
+import shutil
+import tempfile
+import threading
+from pathlib import Path
+
+from djsuite.index import content_hash
+from djsuite.pipeline import ordered_map
+from djsuite.profiling import WRITE, span
+from djsuite.snapshots import save_snapshots
+
+_EXEC_BITS = 0o111
+_STAGING_PID = re.compile(r"(?:djsuite-staging|djsuite-tmp)-(\d+)-")
+
+
+def _umask():
+    mask = os.umask(0)
+    os.umask(mask)
+    return mask
+
+
+class Transaction:
+    """Stage files for a project directory and commit them atomically.
+
+    Use as a context manager: leaving the block normally commits, an
+    exception rolls everything back and re-raises.
+
+    Args:
+        project_path: the project root
+        new_project: if True, project_path must not exist yet; the whole
+            tree is staged beside it and committed with one rename
+        fsync: if True (default), flush each touched directory to disk
+            before and after the commit
+    """
+
+    def __init__(self, project_path, new_project=False, fsync=True):
+        self.project_path = Path(project_path)
+        self.new_project = new_project
+        self.fsync = fsync
+        self._umask = _umask()
+        self._staged = {}
+        self._replaces = set()
+        self._names = []
+        self._snapshots = {}
+        self._dirs = set()
+        self._lock = threading.Lock()
+        parent = self.project_path.parent if new_project else self.project_path
+        parent.mkdir(parents=True, exist_ok=True)
+        prefix = f".{self.project_path.name}.djsuite-tmp-" if new_project else ".djsuite-staging-"
+        _remove_stale_staging(parent, prefix)
+        prefix += f"{os.getpid()}-"
+        self.staging = Path(tempfile.mkdtemp(dir=parent, prefix=prefix))
+        if new_project:
+            self.staging.chmod(0o777 & ~self._umask)  # mkdtemp creates it 0o700
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.commit()
+        else:
+            self.rollback()
+        return False
+
+    def _mode(self, output_path):
+        """Mode for a staged file: keep an existing file's mode, add +x to scripts.
+
+        Returns:
+            (mode, replaces): replaces is True if the file already exists
+        """
+        mode = None
+        if not self.new_project:
+            try:
+                mode = (self.project_path / output_path).stat().st_mode & 0o7777
+            except FileNotFoundError:
+                pass
+        replaces = mode is not None
+        if mode is None:
+            mode = 0o666 & ~self._umask
+        if output_path.endswith(".sh"):
+            mode |= _EXEC_BITS
+        return mode, replaces
+
+    def _make_parent(self, path):
+        parent = path.parent
+        with self._lock:
+            if parent in self._dirs:
+                return
+        parent.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            self._dirs.add(parent)
+
+    def write(self, output_path, content, index=None, base=None):
+        """Stage one file (thread-safe).
+
+        If ``index`` is a dict, the file's index entry is recorded in it
+        (see djsuite.index) and its rendered content is kept as the merge
+        base (see djsuite.snapshots); a rename keeps size and mtime, so the
+        entry stays valid after commit. ``base`` is the rendered content
+        when ``content`` is a merge of it with the user's edits.
+        """
+        with span(output_path, WRITE):
+            return self._write(output_path, content, index, base)
+
+    def _write(self, output_path, content, index, base=None):
+        if self.new_project:
+            staged = self.staging / output_path
+            self._make_parent(staged)
+        else:
+            # Updates stage into a flat directory: no tree to mirror and tear down.
+            with self._lock:
+                staged = self.staging / str(len(self._names))
+                self._names.append(output_path)
+        if os.linesep != "\n":
+            content_on_disk = content.replace("\n", os.linesep)
+        else:
+            content_on_disk = content
+        mode, replaces = self._mode(output_path)
+        fd = os.open(staged, os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0), mode)
+        try:
+            os.write(fd, content_on_disk.encode("utf-8"))
+            if mode & (self._umask | 0o7000):
+                os.fchmod(fd, mode)  # bits the umask would have dropped
+            st = os.fstat(fd)
+        finally:
+            os.close(fd)
+        if index is not None:
+            index[output_path] = {"sha256": content_hash(content), "size": st.st_size, "mtime_ns": st.st_mtime_ns}
+            if base is None:
+                base, base_digest = content, index[output_path]["sha256"]
+            else:
+                base_digest = index[output_path]["base"] = content_hash(base)
+        with self._lock:
+            self._staged[output_path] = staged
+            if replaces:
+                self._replaces.add(output_path)
+            if index is not None:
+                self._snapshots[base_digest] = base
+        return output_path
+
+    def write_all(self, items, max_workers=None, index=None):
+        """Stage (output_path, content) pairs on a thread pool.
+
+        ``items`` may be a lazy iterator such as renderer.iter_render(), so
+        staging starts as soon as the first file is rendered. An item may
+        carry a third element, the merge base (see write()).
+
+        Yields:
+            each output_path once it is staged, in input order
+        """
+        return ordered_map(lambda item: self.write(*item[:2], index=index, base=item[2] if len(item) > 2 else None), items, max_workers)
+
+    def commit(self):
+        """Move every staged file into place, then record their merge bases."""
+        with span("commit"):
+            if self.new_project:
+                self._commit_project()
+            else:
+                self._commit_files()
+                save_snapshots(self.project_path, self._snapshots)
+
+    def _commit_project(self):
+        save_snapshots(self.staging, self._snapshots)
+        if self.fsync:
+            for directory in self._dirs | {self.staging}:
+                _fsync_dir(directory)
+        try:
+            os.rename(self.staging, self.project_path)
+        except OSError:
+            self.rollback()
+            raise
+        if self.fsync:
+            _fsync_dir(self.project_path.parent)
+
+    def _commit_files(self):
+        committed = []
+        created_dirs = []
+        touched_dirs = set()
+        try:
+            for output_path, staged in sorted(self._staged.items()):
+                dest = self.project_path / output_path
+                if dest.parent not in touched_dirs and not dest.parent.exists():
+                    created_dirs.extend(_missing_parents(dest.parent, self.project_path))
+                    dest.parent.mkdir(parents=True, exist_ok=True)
+                touched_dirs.add(dest.parent)
+                saved = None
+                if output_path in self._replaces:
+                    saved = staged.with_name(f"{staged.name}.orig")
+                    try:
+                        os.link(dest, saved)
+                    except FileNotFoundError:
+                        saved = None
+                    except OSError:
+                        shutil.copy2(dest, saved)
+                os.replace(staged, dest)
+                committed.append((dest, saved))
+        except BaseException:
+            for dest, saved in reversed(committed):
+                if saved is None:
+                    dest.unlink(missing_ok=True)
+                else:
+                    os.replace(saved, dest)
+            for directory in reversed(created_dirs):
+                try:
+                    directory.rmdir()
+                except OSError:
+                    pass
+            shutil.rmtree(self.staging, ignore_errors=True)
+            raise
+        if self.fsync:
+            for directory in touched_dirs:
+                _fsync_dir(directory)
+        shutil.rmtree(self.staging, ignore_errors=True)
+
+    def rollback(self):
+        """Discard everything staged; the project is left untouched."""
+        shutil.rmtree(self.staging, ignore_errors=True)
+
+
+def _pid_alive(pid):
+    if os.name == "nt":
+        return True  # os.kill would terminate it; leave the directory alone
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except OSError:
+        return True  # exists, owned by another user
+    return True
+
+
+def _remove_stale_staging(parent, prefix):
+    """Remove staging directories under parent left by processes that no longer run."""
+    try:
+        entries = os.scandir(parent)
+    except OSError:
+        return
+    with entries:
+        for entry in entries:
+            if not entry.name.startswith(prefix):
+                continue
+            match = _STAGING_PID.search(entry.name)
+            if match and int(match.group(1)) != os.getpid() and not _pid_alive(int(match.group(1))):
+                shutil.rmtree(entry.path, ignore_errors=True)
+
+
+def _missing_parents(directory, root):
+    """Return the not-yet-existing directories between root and directory, outermost first."""
+    missing = []
+    while directory != root and not directory.exists():
+        missing.append(directory)
+        directory = directory.parent
+    return list(reversed(missing))
+
+
+def _fsync_dir(directory):
+    """Flush a directory's entries to disk (a no-op where unsupported)."""
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def write_files(project_path, items, max_workers=None, index=None):
+    """Write (output_path, content) pairs into an existing project as one transaction.
+
+    Yields:
+        each output_path once it is staged, in input order; the files are
+        committed after the last one and rolled back if anything fails
+    """
+    with Transaction(project_path) as txn:
+        yield from txn.write_all(items, max_workers, index)
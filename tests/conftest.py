@@ -0,0 +1,11 @@
+"""Shared pytest fixtures."""
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache_dir(tmp_path_factory, monkeypatch):
+    """Keep every test's djsuite caches out of the real user cache dir."""
+    cache_dir = tmp_path_factory.mktemp("djsuite-cache")
+    monkeypatch.setenv("DJSUITE_CACHE_DIR", str(cache_dir))
+    return cache_dir
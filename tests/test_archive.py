@@ -0,0 +1,96 @@
+"""Tests for the archive module."""
+
+import io
+import json
+import tarfile
+import zipfile
+
+import pytest
+
+from djsuite.archive import DEFAULT_MTIME, ArchiveTarget, ArchiveWriter, format_for
+from djsuite.cli import main
+
+
+def _generate(tmp_path, *args):
+    return main(["testproject", "--offline", *args])
+
+
+@pytest.fixture
+def in_tmp(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+class TestFormatFor:
+    def test_suffixes(self):
+        assert format_for("p.zip") == "zip"
+        assert format_for("p.tar") == "tar"
+        assert format_for("p.tar.gz") == "tar.gz"
+        assert format_for("-") == "tar.gz"
+
+
+class TestArchiveWriter:
+    def test_directories_precede_files(self):
+        buf = io.BytesIO()
+        with ArchiveWriter(buf, "tar", "root", mtime=DEFAULT_MTIME) as archive:
+            archive.add("a/b/c.sh", b"#!/bin/sh\n")
+            archive.add("a/d.txt", b"d")
+        members = tarfile.open(fileobj=io.BytesIO(buf.getvalue())).getmembers()
+        assert [m.name for m in members] == ["root", "root/a", "root/a/b", "root/a/b/c.sh", "root/a/d.txt"]
+        assert members[3].mode == 0o755
+        assert members[4].mode == 0o644
+
+    def test_failed_target_leaves_nothing(self, tmp_path):
+        with pytest.raises(RuntimeError):
+            with ArchiveTarget(str(tmp_path / "p.tar")) as stream:
+                stream.write(b"partial")
+                raise RuntimeError
+        assert list(tmp_path.iterdir()) == []
+
+
+class TestGenerateArchive:
+    def test_tar_gz_file(self, in_tmp):
+        assert _generate(in_tmp, "--output-archive", "p.tar.gz") == 0
+        assert sorted(p.name for p in in_tmp.iterdir()) == ["p.tar.gz"]
+        with tarfile.open(in_tmp / "p.tar.gz") as tar:
+            members = {m.name: m for m in tar.getmembers()}
+            config = json.loads(tar.extractfile("testproject/.djsuite.json").read())
+        assert members["testproject/entrypoint.sh"].mode == 0o755
+        assert members["testproject/manage.py"].mode == 0o644
+        assert {m.mtime for m in members.values()} == {DEFAULT_MTIME}
+        assert config["files"]["manage.py"]["mtime_ns"] == DEFAULT_MTIME * 10**9
+
+    def test_reproducible(self, in_tmp):
+        _generate(in_tmp, "--output-archive", "one.tar.gz")
+        _generate(in_tmp, "--output-archive", "two.tar.gz")
+        assert (in_tmp / "one.tar.gz").read_bytes() == (in_tmp / "two.tar.gz").read_bytes()
+
+    def test_source_date_epoch(self, in_tmp, monkeypatch):
+        monkeypatch.setenv("SOURCE_DATE_EPOCH", "1700000000")
+        _generate(in_tmp, "--output-archive", "p.tar")
+        with tarfile.open(in_tmp / "p.tar") as tar:
+            assert {m.mtime for m in tar.getmembers()} == {1700000000}
+
+    def test_zip(self, in_tmp):
+        _generate(in_tmp, "--output-archive", "p.zip")
+        with zipfile.ZipFile(in_tmp / "p.zip") as zf:
+            info = zf.getinfo("testproject/entrypoint.sh")
+            assert (info.external_attr >> 16) & 0o777 == 0o755
+            assert zf.read("testproject/manage.py").startswith(b"#!")
+
+    def test_stdout(self, in_tmp, capsysbinary):
+        assert _generate(in_tmp, "--output-archive", "-", "--archive-format", "tar") == 0
+        captured = capsysbinary.readouterr()
+        assert list(in_tmp.iterdir()) == []
+        assert b"added manage.py" in captured.err
+        names = tarfile.open(fileobj=io.BytesIO(captured.out)).getnames()
+        assert names[0] == "testproject"
+        assert names[-1] == "testproject/.djsuite.json"
+
+    def test_extracted_project_is_up_to_date(self, in_tmp, capsys):
+        _generate(in_tmp, "--output-archive", "p.tar.gz")
+        with tarfile.open(in_tmp / "p.tar.gz") as tar:
+            tar.extractall(in_tmp / "out")
+        capsys.readouterr()
+        assert main(["--update-all", "--project-dir", str(in_tmp / "out" / "testproject")]) == 0
+        assert "All files are up to date." in capsys.readouterr().out
@@ -0,0 +1,130 @@
+"""Tests for the backup module."""
+
+import json
+import os
+import stat
+
+import pytest
+
+from djsuite.backup import BACKUP_DIR, RUN_MANIFEST, backup_files, list_runs, prune_backups, restore_backup
+from djsuite.cli import main
+
+
+@pytest.fixture
+def project(tmp_path):
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "a.txt").write_text("alpha\n")
+    (tmp_path / "sub" / "b.txt").write_text("beta\n")
+    (tmp_path / "run.sh").write_text("#!/bin/sh\n")
+    (tmp_path / "run.sh").chmod(0o755)
+    return tmp_path
+
+
+def _objects(project):
+    return [p for p in (project / BACKUP_DIR / "objects").glob("*/*")]
+
+
+class TestBackupFiles:
+    def test_run_manifest_points_into_store(self, project):
+        run_dir = backup_files(project, ["a.txt", "sub/b.txt", "missing.txt"], quiet=True)
+        manifest = json.loads((run_dir / RUN_MANIFEST).read_text())
+        assert sorted(manifest["files"]) == ["a.txt", "sub/b.txt"]
+        assert len(_objects(project)) == 2
+        assert (run_dir / "sub" / "b.txt").read_text() == "beta\n"
+
+    def test_identical_content_stored_once(self, project):
+        (project / "copy.txt").write_text("alpha\n")
+        backup_files(project, ["a.txt", "copy.txt"], quiet=True)
+        backup_files(project, ["a.txt"], quiet=True)
+        assert len(_objects(project)) == 1
+
+    def test_run_tree_is_hard_linked(self, project):
+        run_dir = backup_files(project, ["a.txt"], quiet=True)
+        assert (run_dir / "a.txt").stat().st_nlink >= 2
+
+    def test_same_second_runs_do_not_collide(self, project):
+        first = backup_files(project, ["a.txt"], quiet=True)
+        (project / "a.txt").write_text("changed\n")
+        second = backup_files(project, ["a.txt"], quiet=True)
+        assert first != second
+        assert (first / "a.txt").read_text() == "alpha\n"
+        assert (second / "a.txt").read_text() == "changed\n"
+
+    def test_nothing_to_back_up(self, project):
+        assert backup_files(project, ["missing.txt"]) is None
+
+
+class TestRestore:
+    def test_restores_latest_with_mode(self, project):
+        backup_files(project, ["a.txt", "run.sh"], quiet=True)
+        (project / "a.txt").write_text("overwritten\n")
+        (project / "run.sh").unlink()
+        assert restore_backup(project) == 0
+        assert (project / "a.txt").read_text() == "alpha\n"
+        assert (project / "run.sh").stat().st_mode & stat.S_IXUSR
+
+    def test_restored_file_is_independent_of_store(self, project):
+        backup_files(project, ["a.txt"], quiet=True)
+        restore_backup(project)
+        (project / "a.txt").write_text("edited\n")
+        assert restore_backup(project) == 0
+        assert (project / "a.txt").read_text() == "alpha\n"
+
+    def test_unknown_run(self, project, capsys):
+        assert restore_backup(project, "nope") == 1
+        assert "no backup run" in capsys.readouterr().out
+
+    def test_legacy_run_directory(self, project):
+        legacy = project / BACKUP_DIR / "20240101_120000"
+        (legacy / "sub").mkdir(parents=True)
+        (legacy / "sub" / "b.txt").write_text("old beta\n")
+        assert restore_backup(project, "20240101_120000") == 0
+        assert (project / "sub" / "b.txt").read_text() == "old beta\n"
+
+
+class TestPrune:
+    def test_keep_last(self, project):
+        for n in range(3):
+            (project / "a.txt").write_text(f"v{n}\n")
+            backup_files(project, ["a.txt"], quiet=True)
+        removed = prune_backups(project, keep_last=1, quiet=True)
+        assert len(removed) == 2
+        runs = list_runs(project)
+        assert len(runs) == 1
+        assert len(_objects(project)) == 1
+        assert restore_backup(project) == 0
+        assert (project / "a.txt").read_text() == "v2\n"
+
+    def test_keep_days(self, project):
+        legacy = project / BACKUP_DIR / "20000101_000000"
+        legacy.mkdir(parents=True)
+        (legacy / "a.txt").write_text("ancient\n")
+        backup_files(project, ["a.txt"], quiet=True)
+        removed = prune_backups(project, keep_days=7, quiet=True)
+        assert removed == ["20000101_000000"]
+
+    def test_no_policy_keeps_everything(self, project):
+        backup_files(project, ["a.txt"], quiet=True)
+        assert prune_backups(project) == []
+
+
+class TestBackupCli:
+    def test_list_and_restore(self, project, capsys):
+        backup_files(project, ["a.txt"], quiet=True)
+        (project / "a.txt").write_text("new\n")
+        assert main(["--list-backups", "--project-dir", str(project)]) == 0
+        assert "1 file(s)" in capsys.readouterr().out
+        assert main(["--restore", "--project-dir", str(project)]) == 0
+        assert (project / "a.txt").read_text() == "alpha\n"
+
+    def test_prune_requires_policy(self, project):
+        with pytest.raises(SystemExit):
+            main(["--prune-backups", "--project-dir", str(project)])
+
+    def test_prune(self, project):
+        for n in range(2):
+            (project / "a.txt").write_text(f"v{n}\n")
+            backup_files(project, ["a.txt"], quiet=True)
+        assert main(["--prune-backups", "--keep-last", "1", "--project-dir", str(project)]) == 0
+        assert len(list_runs(project)) == 1
+        assert not [p for p in os.listdir(project / BACKUP_DIR) if p.startswith(".tmp")]
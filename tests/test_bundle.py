@@ -0,0 +1,99 @@
+"""Tests for the bundle module."""
+
+import sys
+
+import jinja2
+import pytest
+
+import djsuite
+from djsuite import renderer
+from djsuite.bundle import build, validate
+from djsuite.manifest import Platform, get_manifest
+from djsuite.renderer import create_environment, get_environment, get_render_cache, render_all
+
+
+@pytest.fixture
+def context():
+    return {
+        "project_name": "myapp",
+        "python_version": "3.12",
+        "django_version": "5.2",
+        "drf_version": "3.16",
+        "author": "Test",
+        "description": "Test desc",
+        "platform": "aws-eb",
+    }
+
+
+@pytest.fixture
+def fresh_renderer():
+    def clear():
+        renderer._load_bundle.cache_clear()
+        get_environment.cache_clear()
+        get_render_cache.cache_clear()
+        sys.modules.pop("djsuite._bundle", None)
+
+    clear()
+    yield
+    clear()
+
+
+@pytest.fixture
+def installed_bundle(tmp_path, monkeypatch, fresh_renderer):
+    """Build a bundle outside the source tree and make it importable as djsuite._bundle."""
+    assert build(tmp_path / "_bundle", quiet=True) == 0
+    monkeypatch.setattr(djsuite, "__path__", [*djsuite.__path__, str(tmp_path)])
+    return tmp_path / "_bundle"
+
+
+class TestBuild:
+    def test_compiles_templates_and_embeds_static_files(self, tmp_path):
+        assert build(tmp_path / "_bundle", quiet=True) == 0
+        init = (tmp_path / "_bundle" / "__init__.py").read_text()
+        assert "'common/main/settings.py.j2'" in init
+        assert "'common/manage.py'" in init
+        assert list((tmp_path / "_bundle").glob("tmpl_*.py"))
+
+    def test_validation_catches_undefined_variables(self):
+        env = create_environment(loader=jinja2.DictLoader({"common/dotenv.j2": "{{ not_in_context }}"}))
+        errors = validate(env)
+        assert any("not_in_context" in error for error in errors)
+
+    def test_validation_renders_asgi_branches(self):
+        source = '{% if server == "asgi" %}{{ asgi_only }}{% endif %}'
+        env = create_environment(loader=jinja2.DictLoader({"common/dotenv.j2": source}))
+        errors = validate(env)
+        assert any("(aws-eb, asgi)" in error and "asgi_only" in error for error in errors)
+        assert not any("(aws-eb, wsgi)" in error and "asgi_only" in error for error in errors)
+
+    def test_failed_validation_writes_nothing(self, tmp_path, monkeypatch, capsys):
+        monkeypatch.setattr("djsuite.bundle.validate", lambda env: ["common/x.j2: boom"])
+        assert build(tmp_path / "_bundle") == 1
+        assert not (tmp_path / "_bundle").exists()
+        assert "boom" in capsys.readouterr().out
+
+
+class TestRendererWithBundle:
+    def test_bundle_is_used(self, installed_bundle):
+        assert isinstance(get_environment().loader.loaders[0], jinja2.ModuleLoader)
+
+    def test_output_matches_sources(self, installed_bundle, context, monkeypatch):
+        manifest = get_manifest(Platform.AWS_EB)
+        bundled = render_all(manifest, context)
+        monkeypatch.setenv("DJSUITE_NO_BUNDLE", "1")
+        renderer._load_bundle.cache_clear()
+        get_environment.cache_clear()
+        assert not isinstance(get_environment().loader.loaders[0], jinja2.ModuleLoader)
+        assert render_all(manifest, context) == bundled
+
+    def test_version_mismatch_falls_back_to_sources(self, installed_bundle, monkeypatch):
+        init = installed_bundle / "__init__.py"
+        init.write_text(init.read_text().replace("DJSUITE_VERSION = ", "DJSUITE_VERSION = '0.0.0' or "))
+        assert renderer._load_bundle() is None
+
+    def test_render_cache_keys_on_bundle_hashes(self, installed_bundle, context, monkeypatch, isolated_cache_dir):
+        monkeypatch.setenv("DJSUITE_RENDER_CACHE", "1")
+        manifest = get_manifest(Platform.AWS_EB)
+        first = render_all(manifest, context)
+        assert list((isolated_cache_dir / "render" / "entries").iterdir())
+        assert render_all(manifest, context) == first
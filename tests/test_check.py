@@ -0,0 +1,103 @@
+"""Tests for the check module."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from djsuite.check import CHANGED, iter_drift, run_check
+from djsuite.cli import main
+from djsuite.generator import generate
+from djsuite.index import MISSING
+from djsuite.manifest import Platform, UpdateGroup, files_for_groups
+
+ALL_GROUPS = {UpdateGroup.CI, UpdateGroup.DOCKER, UpdateGroup.INFRA, UpdateGroup.ROOT}
+
+
+@pytest.fixture
+def context():
+    return {
+        "project_name": "svc_a",
+        "python_version": "3.12",
+        "django_version": "5.2",
+        "drf_version": "3.16",
+        "author": "Test Author",
+        "description": "A test project",
+        "platform": "aws-eb",
+    }
+
+
+@pytest.fixture
+def fleet(tmp_path, context):
+    services = tmp_path / "services"
+    for name in ("svc_a", "svc_b"):
+        generate({**context, "project_name": name}, str(services), offline=True)
+    return services
+
+
+class TestIterDrift:
+    def test_reports_changed_and_missing(self, fleet, context):
+        (fleet / "svc_a" / "Dockerfile").write_text("# edited\n")
+        (fleet / "svc_a" / "entrypoint.sh").unlink()
+        manifest = files_for_groups({UpdateGroup.DOCKER}, Platform.AWS_EB)
+        dirs = [str(fleet / "svc_a")]
+        drift = {path: d for path, d in iter_drift(dirs, manifest, context) if d}
+        assert drift == {"Dockerfile": {dirs[0]: CHANGED}, "entrypoint.sh": {dirs[0]: MISSING}}
+
+    def test_indexed_files_are_not_read(self, fleet, context, monkeypatch):
+        project = fleet / "svc_a"
+        read = []
+        original = Path.read_text
+
+        def read_text(self, *args, **kwargs):
+            read.append(self)
+            return original(self, *args, **kwargs)
+
+        monkeypatch.setattr(Path, "read_text", read_text)
+        manifest = files_for_groups(ALL_GROUPS, Platform.AWS_EB)
+        assert not any(d for _, d in iter_drift([str(project)], manifest, context))
+        assert not [path for path in read if project in path.parents]
+
+
+class TestRunCheck:
+    def test_clean_projects_pass(self, fleet, capsys):
+        assert run_check([str(fleet / "svc_a"), str(fleet / "svc_b")], ALL_GROUPS) == 0
+        assert "All files match the templates." in capsys.readouterr().out
+
+    def test_drift_fails_without_writing(self, fleet, capsys):
+        dockerfile = fleet / "svc_b" / "Dockerfile"
+        dockerfile.write_text("# edited\n")
+        dirs = [str(fleet / "svc_a"), str(fleet / "svc_b")]
+        assert run_check(dirs, ALL_GROUPS, as_json=True) == 1
+        report = json.loads(capsys.readouterr().out)
+        assert report["drift"] is True
+        by_name = {p["project_dir"].rsplit("/", 1)[-1]: p for p in report["projects"]}
+        assert by_name["svc_a"]["status"] == "ok"
+        assert by_name["svc_b"]["files"] == {"Dockerfile": "changed"}
+        assert dockerfile.read_text() == "# edited\n"
+        assert not (fleet / "svc_b" / ".djsuite-backup").exists()
+
+    def test_fail_fast_skips_remaining_projects(self, fleet, context, capsys):
+        generate({**context, "project_name": "other", "description": "different"}, str(fleet), offline=True)
+        (fleet / "svc_a" / "Dockerfile").write_text("# edited\n")
+        dirs = [str(fleet / "svc_a"), str(fleet / "other")]
+        capsys.readouterr()
+        assert run_check(dirs, ALL_GROUPS, as_json=True, fail_fast=True) == 1
+        projects = json.loads(capsys.readouterr().out)["projects"]
+        assert [p["status"] for p in projects] == ["drift", "skipped"]
+
+    def test_missing_config_is_an_error(self, tmp_path, capsys):
+        assert run_check([str(tmp_path)], ALL_GROUPS) == 1
+        assert "ERROR: .djsuite.json not found" in capsys.readouterr().out
+
+
+class TestCheckFlag:
+    def test_defaults_to_all_groups(self, fleet, capsys):
+        assert main(["--check", "--project-dir", str(fleet / "svc_a")]) == 0
+        (fleet / "svc_a" / "README.md").write_text("edited\n")
+        assert main(["--check", "--project-dir", str(fleet / "svc_a")]) == 1
+        assert main(["--check", "--update-docker", "--project-dir", str(fleet / "svc_a")]) == 0
+
+    def test_project_dirs(self, fleet, capsys):
+        assert main(["--check", "--update-all", "--project-dirs", str(fleet / "*"), "--json"]) == 0
+        assert len(json.loads(capsys.readouterr().out)["projects"]) == 2
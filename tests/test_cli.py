@@ -1,6 +1,8 @@
 """Tests for the CLI module."""
 
 import getpass
+import subprocess
+import sys
 
 import pytest
 
@@ -41,6 +43,7 @@ class TestBuildParser:
         assert args.output_dir == "."
         assert not args.dry_run
         assert args.platform == "aws-eb"
+        assert args.server == "wsgi"
 
     def test_create_mode_custom_flags(self):
         parser = build_parser()
@@ -115,3 +118,53 @@ class TestMainFunction:
         """Without project_name and no update flags, should error."""
         with pytest.raises(SystemExit):
             main([])
+
+    def test_version_fast_path(self, capsys):
+        from djsuite import __version__
+
+        assert main(["--version"]) == 0
+        assert capsys.readouterr().out == f"djsuite {__version__}\n"
+
+
+# Cold-start budget for djsuite's own imports, measured with -X importtime.
+# Generous enough for a slow CI runner; lazy imports keep it far below.
+IMPORT_BUDGET_MS = 60
+HEAVY_MODULES = {"jinja2", "concurrent.futures", "subprocess", "djsuite.renderer", "djsuite.writer"}
+
+
+def _import_profile(argv, tmp_path):
+    """Run main(argv) in a fresh interpreter; return (djsuite import ms, imported module names)."""
+    code = f"import sys; from djsuite.cli import main; sys.exit(main({argv!r}))"
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=tmp_path,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    total_us = 0
+    modules = set()
+    seen_djsuite = False
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line or "self [us]" in line:
+            continue
+        _self, cumulative, name = line[len("import time:") :].split("|")
+        modules.add(name.strip())
+        if name.startswith(" djsuite"):
+            seen_djsuite = True
+        # Only top-level entries; the cumulative time of nested imports is already counted.
+        if seen_djsuite and not name.startswith("  "):
+            total_us += int(cumulative)
+    return total_us / 1000, modules
+
+
+class TestStartup:
+    @pytest.mark.parametrize(
+        "argv",
+        [["--version"], ["--list-files"], ["testproject", "--dry-run"]],
+        ids=["version", "list-files", "dry-run"],
+    )
+    def test_light_modes_stay_within_budget(self, argv, tmp_path):
+        elapsed_ms, modules = _import_profile(argv, tmp_path)
+        assert not modules & HEAVY_MODULES, f"{argv} imported {sorted(modules & HEAVY_MODULES)}"
+        assert elapsed_ms < IMPORT_BUDGET_MS, f"{argv} spent {elapsed_ms:.1f}ms importing (budget {IMPORT_BUDGET_MS}ms)"
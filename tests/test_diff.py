@@ -0,0 +1,97 @@
+"""Tests for the diff and textdiff modules."""
+
+import random
+
+import pytest
+
+from djsuite.diff import diff_summary, unified_diff
+from djsuite.textdiff import change_counts, intern_lines, matching_blocks, matching_pairs
+
+
+def _lcs_length(a, b):
+    prev = [0] * (len(b) + 1)
+    for x in a:
+        row = [0]
+        for j, y in enumerate(b):
+            row.append(prev[j] + 1 if x == y else max(prev[j + 1], row[j]))
+        prev = row
+    return prev[-1]
+
+
+class TestMatchingPairs:
+    def test_identical(self):
+        a, b = intern_lines(["x", "y"], ["x", "y"])
+        assert matching_pairs(a, b) == [(0, 0), (1, 1)]
+
+    @pytest.mark.parametrize("seed", range(20))
+    def test_matches_are_valid_and_minimal_on_small_inputs(self, seed):
+        rng = random.Random(seed)
+        old = [rng.choice("abcde") for _ in range(rng.randint(0, 40))]
+        new = [rng.choice("abcde") for _ in range(rng.randint(0, 40))]
+        a, b = intern_lines(old, new)
+        pairs = matching_pairs(a, b)
+        assert all(a[i] == b[j] for i, j in pairs)
+        assert all(p[0] < q[0] and p[1] < q[1] for p, q in zip(pairs, pairs[1:]))
+        assert len(pairs) <= _lcs_length(old, new)
+
+    def test_myers_fallback_is_exact(self):
+        old = list("abcabba")
+        new = list("cbabac")
+        a, b = intern_lines(old, new)
+        assert len(matching_pairs(a, b)) == _lcs_length(old, new)
+
+    def test_max_d_bounds_search(self):
+        rng = random.Random(0)
+        old = [rng.choice("abc") for _ in range(200)]
+        new = [rng.choice("abc") for _ in range(200)]
+        a, b = intern_lines(old, new)
+        assert len(matching_pairs(a, b, max_d=5)) < len(matching_pairs(a, b))
+
+    def test_matching_blocks_sentinel(self):
+        a, b = intern_lines(["a", "b", "c"], ["a", "x", "c"])
+        assert matching_blocks(a, b) == [(0, 0, 1), (2, 2, 1), (3, 3, 0)]
+
+
+class TestChangeCounts:
+    def test_counts_additions_and_removals(self):
+        old = ["a", "b", "c", "d"]
+        new = ["a", "c", "d", "e", "f"]
+        assert change_counts(old, new) == (2, 1)
+
+    def test_repeated_lines(self):
+        old = ["- item\n"] * 1000 + ["end\n"]
+        new = ["- item\n"] * 998 + ["- other\n"] + ["end\n"]
+        assert change_counts(old, new) == (1, 2)
+
+
+class TestDiffSummary:
+    def test_new(self, tmp_path):
+        assert diff_summary(tmp_path, "missing.txt", "x") == "[NEW]"
+
+    def test_unchanged(self, tmp_path):
+        (tmp_path / "f.txt").write_text("a\nb\n")
+        assert diff_summary(tmp_path, "f.txt", "a\nb\n") == "[UNCHANGED]"
+
+    def test_changed_counts(self, tmp_path):
+        (tmp_path / "f.txt").write_text("a\nb\nc\n")
+        assert diff_summary(tmp_path, "f.txt", "a\nB\nc\nd\n") == "[CHANGED] (+2/-1 lines)"
+
+    def test_trailing_newline_change_counts_one_line(self, tmp_path):
+        (tmp_path / "f.txt").write_text("a\nb")
+        assert diff_summary(tmp_path, "f.txt", "a\nb\n") == "[CHANGED] (+1/-1 lines)"
+        (tmp_path / "g.txt").write_text("a\nb\n")
+        assert diff_summary(tmp_path, "g.txt", "a\nb") == "[CHANGED] (+1/-1 lines)"
+
+
+class TestUnifiedDiff:
+    def test_lazy_and_labelled(self, tmp_path):
+        (tmp_path / "f.txt").write_text("a\nb\n")
+        lines = unified_diff(tmp_path, "f.txt", "a\nc\n")
+        assert not isinstance(lines, list)
+        lines = list(lines)
+        assert lines[0] == "--- a/f.txt"
+        assert "-b" in lines
+        assert "+c" in lines
+
+    def test_new_file(self, tmp_path):
+        assert "+x" in list(unified_diff(tmp_path, "new.txt", "x\n"))
@@ -0,0 +1,143 @@
+"""Tests for the fleet module."""
+
+import io
+import json
+
+import jinja2
+import pytest
+
+from djsuite.cli import main
+from djsuite.fleet import resolve_project_dirs, run_fleet_update
+from djsuite.generator import generate
+from djsuite.manifest import UpdateGroup
+
+
+@pytest.fixture
+def context():
+    return {
+        "project_name": "svc_a",
+        "python_version": "3.12",
+        "django_version": "5.2",
+        "drf_version": "3.16",
+        "author": "Test Author",
+        "description": "A test project",
+        "platform": "aws-eb",
+    }
+
+
+@pytest.fixture
+def fleet(tmp_path, context):
+    services = tmp_path / "services"
+    for name in ("svc_a", "svc_b", "svc_c"):
+        generate({**context, "project_name": name}, str(services))
+    return services
+
+
+class TestResolveProjectDirs:
+    def test_expands_globs(self, fleet):
+        dirs = resolve_project_dirs([str(fleet / "svc_*")])
+        assert [d.rsplit("/", 1)[-1] for d in dirs] == ["svc_a", "svc_b", "svc_c"]
+
+    def test_reads_list_file_and_deduplicates(self, fleet, tmp_path):
+        list_file = tmp_path / "projects.txt"
+        list_file.write_text(f"# fleet\n{fleet / 'svc_a'}\n\n{fleet / 'svc_b'}\n")
+        dirs = resolve_project_dirs([str(fleet / "svc_a")], str(list_file))
+        assert len(dirs) == 2
+
+    def test_skips_non_directories(self, tmp_path):
+        assert resolve_project_dirs([str(tmp_path / "missing")]) == []
+
+    def test_list_from_stdin_leaves_stdin_open(self, fleet, monkeypatch):
+        stdin = io.StringIO(f"{fleet / 'svc_a'}\n")
+        monkeypatch.setattr("sys.stdin", stdin)
+        assert len(resolve_project_dirs([], "-")) == 1
+        assert not stdin.closed
+
+
+class TestRunFleetUpdate:
+    def test_reports_counts_per_project(self, fleet, capsys):
+        (fleet / "svc_b" / "Dockerfile").write_text("# old\n")
+        (fleet / "svc_c" / "entrypoint.sh").unlink()
+
+        dirs = resolve_project_dirs([str(fleet / "*")])
+        result = run_fleet_update(dirs, {UpdateGroup.DOCKER}, no_backup=True, as_json=True)
+        assert result == 0
+
+        report = json.loads(capsys.readouterr().out)
+        assert report["renders"] == 3
+        by_name = {p["project_dir"].rsplit("/", 1)[-1]: p for p in report["projects"]}
+        assert by_name["svc_a"]["status"] == "up-to-date"
+        assert by_name["svc_b"]["changed"] == 1
+        assert by_name["svc_c"]["new"] == 1
+        assert "python:3.12-slim" in (fleet / "svc_b" / "Dockerfile").read_text()
+        assert (fleet / "svc_c" / "entrypoint.sh").exists()
+
+    def test_shared_context_rendered_once(self, fleet, tmp_path, capsys):
+        clone = tmp_path / "clone"
+        (fleet / "svc_a").rename(clone)
+        (fleet / "svc_b" / ".djsuite.json").write_text((clone / ".djsuite.json").read_text())
+
+        run_fleet_update([str(clone), str(fleet / "svc_b")], {UpdateGroup.CI}, no_backup=True, as_json=True)
+        assert json.loads(capsys.readouterr().out)["renders"] == 1
+
+    def test_missing_config_is_reported(self, fleet, tmp_path, capsys):
+        (tmp_path / "notaproject").mkdir()
+        result = run_fleet_update([str(fleet / "svc_a"), str(tmp_path / "notaproject")], {UpdateGroup.CI})
+        assert result == 1
+        out = capsys.readouterr().out
+        assert "ERROR: .djsuite.json not found" in out
+        assert "Total:" in out
+
+    def test_unreadable_config_fails_only_that_project(self, fleet, capsys):
+        (fleet / "svc_a" / ".djsuite.json").write_text("{not json")
+        config = json.loads((fleet / "svc_b" / ".djsuite.json").read_text())
+        (fleet / "svc_b" / ".djsuite.json").write_text(json.dumps({**config, "platform": "mainframe"}))
+
+        result = run_fleet_update(resolve_project_dirs([str(fleet / "*")]), {UpdateGroup.CI}, no_backup=True, as_json=True)
+        assert result == 1
+        by_name = {p["project_dir"].rsplit("/", 1)[-1]: p for p in json.loads(capsys.readouterr().out)["projects"]}
+        assert by_name["svc_a"]["status"] == "error"
+        assert by_name["svc_b"]["status"] == "error"
+        assert by_name["svc_c"]["status"] == "up-to-date"
+
+    def test_render_error_fails_only_that_context(self, fleet, monkeypatch, capsys):
+        from djsuite import fleet as fleet_module
+
+        render = fleet_module.iter_render
+
+        def iter_render(manifest, context, max_workers=None):
+            if context["project_name"] == "svc_a":
+                raise jinja2.UndefinedError("'missing' is undefined")
+            return render(manifest, context, max_workers)
+
+        monkeypatch.setattr(fleet_module, "iter_render", iter_render)
+        result = run_fleet_update(resolve_project_dirs([str(fleet / "*")]), {UpdateGroup.CI}, no_backup=True, as_json=True)
+        assert result == 1
+        by_name = {p["project_dir"].rsplit("/", 1)[-1]: p for p in json.loads(capsys.readouterr().out)["projects"]}
+        assert by_name["svc_a"] == {"project_dir": str(fleet / "svc_a"), "status": "error", "error": "render: 'missing' is undefined"}
+        assert by_name["svc_b"]["status"] == "up-to-date"
+        assert by_name["svc_c"]["status"] == "up-to-date"
+
+    def test_io_error_fails_only_that_project(self, fleet, capsys):
+        (fleet / "svc_a" / "Dockerfile").unlink()
+        (fleet / "svc_a" / "Dockerfile").mkdir()
+
+        result = run_fleet_update(resolve_project_dirs([str(fleet / "*")]), {UpdateGroup.DOCKER}, no_backup=True, as_json=True)
+        assert result == 1
+        by_name = {p["project_dir"].rsplit("/", 1)[-1]: p for p in json.loads(capsys.readouterr().out)["projects"]}
+        assert by_name["svc_a"]["status"] == "error"
+        assert by_name["svc_b"]["status"] == "up-to-date"
+
+    def test_backs_up_changed_files(self, fleet):
+        (fleet / "svc_a" / "Dockerfile").write_text("# old\n")
+        run_fleet_update([str(fleet / "svc_a")], {UpdateGroup.DOCKER}, as_json=True)
+        assert (fleet / "svc_a" / ".djsuite-backup").exists()
+
+
+class TestFleetCli:
+    def test_project_dirs_flag(self, fleet, capsys):
+        result = main(["--update-ci", "--no-backup", "--project-dirs", str(fleet / "*")])
+        assert result == 0
+        out = capsys.readouterr().out
+        assert "Updated 3 project(s)" in out
+        assert "UNCHANGED" in out
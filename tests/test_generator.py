@@ -1,7 +1,11 @@
 """Tests for the generator module."""
 
+import ast
+import io
 import json
+import math
 import stat
+import types
 
 import pytest
 
@@ -125,6 +129,47 @@ class TestGenerate:
         urls = (tmp_path / "testproject" / "base" / "urls.py").read_text()
         assert "HealthCheckView" in views
         assert "health/" in urls
+        assert "health/live/" in urls
+        assert "health/ready/" in urls
+        service = (tmp_path / "testproject" / "base" / "services" / "health_service.py").read_text()
+        compile(service, "health_service.py", "exec")
+        assert "HEALTH_CHECK_CACHE_SECONDS" in service
+        assert (tmp_path / "testproject" / "base" / "tests" / "test_health.py").exists()
+
+    def test_task_status_endpoints(self, tmp_path, context):
+        for server in ("wsgi", "asgi"):
+            generate({**context, "server": server}, str(tmp_path / server))
+            project_dir = tmp_path / server / "testproject"
+            urls = (project_dir / "base" / "urls.py").read_text()
+            assert "task-status/batch/" in urls
+            assert "task-status/stream/" in urls
+            service = (project_dir / "base" / "services" / "task_status_service.py").read_text()
+            assert "TaskResult.objects.filter(task_id__in=missing)" in service
+        assert (project_dir / "base" / "tests" / "test_task_status.py").exists()
+
+    def test_pagination_classes(self, tmp_path, context):
+        generate(context, str(tmp_path))
+        project_dir = tmp_path / "testproject"
+        pagination = (project_dir / "base" / "pagination.py").read_text()
+        compile(pagination, "pagination.py", "exec")
+        assert "return None  # bypass pagination" not in pagination
+        assert "class KeysetPagination" in pagination
+        assert "pg_class" in pagination
+        settings = (project_dir / "main" / "settings.py").read_text()
+        assert '"DEFAULT_PAGINATION_CLASS": "base.pagination.StandardResultsSetPagination"' in settings
+        assert (project_dir / "base" / "tests" / "test_pagination.py").exists()
+
+    def test_query_budget_plugin(self, tmp_path, context):
+        generate(context, str(tmp_path))
+        project_dir = tmp_path / "testproject"
+        for name in ("query_budget.py", "test_query_budget.py"):
+            source = (project_dir / "tests" / name).read_text()
+            compile(source, name, "exec")
+        conftest = (project_dir / "conftest.py").read_text()
+        assert 'pytest_plugins = ["tests.query_budget"]' in conftest
+        ci = (project_dir / ".github" / "workflows" / "ci.yml").read_text()
+        assert "--query-report=reports/query-report.json" in ci
+        assert "actions/upload-artifact@v4" in ci
 
     def test_template_substitution_ci(self, tmp_path, context):
         generate(context, str(tmp_path))
@@ -165,6 +210,96 @@ class TestGenerate:
         mode = entrypoint.stat().st_mode
         assert mode & stat.S_IXUSR
 
+    def test_gunicorn_config(self, tmp_path, context):
+        generate(context, str(tmp_path))
+        project_dir = tmp_path / "testproject"
+        config = (project_dir / "gunicorn.conf.py").read_text()
+        compile(config, "gunicorn.conf.py", "exec")
+        assert "GUNICORN_WORKER_CLASS" in config
+        assert "max_requests_jitter" in config
+        assert 'worker_tmp_dir = "/dev/shm"' in config
+        assert "--config gunicorn.conf.py" in (project_dir / "pyproject.toml").read_text()
+        assert "-t 600" not in (project_dir / "pyproject.toml").read_text()
+        assert "--config /app/gunicorn.conf.py" in (project_dir / "supervisord_app.conf").read_text()
+        assert "GUNICORN_WORKERS" in (project_dir / ".env").read_text()
+
+    @pytest.mark.parametrize(
+        "files, expected",
+        [
+            ({"/sys/fs/cgroup/cpu.max": "150000 100000\n"}, 2),
+            ({"/sys/fs/cgroup/cpu.max": "max 100000\n"}, 64),
+            ({"/sys/fs/cgroup/cpu/cpu.cfs_quota_us": "300000\n", "/sys/fs/cgroup/cpu/cpu.cfs_period_us": "100000\n"}, 3),
+            ({"/sys/fs/cgroup/cpu/cpu.cfs_quota_us": "-1\n", "/sys/fs/cgroup/cpu/cpu.cfs_period_us": "100000\n"}, 64),
+            ({}, 64),
+        ],
+    )
+    def test_gunicorn_cpu_count_reads_cgroup_quota(self, tmp_path, context, files, expected):
+        generate(context, str(tmp_path))
+        tree = ast.parse((tmp_path / "testproject" / "gunicorn.conf.py").read_text())
+        functions = ast.Module([node for node in tree.body if isinstance(node, ast.FunctionDef)], type_ignores=[])
+
+        def fake_open(path, *args, **kwargs):
+            if path not in files:
+                raise FileNotFoundError(path)
+            return io.StringIO(files[path])
+
+        fake_os = types.SimpleNamespace(sched_getaffinity=lambda pid: set(range(64)))
+        namespace = {"math": math, "os": fake_os, "open": fake_open}
+        exec(compile(functions, "gunicorn.conf.py", "exec"), namespace)
+        assert namespace["cpu_count"]() == expected
+
+    @pytest.mark.parametrize(
+        "worker_class, cpus, memory_mb, workers, expected",
+        [
+            ("gthread", 4, 8192, None, (5, 4)),  # CPU-bound: 5 workers share 16 threads
+            ("gthread", 8, 1024, None, (3, 8)),  # memory caps workers, so each runs more threads
+            ("gthread", 8, 512, None, (1, 12)),  # and the memory left caps threads
+            ("gthread", 2, None, None, (3, 3)),
+            ("gthread", 4, 8192, 2, (2, 8)),  # GUNICORN_WORKERS set
+            ("sync", 2, 8192, None, (5, 1)),
+            ("uvicorn_worker.UvicornWorker", 2, 8192, None, (2, 1)),
+        ],
+    )
+    def test_gunicorn_pool_sizing(self, tmp_path, context, worker_class, cpus, memory_mb, workers, expected):
+        generate(context, str(tmp_path))
+        tree = ast.parse((tmp_path / "testproject" / "gunicorn.conf.py").read_text())
+        functions = ast.Module([node for node in tree.body if isinstance(node, ast.FunctionDef)], type_ignores=[])
+        namespace = {"math": math}
+        exec(compile(functions, "gunicorn.conf.py", "exec"), namespace)
+        mb = 1024 * 1024
+        memory = memory_mb * mb if memory_mb else None
+        assert namespace["size_pool"](worker_class, cpus, memory, 256 * mb, 32 * mb, workers) == expected
+
+    def test_redis_cache_and_sessions(self, tmp_path, context):
+        generate(context, str(tmp_path))
+        project_dir = tmp_path / "testproject"
+        settings = (project_dir / "main" / "settings.py").read_text()
+        assert "django.core.cache.backends.redis.RedisCache" in settings
+        assert '"KEY_PREFIX": "testproject"' in settings
+        assert "django.contrib.sessions.backends.cached_db" in settings
+        assert "REDIS_CACHE_URL=" in (project_dir / ".env").read_text()
+        service = (project_dir / "base" / "services" / "cache_service.py").read_text()
+        compile(service, "cache_service.py", "exec")
+        assert "def invalidate_on_save" in service
+        assert (project_dir / "base" / "tests" / "test_cache_service.py").exists()
+
+    def test_asgi_server(self, tmp_path, context):
+        generate({**context, "server": "asgi"}, str(tmp_path))
+        project_dir = tmp_path / "testproject"
+        for path in project_dir.rglob("*.py"):
+            compile(path.read_text(), str(path), "exec")
+        assert "AsyncHealthCheckView" in (project_dir / "base" / "urls.py").read_text()
+        assert 'wsgi_app = "main.asgi:application"' in (project_dir / "gunicorn.conf.py").read_text()
+        assert "uvicorn-worker" in (project_dir / "pyproject.toml").read_text()
+        assert json.loads((project_dir / ".djsuite.json").read_text())["server"] == "asgi"
+
+    def test_wsgi_server_by_default(self, tmp_path, context):
+        generate(context, str(tmp_path))
+        project_dir = tmp_path / "testproject"
+        assert "from base.views import (" in (project_dir / "base" / "urls.py").read_text()
+        assert 'wsgi_app = "main.wsgi:application"' in (project_dir / "gunicorn.conf.py").read_text()
+        assert "uvicorn" not in (project_dir / "pyproject.toml").read_text()
+
     def test_no_project_specific_code_in_settings(self, tmp_path, context):
         generate(context, str(tmp_path))
         settings = (tmp_path / "testproject" / "main" / "settings.py").read_text()
@@ -205,6 +340,19 @@ class TestGenerate:
         captured = capsys.readouterr()
         assert "already exists" in captured.out
 
+    def test_render_error_leaves_no_project(self, tmp_path, context, monkeypatch):
+        import djsuite.renderer
+
+        def broken_render(dir_prefix, template_path, ctx):
+            if template_path == "main/settings.py.j2":
+                raise RuntimeError("boom")
+            return ""
+
+        monkeypatch.setattr(djsuite.renderer, "render_template", broken_render)
+        with pytest.raises(RuntimeError, match="boom"):
+            generate(context, str(tmp_path))
+        assert not (tmp_path / "testproject").exists()
+
 
 class TestDryRun:
     def test_shows_file_list(self, tmp_path, context, capsys):
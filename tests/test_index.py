@@ -0,0 +1,106 @@
+"""Tests for the index module."""
+
+import json
+import os
+
+import pytest
+
+from djsuite.diff import diff_summary
+from djsuite.generator import generate
+from djsuite.index import MISSING, MODIFIED, UNTOUCHED, classify, content_hash, current_hash, load_index
+from djsuite.manifest import UpdateGroup
+from djsuite.updater import run_update
+
+
+@pytest.fixture
+def context():
+    return {
+        "project_name": "testproject",
+        "python_version": "3.12",
+        "django_version": "5.2",
+        "drf_version": "3.16",
+        "author": "Test Author",
+        "description": "A test project",
+        "platform": "aws-eb",
+    }
+
+
+@pytest.fixture
+def generated_project(tmp_path, context):
+    generate(context, str(tmp_path))
+    return tmp_path / "testproject"
+
+
+def _rewrite_keeping_stat(path, content):
+    """Replace a file's content without changing its size or mtime."""
+    st = path.stat()
+    path.write_text(content)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+
+class TestGeneratedIndex:
+    def test_every_file_indexed(self, generated_project):
+        index = load_index(generated_project)
+        assert "Dockerfile" in index
+        assert "main/settings.py" in index
+        entry = index["Dockerfile"]
+        assert entry["sha256"] == content_hash((generated_project / "Dockerfile").read_text())
+        assert entry["size"] == (generated_project / "Dockerfile").stat().st_size
+
+    def test_index_not_part_of_context(self, generated_project, capsys):
+        assert run_update(str(generated_project), groups={UpdateGroup.CI}, no_backup=True) == 0
+        assert "up to date" in capsys.readouterr().out
+
+
+class TestClassify:
+    def test_untouched(self, generated_project):
+        index = load_index(generated_project)
+        assert classify(generated_project, "Dockerfile", index["Dockerfile"]) == UNTOUCHED
+
+    def test_modified(self, generated_project):
+        index = load_index(generated_project)
+        (generated_project / "Dockerfile").write_text("# mine\n")
+        assert classify(generated_project, "Dockerfile", index["Dockerfile"]) == MODIFIED
+
+    def test_missing(self, generated_project):
+        index = load_index(generated_project)
+        (generated_project / "Dockerfile").unlink()
+        assert classify(generated_project, "Dockerfile", index["Dockerfile"]) == MISSING
+
+    def test_unindexed_file_is_modified(self, generated_project):
+        assert classify(generated_project, "Dockerfile", None) == MODIFIED
+
+
+class TestStatFastPath:
+    def test_current_hash_trusts_matching_stat(self, generated_project):
+        path = generated_project / "Dockerfile"
+        entry = load_index(generated_project)["Dockerfile"]
+        _rewrite_keeping_stat(path, "x" * entry["size"])
+        assert current_hash(path, entry) == entry["sha256"]
+        assert current_hash(path) == content_hash("x" * entry["size"])
+
+    def test_diff_summary_skips_read_when_indexed(self, generated_project):
+        path = generated_project / "Dockerfile"
+        entry = load_index(generated_project)["Dockerfile"]
+        original = path.read_text()
+        _rewrite_keeping_stat(path, "x" * entry["size"])
+        assert diff_summary(generated_project, "Dockerfile", original, entry) == "[UNCHANGED]"
+        assert diff_summary(generated_project, "Dockerfile", original).startswith("[CHANGED]")
+
+
+class TestUpdateRefreshesIndex:
+    def test_written_files_reindexed(self, generated_project):
+        path = generated_project / "Dockerfile"
+        path.write_text("# old\n")
+        run_update(str(generated_project), groups={UpdateGroup.DOCKER}, no_backup=True)
+        entry = load_index(generated_project)["Dockerfile"]
+        assert entry["sha256"] == content_hash(path.read_text())
+        assert entry["mtime_ns"] == path.stat().st_mtime_ns
+
+    def test_legacy_config_gains_index(self, generated_project):
+        config_path = generated_project / ".djsuite.json"
+        config = json.loads(config_path.read_text())
+        del config["files"]
+        config_path.write_text(json.dumps(config))
+        run_update(str(generated_project), groups={UpdateGroup.CI}, no_backup=True)
+        assert ".github/workflows/ci.yml" in load_index(generated_project)
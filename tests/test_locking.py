@@ -0,0 +1,121 @@
+"""Tests for the locking module."""
+
+import io
+import os
+import sys
+import tarfile
+
+import pytest
+
+from djsuite.generator import generate, generate_archive
+from djsuite.locking import BackgroundLock, cached_lock, lock_key, store_lock
+from djsuite.renderer import render_template
+
+FAKE_PDM = """#!{python}
+import os, sys, time
+time.sleep({delay})
+if os.environ.get("FAKE_PDM_FAIL"):
+    sys.stderr.write("resolution impossible\\n")
+    sys.exit(1)
+with open("{calls}", "a") as f:
+    f.write("lock\\n")
+with open("pdm.lock", "w") as f:
+    f.write("# fake lock for " + open("pyproject.toml").read().splitlines()[1] + "\\n")
+"""
+
+
+@pytest.fixture
+def context():
+    return {
+        "project_name": "testproject",
+        "python_version": "3.12",
+        "django_version": "5.2",
+        "drf_version": "3.16",
+        "author": "Test Author",
+        "description": "A test project",
+        "platform": "aws-eb",
+    }
+
+
+@pytest.fixture
+def fake_pdm(tmp_path, monkeypatch):
+    """Put a fake `pdm` on PATH that records each call."""
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    calls = tmp_path / "pdm-calls.txt"
+    script = bin_dir / "pdm"
+    script.write_text(FAKE_PDM.format(python=sys.executable, delay=0, calls=calls))
+    script.chmod(0o755)
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+    return calls
+
+
+def _pyproject(context):
+    return render_template("common", "pyproject.toml.j2", context)
+
+
+class TestLockKey:
+    def test_ignores_name_author_and_description(self, context):
+        other = {**context, "project_name": "other", "author": "Someone", "description": "Else"}
+        if sys.version_info < (3, 11):
+            pytest.skip("tomllib is needed to key on the dependency tables")
+        assert lock_key(_pyproject(context), context) == lock_key(_pyproject(other), other)
+
+    def test_depends_on_versions(self, context):
+        newer = {**context, "django_version": "5.3"}
+        assert lock_key(_pyproject(context), context) != lock_key(_pyproject(newer), newer)
+        py313 = {**context, "python_version": "3.13"}
+        assert lock_key(_pyproject(context), context) != lock_key(_pyproject(py313), py313)
+
+    def test_store_and_lookup(self):
+        assert cached_lock("abc") is None
+        store_lock("abc", "lock")
+        assert cached_lock("abc") == "lock"
+
+
+class TestGenerateWithLock:
+    def test_lock_runs_and_is_cached(self, tmp_path, context, fake_pdm, capsys):
+        generate(context, str(tmp_path / "out"))
+        assert (tmp_path / "out" / "testproject" / "pdm.lock").exists()
+        assert "pdm.lock created" in capsys.readouterr().out
+        assert cached_lock(lock_key(_pyproject(context), context)) is not None
+        assert fake_pdm.read_text().count("lock") == 1
+
+    def test_cache_hit_skips_pdm(self, tmp_path, context, fake_pdm, capsys):
+        generate(context, str(tmp_path / "one"))
+        generate(context, str(tmp_path / "two"))
+        assert fake_pdm.read_text().count("lock") == 1
+        assert "restored from cache" in capsys.readouterr().out
+        lock = (tmp_path / "two" / "testproject" / "pdm.lock").read_text()
+        assert lock == (tmp_path / "one" / "testproject" / "pdm.lock").read_text()
+
+    def test_lock_failure_still_creates_project(self, tmp_path, context, fake_pdm, monkeypatch, capsys):
+        monkeypatch.setenv("FAKE_PDM_FAIL", "1")
+        assert generate(context, str(tmp_path / "out")) == 0
+        assert "resolution impossible" in capsys.readouterr().out
+        assert not (tmp_path / "out" / "testproject" / "pdm.lock").exists()
+        assert (tmp_path / "out" / "testproject" / "manage.py").exists()
+
+    def test_slow_lock_keeps_archive_on_stdout_clean(self, tmp_path, context, fake_pdm, monkeypatch, capsysbinary):
+        script = tmp_path / "bin" / "pdm"
+        script.write_text(FAKE_PDM.format(python=sys.executable, delay=0.5, calls=fake_pdm))
+        wait = BackgroundLock.wait
+        monkeypatch.setattr(BackgroundLock, "wait", lambda self, interval=5.0, out=None: wait(self, 0.1, out))
+
+        assert generate_archive(context, "-", fmt="tar") == 0
+        captured = capsysbinary.readouterr()
+        assert b"still locking" in captured.err
+        names = tarfile.open(fileobj=io.BytesIO(captured.out)).getnames()
+        assert "testproject/pdm.lock" in names
+
+    def test_offline_uses_preseeded_cache(self, tmp_path, context, monkeypatch):
+        monkeypatch.setenv("PATH", "")
+        store_lock(lock_key(_pyproject(context), context), "# seeded\n")
+        generate(context, str(tmp_path), offline=True)
+        assert (tmp_path / "testproject" / "pdm.lock").read_text() == "# seeded\n"
+
+    def test_offline_miss(self, tmp_path, context, fake_pdm, capsys):
+        generate(context, str(tmp_path / "out"), offline=True)
+        assert "offline" in capsys.readouterr().out
+        assert not fake_pdm.exists()
+        assert not (tmp_path / "out" / "testproject" / "pdm.lock").exists()
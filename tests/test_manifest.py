@@ -0,0 +1,67 @@
+"""Tests for the manifest module."""
+
+import pytest
+
+from djsuite.manifest import Manifest, Platform, UpdateGroup, all_output_paths, files_for_groups, get_manifest
+
+
+class TestManifest:
+    @pytest.fixture
+    def manifest(self):
+        return Manifest(
+            {
+                ("common", "b.txt.j2"): ("b.txt", UpdateGroup.ROOT),
+                ("common", "a.txt"): ("a.txt", UpdateGroup.ROOT),
+                ("platforms/x", "c.yml.j2"): (".ci/c.yml", UpdateGroup.CI),
+            }
+        )
+
+    def test_mapping_interface(self, manifest):
+        assert len(manifest) == 3
+        assert manifest[("common", "a.txt")] == ("a.txt", UpdateGroup.ROOT)
+        assert dict(manifest.items())[("platforms/x", "c.yml.j2")][1] is UpdateGroup.CI
+
+    def test_is_immutable(self, manifest):
+        with pytest.raises(TypeError):
+            manifest[("common", "d")] = ("d", UpdateGroup.ROOT)
+        with pytest.raises(AttributeError):
+            manifest.extra = 1
+
+    def test_indexes(self, manifest):
+        assert manifest.output_paths() == (".ci/c.yml", "a.txt", "b.txt")
+        assert manifest.key_for_output("b.txt") == ("common", "b.txt.j2")
+        assert manifest.key_for_output("missing") is None
+        assert manifest.jinja_keys() == (("platforms/x", "c.yml.j2"), ("common", "b.txt.j2"))
+        assert manifest.static_keys() == (("common", "a.txt"),)
+        assert manifest.keys_for_prefix("common") == (("common", "a.txt"), ("common", "b.txt.j2"))
+        assert manifest.keys_for_prefix("packs/missing") == ()
+        assert manifest.sorted_items()[1] == (("common", "a.txt"), ("a.txt", UpdateGroup.ROOT))
+        assert manifest.sorted_items() is manifest.sorted_items()
+        assert manifest.listing()[0] == ("platforms/x/c.yml.j2", ".ci/c.yml")
+
+    def test_for_groups_is_precomputed(self, manifest):
+        ci = manifest.for_groups({UpdateGroup.CI})
+        assert list(ci) == [("platforms/x", "c.yml.j2")]
+        assert manifest.for_groups([UpdateGroup.CI, UpdateGroup.DOCKER]) is ci
+        assert len(manifest.for_groups({UpdateGroup.CI, UpdateGroup.ROOT})) == 3
+        assert len(manifest.for_groups(set())) == 0
+        assert len(ci.for_groups({UpdateGroup.CI})) == 1
+
+    def test_duplicate_output_path(self):
+        with pytest.raises(ValueError, match="a.txt is generated by both"):
+            Manifest({("common", "a"): ("a.txt", UpdateGroup.ROOT), ("common", "b"): ("a.txt", UpdateGroup.ROOT)})
+
+
+class TestGetManifest:
+    def test_shared_instance(self):
+        assert get_manifest(Platform.AWS_EB) is get_manifest(Platform.AWS_EB)
+
+    def test_files_for_groups(self):
+        ci = files_for_groups({UpdateGroup.CI}, Platform.AWS_EB)
+        assert ".github/workflows/ci.yml" in ci.output_paths()
+        assert all(group is UpdateGroup.CI for _output, group in ci.values())
+
+    def test_all_output_paths_sorted(self):
+        paths = all_output_paths(Platform.AWS_EB)
+        assert paths == sorted(paths)
+        assert "main/settings.py" in paths
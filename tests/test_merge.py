@@ -0,0 +1,193 @@
+"""Tests for three-way merge updates and the snapshot store."""
+
+import json
+import time
+
+import pytest
+
+from djsuite.check import run_check
+from djsuite.fleet import run_fleet_update
+from djsuite.generator import generate
+from djsuite.index import content_hash, load_index
+from djsuite.manifest import UpdateGroup
+from djsuite.merge import merge2, merge3
+from djsuite.snapshots import SNAPSHOT_NAME, load_snapshot, prune_snapshots, store_snapshots
+from djsuite.updater import run_update
+
+BASE = "".join(f"line {n}\n" for n in range(1, 11))
+
+
+def _edit(text, old, new):
+    assert old in text
+    return text.replace(old, new, 1)
+
+
+class TestMerge3:
+    def test_takes_changes_from_both_sides(self):
+        current = _edit(BASE, "line 2\n", "line 2 (mine)\n")
+        template = _edit(BASE, "line 9\n", "line 9 (new)\n")
+        merged, conflicts = merge3(BASE, current, template)
+        assert conflicts == 0
+        assert merged == _edit(current, "line 9\n", "line 9 (new)\n")
+
+    def test_identical_changes_merge_cleanly(self):
+        both = _edit(BASE, "line 5\n", "line 5 changed\n")
+        assert merge3(BASE, both, both) == (both, 0)
+
+    def test_insertions_and_deletions(self):
+        current = _edit(BASE, "line 3\n", "")
+        template = _edit(BASE, "line 7\n", "line 7\nline 7.5\n")
+        merged, conflicts = merge3(BASE, current, template)
+        assert conflicts == 0
+        assert "line 3\n" not in merged
+        assert "line 7\nline 7.5\nline 8\n" in merged
+
+    def test_overlapping_changes_conflict(self):
+        current = _edit(BASE, "line 4\n", "line 4 (mine)\n")
+        template = _edit(BASE, "line 4\n", "line 4 (new)\n")
+        merged, conflicts = merge3(BASE, current, template)
+        assert conflicts == 1
+        assert "line 3\n<<<<<<< current\nline 4 (mine)\n=======\nline 4 (new)\n>>>>>>> template\nline 5\n" in merged
+
+    def test_missing_final_newline_before_marker(self):
+        merged, conflicts = merge3("a\nb", "a\nmine", "a\nnew")
+        assert conflicts == 1
+        assert merged == "a\n<<<<<<< current\nmine\n=======\nnew\n>>>>>>> template\n"
+
+    def test_large_file_is_fast(self):
+        base = "".join(f"setting_{n} = {n % 7}\n" for n in range(100_000))
+        current = _edit(base, "setting_10 = 3\n", "setting_10 = 'custom'\n")
+        template = _edit(base, "setting_99990 = 2\n", "setting_99990 = 'new'\n")
+        start = time.perf_counter()
+        merged, conflicts = merge3(base, current, template)
+        assert time.perf_counter() - start < 2
+        assert conflicts == 0
+        assert "setting_10 = 'custom'\n" in merged and "setting_99990 = 'new'\n" in merged
+
+
+class TestMerge2:
+    def test_marks_each_difference(self):
+        merged, conflicts = merge2("a\nmine\nb\nc\n", "a\ntheirs\nb\nc\nd\n")
+        assert conflicts == 2
+        assert merged == (
+            "a\n<<<<<<< current\nmine\n=======\ntheirs\n>>>>>>> template\nb\nc\n<<<<<<< current\n=======\nd\n>>>>>>> template\n"
+        )
+
+    def test_identical_has_no_conflicts(self):
+        assert merge2("a\nb\n", "a\nb\n") == ("a\nb\n", 0)
+
+
+@pytest.fixture
+def context():
+    return {
+        "project_name": "testproject",
+        "python_version": "3.12",
+        "django_version": "5.2",
+        "drf_version": "3.16",
+        "author": "Test Author",
+        "description": "A test project",
+        "platform": "aws-eb",
+    }
+
+
+@pytest.fixture
+def project(tmp_path, context):
+    generate(context, str(tmp_path), offline=True)
+    return tmp_path / "testproject"
+
+
+def _retemplate(project, output_path, old, new):
+    """Pretend the template changed since generation by rewriting the stored base."""
+    index = load_index(project)
+    rendered = (project / output_path).read_text()
+    assert load_snapshot(project, index[output_path]["sha256"]) == rendered
+    old_base = _edit(rendered, old, new)
+    store_snapshots(project, [old_base])
+    digest = content_hash(old_base)
+    config = json.loads((project / ".djsuite.json").read_text())
+    config["files"][output_path]["sha256"] = digest
+    (project / ".djsuite.json").write_text(json.dumps(config))
+    return rendered
+
+
+class TestSnapshots:
+    def test_generate_stores_every_base(self, project):
+        index = load_index(project)
+        for output_path, entry in index.items():
+            assert load_snapshot(project, entry["sha256"]) == (project / output_path).read_text()
+
+    def test_prune_drops_unreferenced(self, project):
+        index = load_index(project)
+        dockerfile = index.pop("Dockerfile")
+        prune_snapshots(project, index)
+        assert load_snapshot(project, dockerfile["sha256"]) is None
+        assert all(load_snapshot(project, entry["sha256"]) is not None for entry in index.values())
+
+    def test_store_is_one_reproducible_zip(self, project, tmp_path, context):
+        generate(context, str(tmp_path / "again"), offline=True)
+        assert (project / SNAPSHOT_NAME).read_bytes() == (tmp_path / "again" / "testproject" / SNAPSHOT_NAME).read_bytes()
+        assert store_snapshots(project, [(project / "Dockerfile").read_text()]) == 0
+
+
+class TestMergeUpdate:
+    def test_merges_template_change_into_edited_file(self, project, capsys):
+        dockerfile = project / "Dockerfile"
+        rendered = _retemplate(project, "Dockerfile", "FROM", "FROM-OLD")
+        dockerfile.write_text(rendered.replace("FROM", "FROM-OLD", 1) + "# custom step\n")
+
+        assert run_update(str(project), {UpdateGroup.DOCKER}, no_backup=True, merge=True) == 0
+        assert "[MERGED]" in capsys.readouterr().out
+        assert dockerfile.read_text() == rendered + "# custom step\n"
+
+        entry = load_index(project)["Dockerfile"]
+        assert entry["sha256"] == content_hash(rendered + "# custom step\n")
+        assert entry["base"] == content_hash(rendered)
+        assert run_check([str(project)], {UpdateGroup.DOCKER}) == 0
+
+    def test_keeps_user_edit_when_template_unchanged(self, project, capsys):
+        dockerfile = project / "Dockerfile"
+        dockerfile.write_text(dockerfile.read_text() + "# custom\n")
+        assert run_update(str(project), {UpdateGroup.DOCKER}, no_backup=True, merge=True) == 0
+        assert "[KEPT]" in capsys.readouterr().out
+        assert dockerfile.read_text().endswith("# custom\n")
+
+    def test_conflict_markers_and_exit_status(self, project, capsys):
+        dockerfile = project / "Dockerfile"
+        rendered = _retemplate(project, "Dockerfile", "FROM", "FROM-OLD")
+        dockerfile.write_text(rendered.replace("FROM", "FROM-MINE", 1))
+
+        assert run_update(str(project), {UpdateGroup.DOCKER}, no_backup=True, merge=True) == 1
+        out = capsys.readouterr().out
+        assert "[CONFLICT] (1 region(s))" in out
+        assert "<<<<<<< current" in dockerfile.read_text()
+
+    def test_edited_file_without_base_conflicts(self, project, capsys):
+        # Projects generated before snapshots have no index to tell what djsuite wrote.
+        config = json.loads((project / ".djsuite.json").read_text())
+        del config["files"]
+        (project / ".djsuite.json").write_text(json.dumps(config))
+        (project / SNAPSHOT_NAME).unlink()
+        dockerfile = project / "Dockerfile"
+        rendered = dockerfile.read_text()
+        dockerfile.write_text(rendered + "# custom\n")
+
+        assert run_update(str(project), {UpdateGroup.DOCKER}, no_backup=True, merge=True) == 1
+        assert "[CONFLICT] (1 region(s))" in capsys.readouterr().out
+        merged = dockerfile.read_text()
+        assert merged.startswith(rendered)
+        assert merged.endswith("<<<<<<< current\n# custom\n=======\n>>>>>>> template\n")
+
+    def test_without_merge_overwrites(self, project):
+        dockerfile = project / "Dockerfile"
+        rendered = dockerfile.read_text()
+        dockerfile.write_text(rendered + "# custom\n")
+        assert run_update(str(project), {UpdateGroup.DOCKER}, no_backup=True) == 0
+        assert dockerfile.read_text() == rendered
+
+    def test_fleet_merge(self, project, capsys):
+        dockerfile = project / "Dockerfile"
+        dockerfile.write_text(dockerfile.read_text() + "# custom\n")
+        assert run_fleet_update([str(project)], {UpdateGroup.DOCKER}, no_backup=True, as_json=True, merge=True) == 0
+        report = json.loads(capsys.readouterr().out)["projects"][0]
+        assert report["kept"] == 1
+        assert dockerfile.read_text().endswith("# custom\n")
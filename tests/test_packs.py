@@ -0,0 +1,108 @@
+"""Tests for the packs module."""
+
+import json
+from importlib.metadata import EntryPoint
+
+import pytest
+
+from djsuite import packs, renderer
+from djsuite.cli import main
+from djsuite.manifest import Platform, get_manifest
+from djsuite.packs import ENTRY_POINT_GROUP, load_pack
+
+PACK_MODULE = """
+from pathlib import Path
+
+from djsuite.manifest import UpdateGroup
+from djsuite.packs import TemplatePack
+
+pack = TemplatePack(
+    "ignored",
+    Path(__file__).parent / "templates",
+    {
+        "sentry.py.j2": ("main/sentry.py", UpdateGroup.ROOT),
+        "sentry.txt": ("docs/sentry.txt", UpdateGroup.ROOT),
+    },
+)
+gcp_only = lambda: TemplatePack("gcp_only", pack.templates, {}, platforms=["gcp"])
+"""
+
+
+@pytest.fixture
+def fresh_caches():
+    def clear():
+        load_pack.cache_clear()
+        get_manifest.cache_clear()
+        renderer.get_environment.cache_clear()
+
+    clear()
+    yield
+    clear()
+
+
+@pytest.fixture
+def fake_pack(tmp_path, monkeypatch, fresh_caches):
+    """Install a 'fake' template pack module and entry point."""
+    package = tmp_path / "site" / "fakepack"
+    (package / "templates").mkdir(parents=True)
+    (package / "__init__.py").write_text(PACK_MODULE)
+    (package / "templates" / "sentry.py.j2").write_text('SENTRY_PROJECT = "{{ project_name }}"\n')
+    (package / "templates" / "sentry.txt").write_text("static {{ not rendered }}\n")
+    monkeypatch.syspath_prepend(str(tmp_path / "site"))
+    entry_points = [
+        EntryPoint("fake", "fakepack:pack", ENTRY_POINT_GROUP),
+        EntryPoint("other_platform", "fakepack:gcp_only", ENTRY_POINT_GROUP),
+    ]
+    monkeypatch.setattr(packs, "_entry_points", lambda: entry_points)
+
+
+class TestLoadPack:
+    def test_entry_points_untouched_without_packs(self, monkeypatch, fresh_caches):
+        def fail():
+            raise AssertionError("entry points scanned")
+
+        monkeypatch.setattr(packs, "_entry_points", fail)
+        assert get_manifest(Platform.AWS_EB)
+        assert main(["--list-files"]) == 0
+
+    def test_loads_and_renames(self, fake_pack):
+        pack = load_pack("fake")
+        assert pack.name == "fake"
+        assert pack.dir_prefix == "packs/fake"
+
+    def test_callable_entry_point(self, fake_pack):
+        assert load_pack("other_platform").platforms == ("gcp",)
+
+    def test_unknown_pack(self, fake_pack):
+        with pytest.raises(ValueError, match="installed: fake, other_platform"):
+            load_pack("nope")
+
+    def test_manifest_includes_pack(self, fake_pack):
+        manifest = get_manifest(Platform.AWS_EB, ("fake",))
+        assert manifest.key_for_output("main/sentry.py") == ("packs/fake", "sentry.py.j2")
+        assert len(manifest) == len(get_manifest(Platform.AWS_EB)) + 2
+
+    def test_unsupported_platform(self, fake_pack):
+        with pytest.raises(ValueError, match="does not support platform"):
+            get_manifest(Platform.AWS_EB, ("other_platform",))
+
+
+class TestPackCli:
+    def test_list_packs(self, fake_pack, capsys):
+        assert main(["--list-packs"]) == 0
+        assert "fake" in capsys.readouterr().out
+
+    def test_unknown_pack_is_an_error(self, fake_pack, capsys):
+        assert main(["--list-files", "--pack", "nope"]) == 1
+        assert "Unknown template pack" in capsys.readouterr().out
+
+    def test_generate_and_update_with_pack(self, fake_pack, tmp_path):
+        assert main(["testproject", "--output-dir", str(tmp_path), "--offline", "--pack", "fake"]) == 0
+        project = tmp_path / "testproject"
+        assert (project / "main/sentry.py").read_text() == 'SENTRY_PROJECT = "testproject"\n'
+        assert (project / "docs/sentry.txt").read_text() == "static {{ not rendered }}\n"
+        assert json.loads((project / ".djsuite.json").read_text())["packs"] == ["fake"]
+
+        (project / "main/sentry.py").write_text("edited\n")
+        assert main(["--update-all", "--project-dir", str(project), "--no-backup"]) == 0
+        assert (project / "main/sentry.py").read_text() == 'SENTRY_PROJECT = "testproject"\n'
@@ -0,0 +1,150 @@
+"""Tests for the pipeline and writer modules."""
+
+import os
+import stat
+import threading
+
+import pytest
+
+from djsuite.pipeline import ordered_map
+from djsuite.writer import Transaction, _umask, write_files
+
+
+class TestOrderedMap:
+    def test_preserves_input_order(self):
+        assert list(ordered_map(lambda x: x * 2, range(100), max_workers=4)) == [x * 2 for x in range(100)]
+
+    def test_consumes_input_lazily(self):
+        consumed = []
+
+        def source():
+            for i in range(100):
+                consumed.append(i)
+                yield i
+
+        results = ordered_map(lambda x: x, source(), max_workers=2)
+        assert next(results) == 0
+        assert len(consumed) <= 5
+        results.close()
+
+    def test_reraises_first_error_in_order(self):
+        def func(x):
+            if x in (3, 7):
+                raise ValueError(x)
+            return x
+
+        with pytest.raises(ValueError, match="3"):
+            list(ordered_map(func, range(10), max_workers=4))
+
+    def test_runs_concurrently(self):
+        barrier = threading.Barrier(2, timeout=5)
+        assert list(ordered_map(lambda x: barrier.wait() is not None, range(2), max_workers=2)) == [True, True]
+
+
+class TestWriteFiles:
+    def test_writes_files_in_order(self, tmp_path):
+        items = [("a/one.txt", "1"), ("a/b/two.txt", "2"), ("three.txt", "3")]
+        written = list(write_files(tmp_path, items))
+        assert written == ["a/one.txt", "a/b/two.txt", "three.txt"]
+        assert (tmp_path / "a" / "b" / "two.txt").read_text() == "2"
+
+    def test_sh_files_are_executable(self, tmp_path):
+        list(write_files(tmp_path, [("bin/run.sh", "#!/bin/sh\n"), ("bin/notes.txt", "")]))
+        assert (tmp_path / "bin" / "run.sh").stat().st_mode & stat.S_IXUSR
+        assert not (tmp_path / "bin" / "notes.txt").stat().st_mode & stat.S_IXUSR
+
+    def test_no_staging_left_behind(self, tmp_path):
+        list(write_files(tmp_path, [("a.txt", "1")]))
+        assert sorted(os.listdir(tmp_path)) == ["a.txt"]
+
+    def test_keeps_existing_mode(self, tmp_path):
+        (tmp_path / "secret.txt").write_text("old")
+        (tmp_path / "secret.txt").chmod(0o600)
+        list(write_files(tmp_path, [("secret.txt", "new")]))
+        assert stat.S_IMODE((tmp_path / "secret.txt").stat().st_mode) == 0o600
+        assert (tmp_path / "secret.txt").read_text() == "new"
+
+    def test_index_entries_match_committed_files(self, tmp_path):
+        index = {}
+        list(write_files(tmp_path, [("a/b.txt", "hello")], index=index))
+        st = (tmp_path / "a" / "b.txt").stat()
+        assert index["a/b.txt"]["size"] == st.st_size
+        assert index["a/b.txt"]["mtime_ns"] == st.st_mtime_ns
+
+
+class TestTransaction:
+    def test_new_project_appears_on_commit(self, tmp_path):
+        project = tmp_path / "proj"
+        with Transaction(project, new_project=True) as txn:
+            txn.write("x/y.txt", "data")
+            assert not project.exists()
+        assert (project / "x" / "y.txt").read_text() == "data"
+        assert os.listdir(tmp_path) == ["proj"]
+        assert stat.S_IMODE(project.stat().st_mode) == 0o777 & ~_umask()
+
+    def test_new_project_rolled_back_on_error(self, tmp_path):
+        project = tmp_path / "proj"
+        with pytest.raises(RuntimeError):
+            with Transaction(project, new_project=True) as txn:
+                txn.write("a.txt", "data")
+                raise RuntimeError("boom")
+        assert os.listdir(tmp_path) == []
+
+    def test_files_untouched_until_commit(self, tmp_path):
+        (tmp_path / "a.txt").write_text("old")
+        with pytest.raises(RuntimeError):
+            with Transaction(tmp_path) as txn:
+                txn.write("a.txt", "new")
+                txn.write("b.txt", "new")
+                raise RuntimeError("boom")
+        assert (tmp_path / "a.txt").read_text() == "old"
+        assert not (tmp_path / "b.txt").exists()
+        assert os.listdir(tmp_path) == ["a.txt"]
+
+    def test_failed_commit_rolls_back(self, tmp_path, monkeypatch):
+        (tmp_path / "a.txt").write_text("old a")
+        (tmp_path / "c.txt").write_text("old c")
+        real_replace = os.replace
+
+        def failing_replace(src, dst):
+            if str(dst).endswith("c.txt"):
+                raise OSError("disk full")
+            return real_replace(src, dst)
+
+        txn = Transaction(tmp_path)
+        for name in ("a.txt", "b/new.txt", "c.txt"):
+            txn.write(name, "new")
+        monkeypatch.setattr(os, "replace", failing_replace)
+        with pytest.raises(OSError, match="disk full"):
+            txn.commit()
+        monkeypatch.undo()
+
+        assert (tmp_path / "a.txt").read_text() == "old a"
+        assert (tmp_path / "c.txt").read_text() == "old c"
+        assert not (tmp_path / "b").exists()
+        assert sorted(os.listdir(tmp_path)) == ["a.txt", "c.txt"]
+
+    def test_fsyncs_once_per_directory(self, tmp_path, monkeypatch):
+        (tmp_path / "a.txt").write_text("old")
+        fsyncs = []
+        real_fsync = os.fsync
+        monkeypatch.setattr(os, "fsync", lambda fd: fsyncs.append(fd) or real_fsync(fd))
+        list(write_files(tmp_path, [("a.txt", "1"), ("b.txt", "2"), ("d/c.txt", "3"), ("d/e.txt", "4")]))
+        assert len(fsyncs) == 2  # tmp_path and d/
+
+    def test_new_files_are_not_linked_for_rollback(self, tmp_path, monkeypatch):
+        (tmp_path / "a.txt").write_text("old")
+        linked = []
+        real_link = os.link
+        monkeypatch.setattr(os, "link", lambda src, dst: linked.append(str(src)) or real_link(src, dst))
+        list(write_files(tmp_path, [("a.txt", "new"), ("b.txt", "new"), ("c/d.txt", "new")]))
+        assert linked == [str(tmp_path / "a.txt")]
+
+    def test_removes_staging_left_by_dead_process(self, tmp_path):
+        stale = tmp_path / ".djsuite-staging-999999999-abc"
+        (stale / "0").parent.mkdir()
+        (stale / "0").write_text("half")
+        live = tmp_path / f".djsuite-staging-{os.getppid()}-abc"
+        live.mkdir()
+        list(write_files(tmp_path, [("a.txt", "1")]))
+        assert sorted(os.listdir(tmp_path)) == [live.name, "a.txt"]
@@ -0,0 +1,61 @@
+"""Tests for the profiling module."""
+
+import json
+import pstats
+
+import pytest
+
+from djsuite import profiling
+from djsuite.cli import main
+from djsuite.profiling import RENDER, Profiler, profile, span
+
+
+@pytest.fixture
+def project(tmp_path):
+    main(["testproject", "--output-dir", str(tmp_path), "--offline"])
+    return tmp_path / "testproject"
+
+
+class TestSpan:
+    def test_noop_without_profiler(self):
+        assert profiling._profiler is None
+        with span("nothing"):
+            pass
+
+    def test_records_complete_events(self):
+        with profile(top=3) as profiler:
+            with span("phase one"):
+                with span("a.txt", RENDER, size=3):
+                    pass
+        names = [e["name"] for e in profiler.events]
+        assert names == ["a.txt", "phase one", "djsuite"]
+        assert profiler.events[0]["args"] == {"size": 3}
+        assert all(e["ph"] == "X" and e["dur"] >= 0 for e in profiler.events)
+        assert profiling._profiler is None
+
+    def test_slowest_and_totals(self):
+        profiler = Profiler()
+        profiler.add("slow", RENDER, 0.0, 0.5)
+        profiler.add("fast", RENDER, 0.0, 0.1)
+        profiler.add("fast", RENDER, 0.0, 0.1)
+        assert profiler.slowest(RENDER, 1) == [("slow", 0.5)]
+        assert profiler.totals(RENDER)[1] == ("fast", pytest.approx(0.2), 2)
+
+
+class TestProfileFlag:
+    def test_update_writes_trace(self, project, tmp_path, capsys):
+        (project / "Dockerfile").write_text("changed\n")
+        trace = tmp_path / "trace.json"
+        assert main(["--update-docker", "--project-dir", str(project), "--profile", str(trace), "--profile-top", "2"]) == 0
+        events = json.loads(trace.read_text())["traceEvents"]
+        phases = {e["name"] for e in events if e.get("cat") == "phase"}
+        assert {"diff", "backup", "write", "commit"} <= phases
+        assert any(e["cat"] == "diff" and e["name"] == "Dockerfile" for e in events if e["ph"] == "X")
+        err = capsys.readouterr().err
+        assert "Slowest renders:" in err
+        assert "Slowest diffs:" in err
+
+    def test_cprofile_dump(self, tmp_path, capsys):
+        stats_path = tmp_path / "out.prof"
+        assert main(["--list-files", "--cprofile", str(stats_path)]) == 0
+        assert pstats.Stats(str(stats_path)).total_calls > 0
@@ -0,0 +1,112 @@
+"""Tests for the render_cache module."""
+
+import jinja2
+import jinja2.meta
+import pytest
+
+from djsuite.render_cache import RenderCache
+from djsuite.renderer import get_environment, get_render_cache, render_template
+
+
+@pytest.fixture
+def sources():
+    return {
+        "page.j2": "{% include 'header.j2' %}Hello {{ name }}",
+        "header.j2": "== {{ name }} ==\n",
+        "plain.j2": "{{ name }}!",
+    }
+
+
+@pytest.fixture
+def cache(tmp_path, sources):
+    env = jinja2.Environment(loader=jinja2.DictLoader(sources))
+    return RenderCache(
+        tmp_path / "cache",
+        load_source=lambda name: sources[name],
+        find_dependencies=lambda source: jinja2.meta.find_referenced_templates(env.parse(source)),
+    )
+
+
+class Renderer:
+    """Counts real renders done against the live sources dict."""
+
+    def __init__(self, sources):
+        self.sources = sources
+        self.calls = 0
+
+    def __call__(self, name, context):
+        self.calls += 1
+        env = jinja2.Environment(loader=jinja2.DictLoader(self.sources))
+        return env.get_template(name).render(**context)
+
+
+def fresh(cache):
+    """A new cache instance over the same directory, as a new process would see it."""
+    return RenderCache(cache.directory, cache.load_source, cache.find_dependencies, cache.max_bytes)
+
+
+class TestRenderCache:
+    def test_hit_skips_render(self, cache, sources):
+        render = Renderer(sources)
+        first = cache.render("page.j2", {"name": "a"}, render)
+        assert fresh(cache).render("page.j2", {"name": "a"}, render) == first
+        assert render.calls == 1
+
+    def test_context_change_misses(self, cache, sources):
+        render = Renderer(sources)
+        cache.render("plain.j2", {"name": "a"}, render)
+        assert cache.render("plain.j2", {"name": "b"}, render) == "b!"
+        assert render.calls == 2
+
+    def test_source_change_misses(self, cache, sources):
+        render = Renderer(sources)
+        cache.render("plain.j2", {"name": "a"}, render)
+        sources["plain.j2"] = "{{ name }}?"
+        assert fresh(cache).render("plain.j2", {"name": "a"}, render) == "a?"
+
+    def test_dependency_change_invalidates_includer(self, cache, sources):
+        render = Renderer(sources)
+        cache.render("page.j2", {"name": "a"}, render)
+        cache.render("plain.j2", {"name": "a"}, render)
+        sources["header.j2"] = "** {{ name }} **\n"
+        assert fresh(cache).render("page.j2", {"name": "a"}, render) == "** a **Hello a"
+        fresh(cache).render("plain.j2", {"name": "a"}, render)
+        assert render.calls == 3
+
+    def test_dynamic_include_is_not_cached(self, cache, sources):
+        sources["dynamic.j2"] = "{% include name %}"
+        render = Renderer(sources)
+        cache.render("dynamic.j2", {"name": "plain.j2"}, render)
+        cache.render("dynamic.j2", {"name": "plain.j2"}, render)
+        assert render.calls == 2
+
+    def test_lru_eviction(self, cache, sources):
+        render = Renderer(sources)
+        cache.max_bytes = 25
+        for name in ("aaaaaaaaaa", "bbbbbbbbbb", "cccccccccc"):
+            cache.render("plain.j2", {"name": name}, render)
+        entries = list((cache.directory / "entries").glob("*/*"))
+        assert sum(p.stat().st_size for p in entries) <= 25
+        assert len(entries) < 3
+
+
+class TestRendererIntegration:
+    @pytest.fixture(autouse=True)
+    def enable_cache(self, monkeypatch, tmp_path):
+        monkeypatch.setenv("DJSUITE_CACHE_DIR", str(tmp_path))
+        monkeypatch.setenv("DJSUITE_RENDER_CACHE", "1")
+        get_render_cache.cache_clear()
+        yield
+        get_render_cache.cache_clear()
+
+    def test_second_render_skips_jinja(self, monkeypatch):
+        context = {"project_name": "myapp"}
+        first = render_template("common", "main/celery.py.j2", context)
+        get_render_cache.cache_clear()
+
+        def no_jinja():
+            raise AssertionError("Jinja should not be used on a cache hit")
+
+        monkeypatch.setattr("djsuite.renderer.get_environment", no_jinja)
+        assert render_template("common", "main/celery.py.j2", context) == first
+        get_environment.cache_clear()
@@ -3,7 +3,7 @@
 import pytest
 
 from djsuite.manifest import Platform, get_manifest
-from djsuite.renderer import create_environment, render_all, render_template
+from djsuite.renderer import create_environment, get_environment, render_all, render_template
 
 
 @pytest.fixture
@@ -25,6 +25,29 @@ class TestCreateEnvironment:
         assert env is not None
 
 
+class TestGetEnvironment:
+    @pytest.fixture(autouse=True)
+    def fresh_environment(self):
+        get_environment.cache_clear()
+        yield
+        get_environment.cache_clear()
+
+    def test_environment_is_shared(self):
+        assert get_environment() is get_environment()
+
+    def test_bytecode_cache_disabled_by_default(self, monkeypatch):
+        monkeypatch.delenv("DJSUITE_BYTECODE_CACHE", raising=False)
+        assert get_environment().bytecode_cache is None
+
+    def test_bytecode_cache_written_per_version(self, monkeypatch, tmp_path, context):
+        from djsuite import __version__
+
+        monkeypatch.setenv("DJSUITE_CACHE_DIR", str(tmp_path))
+        monkeypatch.setenv("DJSUITE_BYTECODE_CACHE", "1")
+        render_template("common", "main/celery.py.j2", context)
+        assert list((tmp_path / "bytecode" / __version__).iterdir())
+
+
 class TestRenderTemplate:
     def test_static_template(self, context):
         content = render_template("common", "manage.py", context)
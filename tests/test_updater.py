@@ -47,6 +47,15 @@ class TestRunUpdate:
         content = ci_path.read_text()
         assert "testproject" in content
 
+    def test_show_diff(self, generated_project, capsys):
+        ci_path = generated_project / ".github" / "workflows" / "ci.yml"
+        ci_path.write_text("# modified\n")
+
+        run_update(str(generated_project), groups={UpdateGroup.CI}, no_backup=True, show_diff=True)
+        captured = capsys.readouterr()
+        assert "--- a/.github/workflows/ci.yml" in captured.out
+        assert "-# modified" in captured.out
+
     def test_update_unchanged_files(self, generated_project, capsys):
         result = run_update(
             str(generated_project),
@@ -164,3 +173,14 @@ class TestRunUpdate:
         assert result == 0
         content = ci_path.read_text()
         assert "testproject" in content
+
+    def test_keeps_asgi_server(self, tmp_path, context, capsys):
+        generate({**context, "server": "asgi"}, str(tmp_path))
+        project = tmp_path / "testproject"
+        gunicorn_conf = project / "gunicorn.conf.py"
+        rendered = gunicorn_conf.read_text()
+        gunicorn_conf.write_text("# modified\n")
+
+        assert run_update(str(project), groups={UpdateGroup.DOCKER}, no_backup=True) == 0
+        assert gunicorn_conf.read_text() == rendered
+        assert 'wsgi_app = "main.asgi:application"' in rendered
@@ -0,0 +1,115 @@
+"""Tests for the watch module."""
+
+import shutil
+import threading
+import time
+
+import jinja2
+import pytest
+
+from djsuite import renderer
+from djsuite.generator import generate
+from djsuite.manifest import Platform
+from djsuite.updater import _load_context
+from djsuite.watch import DependencyGraph, Watcher, snapshot, wait_for_changes
+
+
+@pytest.fixture
+def template_dir(tmp_path, monkeypatch):
+    """A writable copy of the shipped templates, used in place of them."""
+    copy = tmp_path / "templates"
+    shutil.copytree(renderer._get_template_dir(), copy)
+    monkeypatch.setattr(renderer, "_get_template_dir", lambda: copy)
+    return copy
+
+
+@pytest.fixture
+def project(tmp_path):
+    context = {
+        "project_name": "sample",
+        "python_version": "3.12",
+        "django_version": "5.2",
+        "drf_version": "3.16",
+        "author": "Test Author",
+        "description": "A test project",
+        "platform": "aws-eb",
+    }
+    generate(context, str(tmp_path / "out"), Platform.AWS_EB, offline=True)
+    return tmp_path / "out" / "sample"
+
+
+@pytest.fixture
+def watcher(project, template_dir):
+    return Watcher(str(project), *_load_context(project))
+
+
+class TestDependencyGraph:
+    def test_follows_references_transitively(self):
+        env = jinja2.Environment(
+            loader=jinja2.DictLoader(
+                {
+                    "page.j2": '{% extends "layout.j2" %}',
+                    "layout.j2": '{% include "partial.j2" %}',
+                    "partial.j2": "x",
+                    "other.j2": "y",
+                }
+            )
+        )
+        graph = DependencyGraph(env, ["page.j2", "other.j2"])
+        assert graph.reaches("page.j2", {"partial.j2"})
+        assert not graph.reaches("other.j2", {"partial.j2"})
+
+    def test_dynamic_include_reaches_everything(self):
+        env = jinja2.Environment(loader=jinja2.DictLoader({"dyn.j2": "{% include name %}"}))
+        assert DependencyGraph(env, ["dyn.j2"]).reaches("dyn.j2", {"anything.j2"})
+
+
+class TestWatcher:
+    def test_rewrites_only_the_changed_template_output(self, watcher, project, template_dir):
+        source = template_dir / "platforms/aws_eb/Dockerfile.j2"
+        source.write_text(source.read_text() + "# watched\n")
+        before = (project / "README.md").stat().st_mtime_ns
+
+        written, errors = watcher.sync({"platforms/aws_eb/Dockerfile.j2"})
+        assert written == ["Dockerfile"]
+        assert errors == {}
+        assert (project / "Dockerfile").read_text().endswith("# watched\n")
+        assert (project / "README.md").stat().st_mtime_ns == before
+
+    def test_new_include_is_followed(self, watcher, project, template_dir):
+        (template_dir / "common/_footer.j2").write_text("# footer {{ project_name }}\n")
+        readme = template_dir / "common/README.md.j2"
+        readme.write_text(readme.read_text() + '{% include "common/_footer.j2" %}')
+        assert watcher.sync({"common/README.md.j2"})[0] == ["README.md"]
+
+        (template_dir / "common/_footer.j2").write_text("# new footer\n")
+        assert watcher.sync({"common/_footer.j2"})[0] == ["README.md"]
+        assert (project / "README.md").read_text().endswith("# new footer\n")
+
+    def test_unchanged_output_is_not_written(self, watcher):
+        assert watcher.sync({"platforms/aws_eb/Dockerfile.j2"}) == ([], {})
+
+    def test_template_error_is_reported(self, watcher, template_dir):
+        (template_dir / "platforms/aws_eb/Dockerfile.j2").write_text("{% if %}\n")
+        written, errors = watcher.sync({"platforms/aws_eb/Dockerfile.j2"})
+        assert written == []
+        assert "TemplateSyntaxError" in errors["Dockerfile"]
+
+
+class TestWaitForChanges:
+    def test_debounces_a_burst(self, tmp_path):
+        (tmp_path / "a.j2").write_text("a")
+        state = snapshot(tmp_path)
+
+        def edit():
+            time.sleep(0.05)
+            (tmp_path / "a.j2").write_text("aa")
+            time.sleep(0.02)
+            (tmp_path / "b.j2").write_text("b")
+
+        thread = threading.Thread(target=edit)
+        thread.start()
+        changed, state = wait_for_changes(tmp_path, state, interval=0.01, debounce=0.1)
+        thread.join()
+        assert changed == {"a.j2", "b.j2"}
+        assert state == snapshot(tmp_path)